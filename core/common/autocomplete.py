@@ -0,0 +1,56 @@
+"""
+Typeahead lookups: `(subid, label)` pairs for the rows whose fields start
+with what was typed, read through a values() projection.
+
+Each field is matched on its own, `field LIKE 'prefix%' ORDER BY field
+LIMIT n`, which a B-tree index on the field answers as one short range
+scan however big the table is; an OR across the fields would not. With
+MySQL's case-insensitive collations istartswith compiles to a plain LIKE,
+so the index on the column is used as is.
+"""
+
+from __future__ import annotations
+
+__all__ = (
+    "DEFAULT_LIMIT",
+    "MAX_LIMIT",
+    "LABEL_SEPARATOR",
+    "prefix_matches",
+)
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+LABEL_SEPARATOR = " - "
+
+
+def prefix_matches(queryset, fields, prefix: str, limit: int = DEFAULT_LIMIT, label_fields=None) -> list[dict]:
+    """
+    Up to `limit` rows of `queryset` with a `fields` value starting with
+    `prefix`, rows matching an earlier field first. The label joins the
+    non-empty `label_fields` (`fields` by default).
+
+    An empty prefix lists the first rows by the first field.
+    """
+    label_fields = tuple(label_fields or fields)
+    queryset = queryset.prefetch_related(None)
+
+    results = {}
+    for field in fields if prefix else fields[:1]:
+        matches = queryset.order_by(field, "pk")
+        if prefix:
+            matches = matches.filter(**{f"{field}__istartswith": prefix})
+        if results:
+            matches = matches.exclude(pk__in=list(results))
+
+        for row in matches.values("pk", "subid", *label_fields)[: limit - len(results)]:
+            results[row["pk"]] = {
+                "subid": row["subid"],
+                "label": LABEL_SEPARATOR.join(
+                    str(row[name]) for name in label_fields if row[name] not in (None, "")
+                ),
+            }
+        if len(results) >= limit:
+            break
+
+    return list(results.values())
@@ -0,0 +1,220 @@
+"""
+ETag / Last-Modified validators for BaseViewSet list and retrieve.
+
+Validators are computed from cheap queries that run before serialization:
+the row's `updated` for a detail, `MAX(updated)` and `COUNT(*)` over the
+filtered queryset for a list. Related models the representation reads do
+not touch `updated`, so the ETag also folds in the response cache tag
+versions of every model the view depends on (see core.common.response_cache).
+
+Last-Modified is only trusted for If-Modified-Since on details whose
+representation comes from the row alone: a deleted row does not move
+MAX(updated), and a changed related row does not move `updated`.
+
+Both also move with the media URL signing period, so a 304 never keeps a
+client on media URLs that expired (see core.common.storage).
+
+Lists paged without an exact count (`?count=estimate|none`,
+`?pagination=cursor`) get no validators: the COUNT(*) they would need is
+the one those modes are there to skip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Max, Prefetch
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from core.common.paginations import COUNT_EXACT, CursorPagination, get_count_mode
+from core.common.response_cache import model_tag, tag_versions
+from core.common.storage import media_url_window
+from services.account.permission_cache import permissions_version
+
+__all__ = (
+    "Validators",
+    "queryset_tags",
+    "list_validators",
+    "object_validators",
+    "not_modified_response",
+    "apply_validators",
+)
+
+TIMESTAMP_FIELD = "updated"
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    # Whole seconds, the resolution of HTTP dates
+    last_modified: int | None
+    # Whether If-Modified-Since may answer 304 on its own.
+    trust_last_modified: bool = False
+
+
+def _has_timestamp(model) -> bool:
+    try:
+        model._meta.get_field(TIMESTAMP_FIELD)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def _walk(model, path, tags):
+    for name in path.split("__"):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return
+        if field.related_model is None:
+            return
+        model = field.related_model
+        tags.add(model_tag(model))
+
+
+def _select_related_paths(select_related, prefix=""):
+    for name, nested in select_related.items():
+        yield f"{prefix}{name}"
+        yield from _select_related_paths(nested, f"{prefix}{name}__")
+
+
+def queryset_tags(queryset) -> set[str]:
+    """
+    Tags of the queryset's model and of every model it joins or prefetches.
+    Models only read in annotations or serializer queries are not found;
+    views list those in `cache_tags`.
+    """
+    model = queryset.model
+    tags = {model_tag(model)}
+
+    select_related = queryset.query.select_related
+    if isinstance(select_related, dict):
+        for path in _select_related_paths(select_related):
+            _walk(model, path, tags)
+
+    for lookup in queryset._prefetch_related_lookups:
+        if isinstance(lookup, Prefetch):
+            if lookup.queryset is not None:
+                tags |= queryset_tags(lookup.queryset)
+            lookup = lookup.prefetch_through
+        _walk(model, lookup, tags)
+
+    return tags
+
+
+def _dependency_tags(view, queryset) -> set[str]:
+    return queryset_tags(queryset) | set(view.cache_tags or ())
+
+
+def _etag(view, request, parts, tags) -> str:
+    versions = tag_versions(sorted(tags))
+    material = "|".join(
+        str(part)
+        for part in (
+            type(view).__module__,
+            type(view).__qualname__,
+            view.action,
+            request.user.pk,
+            permissions_version(),
+            media_url_window(),
+            request.get_full_path(),
+            *parts,
+            *(versions[tag] for tag in sorted(tags)),
+        )
+    )
+    # Weak: equal data, not byte-identical bodies (renderers, compression).
+    return f'W/"{hashlib.sha1(material.encode()).hexdigest()}"'
+
+
+def _last_modified(updated) -> int | None:
+    if updated is None:
+        return None
+    # Not before the signing period began: see the module docstring.
+    return max(int(updated.timestamp()), media_url_window() * settings.MEDIA_URL_MAX_AGE)
+
+
+def _counts_exactly(view, request) -> bool:
+    paginator = view.paginator
+    if paginator is None:
+        return True
+    if isinstance(paginator, CursorPagination):
+        return False
+    return get_count_mode(request, COUNT_EXACT) == COUNT_EXACT
+
+
+def list_validators(view, request, queryset=None) -> Validators | None:
+    """
+    Validators of a list, from the filtered `queryset` the view is about to
+    page. None when the list is paged without an exact count.
+    """
+    if not _counts_exactly(view, request):
+        return None
+
+    if queryset is None:
+        queryset = view.filter_queryset(view.get_queryset())
+    if not _has_timestamp(queryset.model):
+        return None
+
+    stats = queryset.order_by().aggregate(latest=Max(TIMESTAMP_FIELD), total=Count("pk"))
+    latest = stats["latest"]
+    return Validators(
+        etag=_etag(view, request, (latest, stats["total"]), _dependency_tags(view, queryset)),
+        last_modified=_last_modified(latest),
+    )
+
+
+def object_validators(view, request) -> Validators | None:
+    """
+    Validators of the object a detail route points at, read with a single
+    column query. None when it does not exist, so the view can 404 as usual.
+    """
+    queryset = view.filter_queryset(view.get_queryset())
+    if not _has_timestamp(queryset.model):
+        return None
+
+    lookup_url_kwarg = view.lookup_url_kwarg or view.lookup_field
+    lookup = {view.lookup_field: view.kwargs[lookup_url_kwarg]}
+    rows = list(queryset.filter(**lookup).order_by().values_list("pk", TIMESTAMP_FIELD)[:2])
+    if len(rows) != 1:
+        return None
+
+    pk, updated = rows[0]
+    tags = _dependency_tags(view, queryset)
+    return Validators(
+        etag=_etag(view, request, (pk, updated), tags),
+        last_modified=_last_modified(updated),
+        trust_last_modified=tags == {model_tag(queryset.model)},
+    )
+
+
+def not_modified_response(request, validators: Validators | None):
+    """
+    A 304 (or 412) response when the request's preconditions say the client
+    copy is current, else None.
+    """
+    if validators is None:
+        return None
+
+    last_modified = validators.last_modified if validators.trust_last_modified else None
+    response = get_conditional_response(
+        request, etag=validators.etag, last_modified=last_modified
+    )
+    if response is not None:
+        apply_validators(response, validators)
+    return response
+
+
+def apply_validators(response, validators: Validators | None):
+    if validators is None:
+        return response
+
+    response["ETag"] = validators.etag
+    if validators.last_modified is not None:
+        response["Last-Modified"] = http_date(validators.last_modified)
+    # Let clients keep the body, but always check back with the validators.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "THUMBNAIL_BUCKETS",
+    "derivative_path",
+    "ensure_derivative",
+    "pdf_derivative",
+    "thumbnail_url",
+)
+
+
+# Longest edge in pixels. Derivatives are never upscaled.
+THUMBNAIL_BUCKETS = {
+    "sm": 160,
+    "md": 480,
+    "lg": 1024,
+}
+
+# Derivatives live in a sibling folder of their original:
+# designs/front.png -> designs/thumbs/front.png.md.webp
+THUMBNAIL_DIR = "thumbs"
+
+_SAVE_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 85, "optimize": True},
+    "png": {"format": "PNG", "optimize": True},
+}
+
+
+def derivative_path(path: str, bucket: str, fmt: str) -> str:
+    directory, filename = os.path.split(path)
+    return os.path.join(directory, THUMBNAIL_DIR, f"{filename}.{bucket}.{fmt}")
+
+
+def _has_alpha(image: Image.Image) -> bool:
+    return image.mode in ("RGBA", "LA", "PA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+
+
+def _render(path: str, target: str, bucket: str, fmt: str):
+    with Image.open(path) as source:
+        image = ImageOps.exif_transpose(source)
+        image.thumbnail((THUMBNAIL_BUCKETS[bucket],) * 2, Image.LANCZOS)
+
+    if fmt == "jpeg":
+        if _has_alpha(image):
+            # JPEG has no alpha: flatten onto white, like the page behind it.
+            background = Image.new("RGB", image.size, "white")
+            background.paste(image, mask=image.convert("RGBA").getchannel("A"))
+            image = background
+        else:
+            image = image.convert("RGB")
+    elif image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if _has_alpha(image) else "RGB")
+
+    directory = os.path.dirname(target)
+    os.makedirs(directory, exist_ok=True)
+
+    # Write to a temp file first so concurrent readers never see half an image.
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            image.save(f, **_SAVE_OPTIONS[fmt])
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, target)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def ensure_derivative(path: str | None, bucket: str = "md", fmt: str = "webp") -> str | None:
+    """
+    Returns the path of the `bucket`/`fmt` derivative of the image at
+    `path`, rendering it on first use or when the original is newer.
+
+    Returns None when the original is missing or is not a readable image.
+    """
+    if not path:
+        return None
+
+    target = derivative_path(path, bucket, fmt)
+    try:
+        original_mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    try:
+        if os.path.getmtime(target) >= original_mtime:
+            return target
+    except OSError:
+        pass
+
+    try:
+        _render(path, target, bucket, fmt)
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError, ValueError):
+        logger.warning("Could not render %s derivative of %s", bucket, path, exc_info=True)
+        return None
+    return target
+
+
+def pdf_derivative(path: str | None, bucket: str = "md") -> str | None:
+    """
+    Derivative for embedding in a PDF. JPEG is embedded as-is by ReportLab,
+    so photos stay small; images with transparency keep it as PNG.
+    """
+    if not path:
+        return None
+
+    try:
+        with Image.open(path) as image:
+            fmt = "png" if _has_alpha(image) else "jpeg"
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        return None
+    return ensure_derivative(path, bucket, fmt)
+
+
+def thumbnail_url(file, bucket: str = "md", fmt: str = "webp") -> str | None:
+    """
+    URL of a derivative of a FieldFile (ImageField/FileField value) kept in
+    the local media storage, or None when there is no usable image.
+    """
+    if not file or not file.name:
+        return None
+
+    try:
+        path = file.path
+    except NotImplementedError:
+        return None
+
+    if ensure_derivative(path, bucket, fmt) is None:
+        return None
+    return file.storage.url(derivative_path(file.name, bucket, fmt))
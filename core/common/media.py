@@ -0,0 +1,256 @@
+"""
+File delivery for media uploads, rendered PDFs and production packs.
+
+Django only checks access; with SENDFILE_BACKEND set, the bytes are sent by
+the front web server so a large design file never holds a worker. For nginx,
+alias every root under SENDFILE_NGINX_PREFIX as an internal location:
+
+    location /protected/media/ { internal; alias /srv/app/media/; }
+    location /protected/pdf/ { internal; alias /srv/app/cache/pdf/; }
+    location /protected/production-packs/ { internal; alias /srv/app/cache/production-packs/; }
+
+and stop serving MEDIA_ROOT publicly.
+
+Media URLs from the storages carry a short-lived `?sig=` (see
+core.common.storage), which browsers can send from <img src> and plain
+links; without one, the Authorization header and the owning module are
+checked.
+"""
+
+from __future__ import annotations
+
+import logging
+import mimetypes
+import os
+import posixpath
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import content_disposition_header, http_date
+from django.utils.module_loading import import_string
+from django.views.static import was_modified_since
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+
+from core.common.permissions import HasModulePermission
+from core.common.storage import MEDIA_SIGNATURE_PARAM, check_media_signature
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "IMMUTABLE_CACHE_CONTROL",
+    "REVALIDATE_CACHE_CONTROL",
+    "send_file",
+    "ProtectedMediaView",
+)
+
+
+# Content-addressed names (core.common.storage) never change content.
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+_HASHED_NAME_RE = re.compile(r"(^|/)[0-9a-f]{64}\.[^/]+$")
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Top-level upload folder -> viewsets owning it. A user needs the module of
+# at least one of them; folders not listed only need a login.
+MEDIA_OWNERS = {
+    "designs": ("services.order.rest.order_form.views.OrderFormViewSet",),
+    "preview_prints": ("services.order.rest.order_form.views.OrderFormViewSet",),
+    "logos": ("services.order.rest.order_form.views.OrderFormViewSet",),
+    "products": ("services.product.rest.product.views.ProductViewSet",),
+    "qc_defects": (
+        "services.verification.rest.qc_press_verification.views.QCPressVerificationViewSet",
+        "services.verification.rest.qc_line_verification.views.QCLineVerificationViewSet",
+    ),
+    "qc_cutting_defects": (
+        "services.verification.rest.qc_cutting_verification.views.QCCuttingVerificationViewSet",
+    ),
+    "complaints": ("services.ticket.rest.complaint.views.ComplaintTicketViewSet",),
+}
+
+
+def _sendfile_roots() -> dict[str, str]:
+    return {
+        "media": settings.MEDIA_ROOT,
+        "pdf": getattr(settings, "PDF_CACHE_ROOT", None),
+        "production-packs": getattr(settings, "PRODUCTION_PACK_ROOT", None),
+    }
+
+
+def _accel_redirect(path: str) -> str | None:
+    """Internal nginx URI of `path`, or None when it is outside every root."""
+    path = os.path.realpath(path)
+    for alias, root in _sendfile_roots().items():
+        if not root:
+            continue
+        root = os.path.realpath(root)
+        if path.startswith(root + os.sep):
+            relative = os.path.relpath(path, root).replace(os.sep, "/")
+            prefix = settings.SENDFILE_NGINX_PREFIX.rstrip("/")
+            return quote(f"{prefix}/{alias}/{relative}")
+    return None
+
+
+def _byte_range(request, size: int, last_modified: str) -> tuple[int, int] | None:
+    """
+    The single byte range requested, as inclusive (start, end); None for the
+    whole file. Raises ValueError when the range cannot be satisfied.
+    """
+    header = request.headers.get("Range")
+    if not header:
+        return None
+
+    # A stale If-Range means the client's partial copy is outdated.
+    if_range = request.headers.get("If-Range")
+    if if_range and if_range != last_modified:
+        return None
+
+    # Multiple ranges are allowed to be answered with the whole file.
+    match = _RANGE_RE.match(header.strip())
+    if not match or not any(match.groups()):
+        return None
+
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        start, end = max(size - int(last), 0), size - 1
+
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+class _RangeFile:
+    """Reads at most `length` bytes of `file` from its current position."""
+
+    def __init__(self, file, length: int):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def send_file(
+    request,
+    path: str,
+    *,
+    content_type: str | None = None,
+    filename: str | None = None,
+    as_attachment: bool = False,
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+):
+    """
+    Response for the file at `path`: an X-Accel-Redirect/X-Sendfile for the
+    front web server when SENDFILE_BACKEND is set, otherwise a FileResponse
+    that honours byte ranges. Raises FileNotFoundError when it is missing.
+    """
+    stat = os.stat(path)
+    last_modified = http_date(stat.st_mtime)
+
+    if not was_modified_since(request.headers.get("If-Modified-Since"), stat.st_mtime):
+        response = HttpResponseNotModified()
+        response["Last-Modified"] = last_modified
+        response["Cache-Control"] = cache_control
+        return response
+
+    if content_type is None:
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+    backend = getattr(settings, "SENDFILE_BACKEND", "")
+    redirect = _accel_redirect(path) if backend == "nginx" else None
+
+    if redirect:
+        # 🚀 nginx streams the file and handles Range itself
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = redirect
+    elif backend == "apache":
+        response = HttpResponse(content_type=content_type)
+        response["X-Sendfile"] = os.path.realpath(path)
+    else:
+        try:
+            byte_range = _byte_range(request, stat.st_size, last_modified)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{stat.st_size}"
+            return response
+
+        file = open(path, "rb")
+        if byte_range is None:
+            response = FileResponse(file, content_type=content_type)
+            response["Content-Length"] = stat.st_size
+        else:
+            start, end = byte_range
+            file.seek(start)
+            response = FileResponse(
+                _RangeFile(file, end - start + 1), status=206, content_type=content_type
+            )
+            response["Content-Length"] = end - start + 1
+            response["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+        response["Accept-Ranges"] = "bytes"
+
+    response["Last-Modified"] = last_modified
+    response["Cache-Control"] = cache_control
+    response["Content-Disposition"] = content_disposition_header(
+        as_attachment, filename or os.path.basename(path)
+    )
+    return response
+
+
+class ProtectedMediaView(APIView):
+    """
+    Serves MEDIA_ROOT to holders of a signed URL, or to users holding the
+    module of the viewset that owns the upload folder (see MEDIA_OWNERS).
+    """
+
+    permission_classes = [IsAuthenticated]
+    swagger_schema = None
+
+    def _signed(self, request) -> bool:
+        return check_media_signature(
+            self.kwargs["path"], request.query_params.get(MEDIA_SIGNATURE_PARAM)
+        )
+
+    def check_permissions(self, request):
+        if not self._signed(request):
+            super().check_permissions(request)
+
+    def get(self, request, path):
+        name = posixpath.normpath(path).lstrip("/")
+        if name.startswith(".."):
+            raise Http404
+
+        owners = [import_string(owner) for owner in MEDIA_OWNERS.get(name.split("/")[0], ())]
+        if owners and not self._signed(request) and not any(
+            HasModulePermission().has_permission(request, owner) for owner in owners
+        ):
+            raise PermissionDenied(HasModulePermission.message)
+
+        full_path = safe_join(settings.MEDIA_ROOT, name)
+        if not os.path.isfile(full_path):
+            raise Http404
+
+        # Thumbnails of hashed files keep the hash: designs/ab/thumbs/ab...png.md.webp
+        cache_control = REVALIDATE_CACHE_CONTROL
+        if _HASHED_NAME_RE.search(name):
+            cache_control = IMMUTABLE_CACHE_CONTROL
+
+        try:
+            return send_file(request, full_path, cache_control=cache_control)
+        except FileNotFoundError:
+            raise Http404
+
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import connection, models
 from typing import Callable
 from django.utils.translation import gettext_lazy as _
 from .generators import default_subid_generator
@@ -73,4 +73,13 @@ def get_subid_model(
     )
     
 def default_class_getitem(cls, *args, **kwargs):
-    return cls
\ No newline at end of file
+    return cls
+
+def upsert_conflict_fields(*fields: str) -> list[str] | None:
+    """
+    `unique_fields` for bulk_create(update_conflicts=True). MySQL rejects
+    them and upserts on whichever unique key conflicts.
+    """
+    if connection.features.supports_update_conflicts_with_target:
+        return list(fields)
+    return None
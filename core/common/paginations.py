@@ -1,7 +1,76 @@
+import base64
+import binascii
+import datetime
+import json
 from collections import OrderedDict
+from decimal import Decimal
+from types import SimpleNamespace
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
 from rest_framework.pagination import PageNumberPagination as drf_PageNumberPagination
 from rest_framework.pagination import CursorPagination as drf_CursorPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+# ?count=exact|estimate|none
+COUNT_QUERY_PARAM = "count"
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+COUNT_NONE = "none"
+
+# "estimate" counts at most this many rows; past it the count is a floor.
+COUNT_ESTIMATE_CAP = 10000
+
+
+def get_count_mode(request, default):
+    mode = request.query_params.get(COUNT_QUERY_PARAM, default)
+    return mode if mode in (COUNT_EXACT, COUNT_ESTIMATE, COUNT_NONE) else default
+
+
+def count_queryset(queryset, mode):
+    """
+    Returns (count, is_exact). "estimate" stops counting at COUNT_ESTIMATE_CAP
+    rows, so it stays cheap on large tables; "none" skips the query.
+    """
+    if mode == COUNT_NONE:
+        return None, False
+    if mode == COUNT_ESTIMATE:
+        # Only the keys are counted; annotations used for display are dropped.
+        capped = queryset.order_by().values("pk")[: COUNT_ESTIMATE_CAP + 1].count()
+        return min(capped, COUNT_ESTIMATE_CAP), capped <= COUNT_ESTIMATE_CAP
+    return queryset.count(), True
+
+
+class _UncountedPage:
+    """The bits of a Django Page the paginator reads, without a COUNT(*)."""
+
+    def __init__(self, rows, number, has_next, count):
+        self.object_list = rows
+        self.number = number
+        self._has_next = has_next
+        self.paginator = SimpleNamespace(count=count)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self.number > 1
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
 
 
 class PageNumberPagination(drf_PageNumberPagination):
@@ -11,27 +80,213 @@ class PageNumberPagination(drf_PageNumberPagination):
     page_size_query_param = 'limit'
     max_page_size = 100
 
+    count_mode = COUNT_EXACT
+    count_exact = True
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_mode = get_count_mode(request, COUNT_EXACT)
+        if self.count_mode == COUNT_EXACT:
+            return super().paginate_queryset(queryset, request, view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        try:
+            number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            number = 0
+        if number < 1:
+            raise NotFound(self.invalid_page_message)
+
+        # One extra row tells whether there is a next page.
+        offset = (number - 1) * page_size
+        rows = list(queryset[offset : offset + page_size + 1])
+        if not rows and number > 1:
+            raise NotFound(self.invalid_page_message)
+
+        count, self.count_exact = count_queryset(queryset, self.count_mode)
+        self.page = _UncountedPage(rows[:page_size], number, len(rows) > page_size, count)
+        self.request = request
+        return list(self.page)
+
     def get_paginated_response(self, data):
-        return Response(OrderedDict([
+        fields = [
             ('count', self.page.paginator.count),
             ('next', self.get_next_link()),
             ('current', self.page.number),
             ('previous', self.get_previous_link()),
             ('limit', self.get_page_size(self.request)),
             ('results', data),
-        ]))
-        
+        ]
+        if self.count_mode != COUNT_EXACT:
+            fields.insert(1, ('count_exact', self.count_exact))
+        return Response(OrderedDict(fields))
+
+
+def _dump_value(value):
+    if isinstance(value, datetime.datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    return value
+
+
+def _load_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return parse_datetime(value["dt"])
+        if "d" in value:
+            return parse_date(value["d"])
+        if "n" in value:
+            return Decimal(value["n"])
+    return value
+
+
 class CursorPagination(drf_CursorPagination):
+    """
+    Keyset pagination: each page continues after the sort key of the last
+    row, so deep pages cost the same as the first and no COUNT(*) runs
+    unless ?count= asks for one.
+
+    Sorts on the view's ordering when every field is a non-null column,
+    else on ("-created", "-id"); the primary key always breaks ties.
+    """
+
     page_size = 10
     page_size_query_param = "limit"
     max_page_size = 100
     cursor_query_param = "cursor"
     ordering = ("-created", "-id")
 
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.count_mode = get_count_mode(request, COUNT_NONE)
+        self.count, self.count_exact = count_queryset(queryset, self.count_mode)
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor["r"])
+
+        ordering = [self._flip(field) for field in self.ordering] if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if cursor is not None:
+            queryset = queryset.filter(self._after(ordering, cursor["v"]))
+
+        # One extra row tells whether there is another page this way.
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_ordering(self, request, queryset, view):
+        ordering = None
+        if view is not None and any(
+            issubclass(backend, OrderingFilter) for backend in getattr(view, "filter_backends", ())
+        ):
+            ordering = OrderingFilter().get_ordering(request, queryset, view)
+        if not ordering:
+            ordering = getattr(view, "ordering", None)
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+
+        model = queryset.model
+        if not ordering or not all(self._is_keyset_field(model, f) for f in ordering):
+            ordering = self.ordering
+            if not all(self._is_keyset_field(model, f) for f in ordering):
+                ordering = ("-pk",)
+
+        ordering = tuple("pk" if f == "id" else "-pk" if f == "-id" else f for f in ordering)
+        if ordering[-1].lstrip("-") != "pk":
+            ordering += ("-pk" if ordering[-1].startswith("-") else "pk",)
+        return ordering
+
+    @staticmethod
+    def _is_keyset_field(model, field):
+        name = field.lstrip("-")
+        if name == "pk":
+            return True
+        try:
+            model_field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        # NULLs can't be compared with < and >, and relations need joins.
+        return model_field.concrete and not model_field.is_relation and not model_field.null
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def _after(ordering, values):
+        """(a, b, c) > (x, y, z), spelled out so it works on every backend."""
+        condition = Q()
+        equal = {}
+        for field, value in zip(ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return condition
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            values = [_load_value(value) for value in data["v"]]
+            reverse = bool(data.get("r"))
+        except (TypeError, ValueError, KeyError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+        if len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return {"v": values, "r": reverse}
+
+    def encode_cursor(self, row, reverse=False):
+        values = [_dump_value(getattr(row, field.lstrip("-"))) for field in self.ordering]
+        data = json.dumps({"v": values, "r": reverse}, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(data.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
     def get_paginated_response(self, data):
-        return Response(OrderedDict([
+        fields = [
             ("next", self.get_next_link()),
             ("previous", self.get_previous_link()),
             ("limit", self.get_page_size(self.request)),
             ("results", data),
-        ]))
\ No newline at end of file
+        ]
+        if self.count_mode != COUNT_NONE:
+            fields[:0] = [("count", self.count), ("count_exact", self.count_exact)]
+        return Response(OrderedDict(fields))
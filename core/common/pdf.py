@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+from functools import lru_cache
+from typing import Callable
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+from PIL import Image as PILImage
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Image
+
+from core.common.media import send_file
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "IMAGE_DPI",
+    "CachedImage",
+    "cached_image",
+    "pdf_cache_key",
+    "cached_pdf_path",
+    "store_cached_pdf",
+    "cached_pdf_response",
+)
+
+
+# --- Images ---
+
+
+# Static artwork is resampled down to this resolution at its drawn size;
+# some icons ship at 5000px for a 6mm slot.
+IMAGE_DPI = 300
+
+
+@lru_cache(maxsize=64)
+def _image_reader(path: str, mtime: float, max_size: tuple | None) -> ImageReader:
+    if max_size is None:
+        reader = ImageReader(path)
+    else:
+        with PILImage.open(path) as source:
+            image = source.copy()
+        if image.width > max_size[0] or image.height > max_size[1]:
+            image.thumbnail(max_size, PILImage.LANCZOS)
+        reader = ImageReader(image)
+
+    # Decode now so renders only ever read the shared pixel data.
+    reader.getRGBData()
+    return reader
+
+
+class CachedImage(Image):
+    """
+    Image flowable drawing a shared, already decoded ImageReader, so static
+    artwork (logos, icons) is read from disk and decoded once per process.
+    """
+
+    def __init__(self, reader: ImageReader, width=None, height=None, **kwargs):
+        super().__init__(reader.fileName, width, height, lazy=1, **kwargs)
+        self._img = reader
+
+
+def cached_image(path, width=None, height=None, **kwargs) -> CachedImage | None:
+    """Returns a CachedImage for `path`, or None when the file is missing."""
+    try:
+        mtime = os.path.getmtime(path)
+    except (OSError, TypeError):
+        return None
+
+    max_size = None
+    if width and height:
+        max_size = (
+            math.ceil(width / 72 * IMAGE_DPI),
+            math.ceil(height / 72 * IMAGE_DPI),
+        )
+
+    return CachedImage(_image_reader(path, mtime, max_size), width, height, **kwargs)
+
+
+# --- Rendered documents ---
+
+
+def _cache_root() -> str:
+    return getattr(
+        settings, "PDF_CACHE_ROOT", os.path.join(settings.BASE_DIR, "cache", "pdf")
+    )
+
+
+def pdf_cache_key(*parts) -> str:
+    """
+    Content version of a document: a hash of everything its template reads
+    plus the template's own version.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def cached_pdf_path(namespace: str, object_id: str, key: str) -> str:
+    """Where version `key` of a document is cached; the file may not exist."""
+    return os.path.join(_cache_root(), namespace, object_id, f"{key}.pdf")
+
+
+def store_cached_pdf(namespace: str, object_id: str, key: str, pdf: bytes):
+    """Caches version `key` of a document, replacing any older version."""
+    directory = os.path.dirname(cached_pdf_path(namespace, object_id, key))
+    os.makedirs(directory, exist_ok=True)
+
+    # Write to a temp file first so concurrent readers never see half a PDF.
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(pdf)
+    os.replace(tmp_path, os.path.join(directory, f"{key}.pdf"))
+
+    # Older versions of the same document are never served again.
+    for name in os.listdir(directory):
+        if name != f"{key}.pdf" and name.endswith(".pdf"):
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+
+def cached_pdf_response(
+    request,
+    *,
+    namespace: str,
+    object_id: str,
+    key: str,
+    render: Callable[[], bytes],
+    filename: str,
+):
+    """
+    Serves a rendered PDF from the on-disk cache, rendering it on a miss.
+
+    `key` is the content version from `pdf_cache_key` and doubles as the
+    ETag, so clients revalidating an unchanged document get a 304 without
+    the file being read.
+    """
+    etag = f'"{key}"'
+    headers = {
+        "ETag": etag,
+        # Always revalidate: the same URL changes content when the source does.
+        "Cache-Control": "private, no-cache",
+    }
+
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+    path = cached_pdf_path(namespace, object_id, key)
+
+    try:
+        # 🚀 Cache hits are sent by the front web server when configured
+        response = send_file(
+            request,
+            path,
+            content_type="application/pdf",
+            filename=filename,
+            cache_control=headers["Cache-Control"],
+        )
+    except FileNotFoundError:
+        pdf = render()
+        try:
+            store_cached_pdf(namespace, object_id, key, pdf)
+        except OSError:
+            logger.exception("Could not write PDF cache entry %s", path)
+        response = HttpResponse(pdf, content_type="application/pdf")
+        response["Content-Disposition"] = f'inline; filename="{filename}"'
+
+    for name, value in headers.items():
+        response[name] = value
+    return response
@@ -1,7 +1,15 @@
 from rest_framework.permissions import BasePermission
 from django.utils.translation import gettext_lazy as _
 
-from services.account.models import Module
+from services.account.permission_cache import UserAccess, token_access
+
+
+def request_access(request) -> UserAccess:
+    """
+    Access of the requesting user: from the token snapshot when it is
+    current, else resolved from the database (and cached).
+    """
+    return token_access(request.auth) or request.user.access
 
 
 class HasRolePermission(BasePermission):
@@ -24,8 +32,12 @@ class HasRolePermission(BasePermission):
         if not required_perms:
             return True
 
+        access = request_access(request)
+        if access.is_superuser:
+            return True
+
         # At least ONE permission is enough
-        return any(request.user.has_perm(perm) for perm in required_perms)
+        return any(perm in access.permissions for perm in required_perms)
 
 
 class HasModulePermission(BasePermission):
@@ -43,11 +55,9 @@ class HasModulePermission(BasePermission):
         if not user or not user.is_authenticated:
             return False
 
-        if user and user.is_superuser:
+        access = request_access(request)
+        if access.is_superuser:
             return True
 
-        return Module.objects.filter(
-            code=required_code,
-            role__users=user,  # <-- relasi reverse
-            is_active=True,
-        ).exists()
+        # 🚀 Read from the token, or resolved once per request and cached
+        return required_code in access.active_modules
@@ -0,0 +1,194 @@
+"""
+Response cache for read-heavy BaseViewSet endpoints.
+
+A view opts in by listing the models its responses are built from in
+`cache_tags` ("app_label.modelname"). Entries are keyed on the view, the
+action, the permissions version and the full URL, and store the version of
+every tag at the time they were computed. Saving, deleting or changing a
+many-to-many relation of any model bumps its tag once the transaction
+commits, which makes every entry built from it stale.
+
+Writes that skip model signals (QuerySet.update(), bulk_create(),
+bulk_update()) must call bump_tags() themselves; RESPONSE_CACHE_TIMEOUT
+bounds how long anything missed can be served.
+
+Versions and counters live in the default cache, so a local-memory cache
+is only coherent within one process. Deployments with several workers
+should point CACHE_BACKEND at a file, database or memcached cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.response import Response
+
+from services.account.permission_cache import permissions_version
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "model_tag",
+    "tag_versions",
+    "bump_tags",
+    "cached_response",
+    "cache_stats",
+)
+
+CACHE_HEADER = "X-Cache"
+
+_TAG_KEY = "response:tag:{}"
+_STATS_KEY = "response:stats:{}:{}"
+
+# Tables that never feed an API response.
+_IGNORED_APPS = {"sessions", "admin", "contenttypes"}
+
+
+def model_tag(model) -> str:
+    return model._meta.label_lower
+
+
+def _fresh_version() -> int:
+    # Not 1: a version key that was evicted must not come back at a value
+    # an old entry was stamped with.
+    return time.time_ns()
+
+
+def tag_versions(tags) -> dict[str, int]:
+    keys = {_TAG_KEY.format(tag): tag for tag in tags}
+    found = cache.get_many(keys)
+
+    for key in keys.keys() - found.keys():
+        cache.add(key, _fresh_version(), timeout=None)
+        found[key] = cache.get(key)
+
+    return {tag: found[key] for key, tag in keys.items()}
+
+
+def bump_tags(*tags):
+    """
+    Invalidates every cached response built from any of `tags` once the
+    current transaction commits. Accepts model classes or
+    "app_label.modelname" labels.
+    """
+    for tag in tags:
+        _schedule_bump(tag if isinstance(tag, str) else model_tag(tag))
+
+
+def _bump_now(tags):
+    for tag in tags:
+        key = _TAG_KEY.format(tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _fresh_version(), timeout=None)
+
+
+# --- Invalidation ---
+
+
+def _flush_pending():
+    tags = connection.__dict__.pop("_response_cache_tags", None)
+    if tags:
+        _bump_now(tags)
+
+
+def _schedule_bump(tag):
+    """
+    Bumps `tag` when the current transaction commits, once per transaction
+    however many rows change. Bumping earlier would let a concurrent request
+    cache the old rows under the new version.
+    """
+    if not connection.in_atomic_block:
+        _bump_now([tag])
+        return
+
+    pending = connection.__dict__.get("_response_cache_tags")
+    # A rolled back transaction drops its callbacks but not our set.
+    scheduled = any(func is _flush_pending for _, func, *_ in connection.run_on_commit)
+    if pending is None or not scheduled:
+        pending = connection.__dict__["_response_cache_tags"] = set()
+        transaction.on_commit(_flush_pending)
+    pending.add(tag)
+
+
+@receiver(post_save, dispatch_uid="response_cache_post_save")
+@receiver(post_delete, dispatch_uid="response_cache_post_delete")
+def invalidate_on_write(sender, **kwargs):
+    if sender._meta.app_label not in _IGNORED_APPS:
+        _schedule_bump(model_tag(sender))
+
+
+@receiver(m2m_changed, dispatch_uid="response_cache_m2m_changed")
+def invalidate_on_m2m(sender, instance, action, model, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        _schedule_bump(model_tag(type(instance)))
+        _schedule_bump(model_tag(model))
+        _schedule_bump(model_tag(sender))
+
+
+# --- Lookup ---
+
+
+def _view_name(view) -> str:
+    return f"{type(view).__module__}.{type(view).__qualname__}"
+
+
+def _count(view, outcome):
+    key = _STATS_KEY.format(_view_name(view), outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+def _request_key(view, request) -> str:
+    # Pagination links are absolute, so the host is part of the key.
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    url = f"{request.build_absolute_uri(request.path)}?{query}"
+    digest = hashlib.sha256(url.encode()).hexdigest()
+    return f"response:{_view_name(view)}:{view.action}:{permissions_version()}:{digest}"
+
+
+def cached_response(view, request, handler, *args, **kwargs):
+    """
+    Serves `handler`'s response from the cache while none of the view's
+    tags changed since it was stored. Only 200 responses are stored.
+    """
+    key = _request_key(view, request)
+    # Read before computing, so a write racing with us leaves the entry stale.
+    versions = tag_versions(view.cache_tags)
+
+    entry = cache.get(key)
+    if entry is not None and entry["versions"] == versions:
+        _count(view, "hits")
+        return Response(entry["data"], headers={CACHE_HEADER: "HIT"})
+
+    _count(view, "misses")
+    response = handler(request, *args, **kwargs)
+    if response.status_code == 200:
+        cache.set(
+            key,
+            {"versions": versions, "data": response.data},
+            timeout=settings.RESPONSE_CACHE_TIMEOUT,
+        )
+    response[CACHE_HEADER] = "MISS"
+    return response
+
+
+def cache_stats(view_class) -> dict[str, int]:
+    name = f"{view_class.__module__}.{view_class.__qualname__}"
+    counts = cache.get_many([_STATS_KEY.format(name, outcome) for outcome in ("hits", "misses")])
+    return {
+        outcome: counts.get(_STATS_KEY.format(name, outcome), 0)
+        for outcome in ("hits", "misses")
+    }
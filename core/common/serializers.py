@@ -1,5 +1,9 @@
+from django.db import models
 from rest_framework import serializers
 
+from core.common.images import thumbnail_url
+from core.common.workdays import add_working_days, add_working_days_bulk
+
 
 class BaseModelSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
@@ -13,3 +17,111 @@ class BaseModelSerializer(serializers.ModelSerializer):
 
     class Meta:
         abstract = True
+
+
+class DueDateListSerializer(serializers.ListSerializer):
+    """
+    Resolves the working-day due date of every row on the page in one batch.
+
+    The child serializer should use `DueDateMixin`.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        rows = list(iterable)
+
+        sources = [self.child.get_due_date_source(obj) for obj in rows]
+        self.child.due_dates = dict(
+            zip((obj.pk for obj in rows), add_working_days_bulk(sources))
+        )
+
+        return super().to_representation(rows)
+
+
+class DueDateMixin:
+    """
+    Mixin for serializers exposing a working-day due date.
+
+    Serializers using this mixin must define:
+    get_due_date_source(obj) -> (start, lead_time)
+    (checked when the class is created) and should set
+    `list_serializer_class = DueDateListSerializer` in Meta.
+    """
+
+    due_dates = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not callable(getattr(cls, "get_due_date_source", None)):
+            raise TypeError(
+                f"{cls.__qualname__} uses DueDateMixin without defining get_due_date_source(obj)."
+            )
+
+    def resolve_due_date(self, obj):
+        if self.due_dates is not None and obj.pk in self.due_dates:
+            return self.due_dates[obj.pk]
+        return add_working_days(*self.get_due_date_source(obj))
+
+
+class PrefetchedSlugRelatedField(serializers.SlugRelatedField):
+    """
+    SlugRelatedField that looks values up in `prefetched` first.
+
+    Filled by `BulkSlugListSerializer` so a list of N rows costs one query
+    per related model instead of N.
+    """
+
+    prefetched = None
+
+    def to_internal_value(self, data):
+        if self.prefetched is not None and data in self.prefetched:
+            return self.prefetched[data]
+        return super().to_internal_value(data)
+
+
+class BulkSlugListSerializer(serializers.ListSerializer):
+    """
+    Resolves every PrefetchedSlugRelatedField of the child in one query per
+    field before validating the rows.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            for name, field in self.child.fields.items():
+                if not isinstance(field, PrefetchedSlugRelatedField):
+                    continue
+
+                values = {
+                    row.get(name)
+                    for row in data
+                    if isinstance(row, dict) and isinstance(row.get(name), str)
+                }
+                field.prefetched = field.get_queryset().in_bulk(
+                    values, field_name=field.slug_field
+                )
+
+        return super().to_internal_value(data)
+
+
+class ThumbnailField(serializers.ReadOnlyField):
+    """
+    URL of a resized WebP variant of an image field, rendered on first use.
+
+    Usage: `design_front_thumb = ThumbnailField(source="design_front")`.
+    Absolute when the request is in the context, like DRF's FileField.
+    """
+
+    def __init__(self, bucket="md", fmt="webp", **kwargs):
+        self.bucket = bucket
+        self.fmt = fmt
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        url = thumbnail_url(value, self.bucket, self.fmt)
+        if url is None:
+            return None
+
+        request = self.context.get("request")
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import csv
+import io
+import os
+import re
+from typing import Iterable, Iterator
+
+__all__ = (
+    "SpreadsheetError",
+    "cell_text",
+    "normalize_header",
+    "read_sheet",
+)
+
+
+class SpreadsheetError(Exception):
+    """Raised when an uploaded file cannot be read as the expected sheet."""
+
+
+def cell_text(value) -> str:
+    """Stripped text of a cell; spreadsheets hand back 7.0 for a number typed as 7."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value if value is not None else "").strip()
+
+
+def normalize_header(label) -> str:
+    """Lower-cases a header cell and folds "_", "." and runs of spaces."""
+    return re.sub(r"[\s_.]+", " ", str(label or "")).strip().lower()
+
+
+def _map_header(header: Iterable, aliases: dict, required: Iterable) -> list:
+    columns = [aliases.get(normalize_header(label)) for label in header]
+
+    missing = [name for name in required if name not in columns]
+    if missing:
+        raise SpreadsheetError(f"Missing column(s): {', '.join(missing)}.")
+    return columns
+
+
+def _rows_from_table(rows: Iterator, aliases: dict, required) -> Iterator[tuple[int, dict]]:
+    header = next(rows, None)
+    if header is None:
+        raise SpreadsheetError("The file is empty.")
+
+    columns = _map_header(header, aliases, required)
+
+    # Row numbers match what the user sees in the spreadsheet (header = 1).
+    for line, values in enumerate(rows, start=2):
+        if not any(str(v).strip() for v in values if v is not None):
+            continue
+
+        row = {}
+        for column, value in zip(columns, values):
+            # First matching column wins when an export repeats a label.
+            if column is not None and column not in row:
+                row[column] = value
+        yield line, row
+
+
+def _iter_csv(upload) -> Iterator[list]:
+    stream = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+    try:
+        sample = stream.read(4096)
+        stream.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+
+        yield from csv.reader(stream, dialect)
+    except UnicodeDecodeError:
+        raise SpreadsheetError("The file must be UTF-8 encoded.")
+    finally:
+        # Leave the underlying file open for its owner to close.
+        stream.detach()
+
+
+def _iter_xlsx(upload) -> Iterator[tuple]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise SpreadsheetError("XLSX files need openpyxl installed; upload a CSV instead.")
+
+    # openpyxl reports a corrupt or mislabelled file with whatever zipfile,
+    # the XML parser or its own readers raise, while opening or while reading.
+    try:
+        workbook = load_workbook(upload, read_only=True, data_only=True)
+    except Exception:
+        raise SpreadsheetError("The file is not a valid XLSX workbook.")
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    except Exception:
+        raise SpreadsheetError("The file is not a valid XLSX workbook.")
+    finally:
+        workbook.close()
+
+
+def read_sheet(upload, aliases: dict, required: Iterable = ()) -> Iterator[tuple[int, dict]]:
+    """
+    Streams (row number, row) pairs out of a CSV or XLSX file.
+
+    `aliases` maps normalized header labels to field names; columns without an
+    alias are dropped. Raises SpreadsheetError when a `required` field has no
+    column.
+    """
+    extension = os.path.splitext(getattr(upload, "name", "") or "")[1].lower()
+
+    if extension == ".xlsx":
+        rows = _iter_xlsx(upload)
+    elif extension in ("", ".csv", ".txt"):
+        rows = _iter_csv(upload)
+    else:
+        raise SpreadsheetError(f"Unsupported file type '{extension}'.")
+
+    return _rows_from_table(iter(rows), aliases, tuple(required))
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import posixpath
+import tempfile
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.signing import Signer
+from django.db import models
+from django.utils.crypto import constant_time_compare
+from django.utils.deconstruct import deconstructible
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "MEDIA_SIGNATURE_PARAM",
+    "media_url_window",
+    "sign_media_name",
+    "check_media_signature",
+    "SignedURLMixin",
+    "MediaStorage",
+    "ContentAddressedStorage",
+    "content_addressed_storage",
+    "content_addressed_fields",
+    "file_references",
+)
+
+
+# --- Signed media URLs ---
+
+# Query parameter carrying the signature, read by core.common.media
+MEDIA_SIGNATURE_PARAM = "sig"
+
+_SIGNER_SALT = "core.common.storage.media-url"
+
+
+def media_url_window() -> int:
+    """Index of the MEDIA_URL_MAX_AGE period URLs are being signed in."""
+    return int(time.time()) // settings.MEDIA_URL_MAX_AGE
+
+
+def _media_name(name: str) -> str:
+    return posixpath.normpath(name).lstrip("/")
+
+
+def _signature(name: str, expires: int) -> str:
+    return Signer(salt=_SIGNER_SALT).signature(f"{_media_name(name)}:{expires}")
+
+
+def sign_media_name(name: str) -> str:
+    """
+    `<expires>.<signature>` for the media file `name`. Expiry is rounded to
+    the end of the next period, so a file keeps one URL (and stays in the
+    browser cache) for a whole period and each URL lives at least one.
+    """
+    expires = (media_url_window() + 2) * settings.MEDIA_URL_MAX_AGE
+    return f"{expires}.{_signature(name, expires)}"
+
+
+def check_media_signature(name: str, value: str | None) -> bool:
+    expires, _, signature = (value or "").partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return constant_time_compare(signature, _signature(name, int(expires)))
+
+
+class SignedURLMixin:
+    """
+    Adds a short-lived signature to storage URLs. Browsers load media in
+    <img src> and links without the Authorization header, so the signature
+    stands in for it; serializers only hand URLs to users who may see them.
+    """
+
+    def url(self, name):
+        url = super().url(name)
+        if name is None:
+            return url
+        return f"{url}?{MEDIA_SIGNATURE_PARAM}={sign_media_name(name)}"
+
+
+@deconstructible(path="core.common.storage.MediaStorage")
+class MediaStorage(SignedURLMixin, FileSystemStorage):
+    """Default storage: MEDIA_ROOT with signed URLs."""
+
+
+@deconstructible(path="core.common.storage.ContentAddressedStorage")
+class ContentAddressedStorage(SignedURLMixin, FileSystemStorage):
+    """
+    Media storage that names files after the SHA-256 of their content:
+    designs/front.png -> designs/3f/3f9a...c1.png
+
+    Uploading bytes that are already stored returns the existing name instead
+    of writing another copy, so one file can be shared by many rows. Files are
+    therefore never deleted through the storage while a row still points at
+    them; `manage.py gc_media` removes the ones nothing references anymore.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is only known once the content is hashed in _save().
+        return name
+
+    def _save(self, name, content):
+        directory, filename = posixpath.split(name)
+        ext = os.path.splitext(filename)[1].lower()
+
+        root = self.path(directory)
+        self._makedirs(root)
+
+        # Hash while spooling to a temp file, so the upload is read only once.
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    digest.update(chunk)
+                    f.write(chunk)
+
+            content_hash = digest.hexdigest()
+            name = posixpath.join(directory, content_hash[:2], f"{content_hash}{ext}")
+            full_path = self.path(name)
+
+            if os.path.exists(full_path):
+                # 🚀 Same bytes already stored: reuse them
+                os.remove(tmp_path)
+            else:
+                self._makedirs(os.path.dirname(full_path))
+                os.chmod(tmp_path, self.file_permissions_mode or 0o644)
+                os.replace(tmp_path, full_path)
+                self._ensure_location_group_id(full_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return name
+
+    def _makedirs(self, directory):
+        if self.directory_permissions_mode is None:
+            os.makedirs(directory, exist_ok=True)
+            return
+
+        # os.makedirs() doesn't apply the mode to intermediate directories.
+        old_umask = os.umask(0o777 & ~self.directory_permissions_mode)
+        try:
+            os.makedirs(directory, self.directory_permissions_mode, exist_ok=True)
+        finally:
+            os.umask(old_umask)
+
+    def delete(self, name):
+        if not name:
+            raise ValueError("The name must be given to delete().")
+
+        references = file_references(name)
+        if references:
+            logger.debug("Keeping %s, still referenced by %s rows", name, references)
+            return
+        super().delete(name)
+
+
+content_addressed_storage = ContentAddressedStorage()
+
+
+def content_addressed_fields() -> list[tuple[type[models.Model], models.FileField]]:
+    """
+    Every (model, field) pair whose files live in the content-addressed storage.
+    """
+    return [
+        (model, field)
+        for model in apps.get_models()
+        for field in model._meta.get_fields()
+        if isinstance(field, models.FileField)
+        and isinstance(field.storage, ContentAddressedStorage)
+    ]
+
+
+def file_references(name: str) -> int:
+    """
+    Number of rows, across every content-addressed field, pointing at `name`.
+    """
+    return sum(
+        model._default_manager.filter(**{field.name: name}).count()
+        for model, field in content_addressed_fields()
+    )
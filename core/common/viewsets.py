@@ -1,8 +1,18 @@
+from core.common.autocomplete import DEFAULT_LIMIT, MAX_LIMIT, prefix_matches
 from core.common.permissions import HasModulePermission
 from django.contrib.auth import get_user_model
 from rest_framework import viewsets, filters
+from services.search.filters import IndexedSearchFilter
 from rest_framework.permissions import IsAuthenticated
-from core.common.paginations import PageNumberPagination
+from rest_framework.response import Response
+from core.common.conditional import (
+    apply_validators,
+    list_validators,
+    not_modified_response,
+    object_validators,
+)
+from core.common.paginations import CursorPagination, PageNumberPagination
+from core.common.response_cache import cached_response
 from django_filters.rest_framework import DjangoFilterBackend
 
 from core.common.permissions import HasRolePermission
@@ -24,25 +34,58 @@ class BaseViewSet(viewsets.ModelViewSet):
     # Enable filtering, searching, ordering
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        IndexedSearchFilter,
         filters.OrderingFilter,
     ]
 
     # ✅ Filtering by fields
     filterset_fields = []
 
-    # ✅ Searching (case-insensitive)
+    # ✅ Searching (case-insensitive). With a `search_index` name, ?search=
+    # reads that full-text index instead, see services.search.registry.
     search_fields = []
+    search_index = None
 
     # ✅ Ordering
     ordering_fields = ["created"]
     ordering = ["-created"]
 
-    # ✅ Pagination
+    # ✅ Pagination: page numbers by default, keyset with ?pagination=cursor
     pagination_class = PageNumberPagination
+    cursor_pagination_class = CursorPagination
 
     serializer_map = None
 
+    # ✅ Response cache: models ("app_label.modelname") the responses are
+    # built from, for cache_actions. None disables it, see
+    # core.common.response_cache. Conditional GET reads them too.
+    cache_tags = None
+    cache_actions = ("list", "retrieve", "autocomplete")
+
+    # ✅ Conditional GET: ETag/Last-Modified, see core.common.conditional
+    conditional_actions = ("list", "retrieve")
+
+    # ✅ Autocomplete: ?search= matched as a prefix of these (indexed) fields,
+    # answered with {"results": [{"subid", "label"}]} and no count, see
+    # core.common.autocomplete. Empty keeps autocomplete on list.
+    autocomplete_fields = ()
+    autocomplete_label_fields = None
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            request = getattr(self, "request", None)
+            if (
+                self.pagination_class is not None
+                and self.cursor_pagination_class is not None
+                and request is not None
+                and request.query_params.get("pagination") == "cursor"
+            ):
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
+
     def get_serializer_class(self):
         serializer = None
         if self.serializer_map is not None:
@@ -52,5 +95,69 @@ class BaseViewSet(viewsets.ModelViewSet):
             serializer = super().get_serializer_class()
         return serializer
 
+    def list(self, request, *args, **kwargs):
+        # Filtered once, for the validators and the page
+        queryset = self.filter_queryset(self.get_queryset())
+
+        validators = None
+        if self.action in self.conditional_actions:
+            validators = list_validators(self, request, queryset)
+            not_modified = not_modified_response(request, validators)
+            if not_modified is not None:
+                return not_modified
+
+        if self.cache_tags is None or self.action not in self.cache_actions:
+            response = self.list_response(request, queryset)
+        else:
+            response = cached_response(self, request, self.list_response, queryset)
+        return apply_validators(response, validators)
+
+    def list_response(self, request, queryset):
+        """`ListModelMixin.list` over an already filtered queryset."""
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+    def retrieve(self, request, *args, **kwargs):
+        validators = None
+        if self.action in self.conditional_actions:
+            validators = object_validators(self, request)
+            not_modified = not_modified_response(request, validators)
+            if not_modified is not None:
+                return not_modified
+
+        if self.cache_tags is None or self.action not in self.cache_actions:
+            response = super().retrieve(request, *args, **kwargs)
+        else:
+            response = cached_response(self, request, super().retrieve, *args, **kwargs)
+        return apply_validators(response, validators)
+
     def autocomplete(self, request, *args, **kwargs):
-        return self.list(request, *args, **kwargs)
+        if not self.autocomplete_fields:
+            return self.list(request, *args, **kwargs)
+
+        if self.cache_tags is None or self.action not in self.cache_actions:
+            return self.prefix_autocomplete(request)
+        return cached_response(self, request, self.prefix_autocomplete)
+
+    def prefix_autocomplete(self, request, *args, **kwargs):
+        try:
+            limit = int(request.query_params.get("limit", DEFAULT_LIMIT))
+        except ValueError:
+            limit = DEFAULT_LIMIT
+        limit = min(max(limit, 1), MAX_LIMIT)
+
+        # The picker's filters (?store=, ?source=...), not search or ordering
+        queryset = DjangoFilterBackend().filter_queryset(request, self.get_queryset(), self)
+        results = prefix_matches(
+            queryset,
+            self.autocomplete_fields,
+            request.query_params.get("search", "").strip(),
+            limit=limit,
+            label_fields=self.autocomplete_label_fields,
+        )
+        return Response({"results": results})
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import datetime
+import threading
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Iterable
+
+import holidays
+
+__all__ = (
+    "add_working_days",
+    "add_working_days_bulk",
+    "working_days_of_year",
+)
+
+HOLIDAY_COUNTRY = "ID"
+
+
+@lru_cache(maxsize=None)
+def working_days_of_year(year: int) -> tuple[int, ...]:
+    """
+    Sorted ordinals of every working day in `year`.
+
+    Weekends (Saturday/Sunday) and Indonesian public holidays are excluded.
+    Built once per process per year.
+    """
+    id_holidays = holidays.country_holidays(HOLIDAY_COUNTRY, years=year)
+
+    current = datetime.date(year, 1, 1)
+    end = datetime.date(year, 12, 31)
+    days = []
+
+    while current <= end:
+        if current.weekday() < 5 and current not in id_holidays:
+            days.append(current.toordinal())
+        current += datetime.timedelta(days=1)
+
+    return tuple(days)
+
+
+class _WorkingDayCalendar:
+    """
+    Contiguous, sorted list of working-day ordinals spanning a range of years.
+
+    Lookups are a single bisect, so resolving a due date costs the same
+    whether the lead time is 3 days or 300.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._first_year = None
+        self._last_year = None
+        self._days: list[int] = []
+
+    def _ensure(self, first_year: int, last_year: int):
+        if (
+            self._first_year is not None
+            and self._first_year <= first_year
+            and last_year <= self._last_year
+        ):
+            return
+
+        with self._lock:
+            if self._first_year is not None:
+                first_year = min(first_year, self._first_year)
+                last_year = max(last_year, self._last_year)
+
+            days = []
+            for year in range(first_year, last_year + 1):
+                days.extend(working_days_of_year(year))
+
+            self._days = days
+            self._first_year = first_year
+            self._last_year = last_year
+
+    def _offset(self, ordinal: int, days: int) -> int:
+        if days <= 0:
+            return ordinal
+
+        # Every year has well over 200 working days, so one extra year of
+        # headroom per 200 requested days is always enough.
+        start_year = datetime.date.fromordinal(ordinal).year
+        self._ensure(start_year, start_year + days // 200 + 1)
+
+        working_days = self._days
+        return working_days[bisect_right(working_days, ordinal) + days - 1]
+
+    def add(self, start, days: int):
+        ordinal = _to_date(start).toordinal()
+        return datetime.date.fromordinal(self._offset(ordinal, days))
+
+    def add_many(self, pairs: list[tuple]) -> list:
+        valid = [
+            (i, _to_date(start).toordinal(), int(days))
+            for i, (start, days) in enumerate(pairs)
+            if start and days
+        ]
+        results = [None] * len(pairs)
+        if not valid:
+            return results
+
+        # Grow the calendar once for the whole batch.
+        first_year = min(datetime.date.fromordinal(o).year for _, o, _ in valid)
+        last_year = max(
+            datetime.date.fromordinal(o).year + max(d, 0) // 200 + 1
+            for _, o, d in valid
+        )
+        self._ensure(first_year, last_year)
+
+        days = self._days
+        for i, ordinal, offset in valid:
+            if offset > 0:
+                ordinal = days[bisect_right(days, ordinal) + offset - 1]
+            results[i] = datetime.date.fromordinal(ordinal)
+
+        return results
+
+
+def _to_date(value) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    return value
+
+
+_calendar = _WorkingDayCalendar()
+
+
+def add_working_days(start, days):
+    """
+    Returns the date `days` working days after `start`.
+
+    `start` may be a date or datetime; the start day itself is never counted.
+    Returns None when `start` or `days` is empty.
+    """
+    if not start or not days:
+        return None
+    return _calendar.add(start, int(days))
+
+
+def add_working_days_bulk(pairs: Iterable[tuple]) -> list:
+    """
+    Same as `add_working_days`, for a whole batch of (start, days) pairs.
+    Results are returned in input order.
+    """
+    return _calendar.add_many(list(pairs))
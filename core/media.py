@@ -1,4 +1,5 @@
 import os
+from urllib.parse import unquote, urlsplit
 
 from django.conf import settings
 
@@ -7,8 +8,11 @@ def media_to_path(val):
     if not val:
         return None
 
+    # Media URLs carry a signature in the query string (core.common.storage)
+    path = unquote(urlsplit(val).path)
+
     # If MEDIA_URL = "/media/"
-    if val.startswith(settings.MEDIA_URL):
-        return os.path.join(settings.MEDIA_ROOT, val.replace(settings.MEDIA_URL, ""))
+    if path.startswith(settings.MEDIA_URL):
+        return os.path.join(settings.MEDIA_ROOT, path[len(settings.MEDIA_URL):])
 
     return val
@@ -34,6 +34,41 @@ STATICFILES_DIRS = [
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Media URLs carry a signature valid for one to two periods of this many
+# seconds, see core.common.storage. Keep it above RESPONSE_CACHE_TIMEOUT.
+MEDIA_URL_MAX_AGE = config("MEDIA_URL_MAX_AGE", default=3600, cast=int)
+
+STORAGES = {
+    "default": {"BACKEND": "core.common.storage.MediaStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+# Rendered PDFs (order forms, invoices), see core.common.pdf
+PDF_CACHE_ROOT = config("PDF_CACHE_ROOT", default=os.path.join(BASE_DIR, "cache", "pdf"))
+
+# Batch order form downloads, see services.forecast.production_pack
+PRODUCTION_PACK_ROOT = config(
+    "PRODUCTION_PACK_ROOT", default=os.path.join(BASE_DIR, "cache", "production-packs")
+)
+PRODUCTION_PACK_WORKERS = config("PRODUCTION_PACK_WORKERS", default=0, cast=int)
+# Seconds without progress after which a pending/running pack is taken for
+# one whose worker stopped, and failed
+PRODUCTION_PACK_STALE_AFTER = config("PRODUCTION_PACK_STALE_AFTER", default=1800, cast=int)
+
+# Large design files sent in chunks, see services.order.chunked_upload
+CHUNKED_UPLOAD_ROOT = config(
+    "CHUNKED_UPLOAD_ROOT", default=os.path.join(BASE_DIR, "cache", "uploads")
+)
+CHUNKED_UPLOAD_CHUNK_SIZE = config("CHUNKED_UPLOAD_CHUNK_SIZE", default=4 * 1024 * 1024, cast=int)
+CHUNKED_UPLOAD_MAX_SIZE = config("CHUNKED_UPLOAD_MAX_SIZE", default=100 * 1024 * 1024, cast=int)
+
+# Hand file transfers (media, PDFs, production packs) to the front web server,
+# see core.common.media. "nginx" (X-Accel-Redirect), "apache" (X-Sendfile)
+# or empty to stream from Django.
+SENDFILE_BACKEND = config("SENDFILE_BACKEND", default="")
+# Internal nginx location the roots above are aliased under.
+SENDFILE_NGINX_PREFIX = config("SENDFILE_NGINX_PREFIX", default="/protected/")
+
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/4.2/howto/deployment/checklist/
 
@@ -79,6 +114,7 @@ INSTALLED_APPS = [
     "services.queue_entry",
     "services.defect",
     "services.tracking",
+    "services.search",
 ]
 
 MIDDLEWARE = [
@@ -132,6 +168,27 @@ DATABASES = {
 }
 
 
+# Shared across worker processes only with a networked backend (Redis,
+# Memcached, database); the in-memory default is per process.
+# JWT permission snapshots are trusted only with a shared backend, see
+# services.account.permission_cache.snapshots_trusted().
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+
+# Resolved role permissions/modules, see services.account.permission_cache.
+# With a per-process cache other workers see role edits after this long.
+PERMISSION_CACHE_TIMEOUT = config("PERMISSION_CACHE_TIMEOUT", default=60, cast=int)
+
+# Upper bound on serving a cached API response, see core.common.response_cache
+RESPONSE_CACHE_TIMEOUT = config("RESPONSE_CACHE_TIMEOUT", default=300, cast=int)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -177,7 +234,7 @@ AUTH_USER_MODEL = "account.User"
 # Django Rest Framework Settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "services.account.rest.auth.authentication.TokenAccessAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
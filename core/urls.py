@@ -23,6 +23,7 @@ from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 
 from core import settings
+from core.common.media import ProtectedMediaView
 
 # --- Swagger/OpenAPI Configuration ---
 schema_view = get_schema_view(
@@ -79,5 +80,11 @@ if settings.DEBUG:
 
 urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
-# if settings.DEBUG:
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Media needs a login and the owning module, see core.common.media
+urlpatterns += [
+    re_path(
+        r"^%s(?P<path>.+)$" % settings.MEDIA_URL.lstrip("/"),
+        ProtectedMediaView.as_view(),
+        name="protected-media",
+    ),
+]
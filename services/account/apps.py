@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class AccountConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'services.account'
+
+    def ready(self):
+        from services.account import signals  # noqa: F401
+
+        # Response cache invalidation listens to every model, not just ours.
+        from core.common import response_cache  # noqa: F401
@@ -0,0 +1,35 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.common.response_cache import cache_stats
+from core.common.viewsets import BaseViewSet
+
+
+def _subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+class Command(BaseCommand):
+    help = "Show response cache hits and misses of every view that caches responses."
+
+    def handle(self, *args, **options):
+        # Viewsets are imported by the URL conf.
+        import_module(settings.ROOT_URLCONF)
+
+        views = sorted(
+            (view for view in _subclasses(BaseViewSet) if view.cache_tags is not None),
+            key=lambda view: view.__name__,
+        )
+
+        self.stdout.write(f"{'view':<32} {'hits':>10} {'misses':>10} {'hit rate':>9}")
+        for view in views:
+            stats = cache_stats(view)
+            total = stats["hits"] + stats["misses"]
+            rate = f"{stats['hits'] / total:.0%}" if total else "-"
+            self.stdout.write(
+                f"{view.__name__:<32} {stats['hits']:>10} {stats['misses']:>10} {rate:>9}"
+            )
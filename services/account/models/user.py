@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from django.contrib.auth.models import AbstractUser, Permission, UserManager as DjangoUserManager
+from django.contrib.auth.models import AbstractUser, UserManager as DjangoUserManager
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -11,6 +11,7 @@ from core.common.models import get_subid_model
 
 if TYPE_CHECKING:
     from services.account.models.role import Role
+    from services.account.permission_cache import UserAccess
 
 logger = logging.getLogger(__name__)
 
@@ -72,24 +73,17 @@ class User(AbstractUser, get_subid_model()):
         Returns a set of permission strings that the user has.
         This includes permissions from their roles and direct user permissions.
         """
-        permissions: set[str] = set()
-        if not self.is_active or self.is_anonymous:
-            return permissions
+        return set(self.access.permissions)
 
-        if self.is_superuser:
-            return {
-                f"{p.content_type.app_label}.{p.codename}"
-                for p in Permission.objects.all()
-            }
-
-        # Get permissions from roles
-        for role in self.roles.all():
-            role_permissions = role.permissions.select_related("content_type")
-            permissions.update(
-                f"{p.content_type.app_label}.{p.codename}" for p in role_permissions
-            )
+    @property
+    def access(self) -> UserAccess:
+        """
+        Permissions and module codes from the user's roles, resolved once
+        per request (see services.account.permission_cache).
+        """
+        from services.account.permission_cache import resolve_access
 
-        return permissions
+        return resolve_access(self)
 
     def has_perm(self, perm: str, obj=None) -> bool:
         """
@@ -97,7 +91,7 @@ class User(AbstractUser, get_subid_model()):
         """
         if self.is_active and self.is_superuser:
             return True
-        return perm in self.get_all_permissions()
+        return perm in self.access.permissions
 
     def has_module_perms(self, app_label: str) -> bool:
         """
@@ -105,4 +99,4 @@ class User(AbstractUser, get_subid_model()):
         """
         if self.is_active and self.is_superuser:
             return True
-        return any(p.startswith(app_label) for p in self.get_all_permissions())
+        return any(p.startswith(app_label) for p in self.access.permissions)
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import base64
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+from services.account.models.module import Module
+
+if TYPE_CHECKING:
+    from services.account.models.user import User
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "UserAccess",
+    "permissions_version",
+    "bump_permissions_version",
+    "snapshots_trusted",
+    "is_active_user",
+    "resolve_access",
+    "access_claims",
+    "token_access",
+)
+
+VERSION_KEY = "account:permissions-version"
+
+# Access token claims, see access_claims()
+PERM_VERSION_CLAIM = "perm_version"
+PERMISSIONS_CLAIM = "perms"
+MODULES_CLAIM = "mods"
+SUPERUSER_CLAIM = "su"
+
+# Attribute the resolved access is memoized under on a User instance. DRF
+# authenticates once per request, so this lives exactly as long as the request.
+_INSTANCE_ATTR = "_access_cache"
+
+
+@dataclass(frozen=True)
+class UserAccess:
+    # "app_label.codename"
+    permissions: frozenset[str]
+    # Codes of every module granted through a role, active or not
+    modules: tuple[str, ...]
+    active_modules: frozenset[str]
+    is_superuser: bool = False
+
+
+_NO_ACCESS = UserAccess(frozenset(), (), frozenset())
+
+
+def _fresh_version() -> int:
+    # Not 1: after a restart or an eviction the version must not come back
+    # at a value old tokens were stamped with.
+    return time.time_ns()
+
+
+def permissions_version() -> int:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, _fresh_version(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_permissions_version():
+    """
+    Invalidates every cached UserAccess, see services.account.signals.
+    """
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, _fresh_version(), timeout=None)
+
+
+def snapshots_trusted() -> bool:
+    """
+    Whether token snapshots may stand in for the user. Only with a cache
+    shared by every worker: a per-process version never sees the bumps
+    made in other workers.
+    """
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def is_active_user(user_id) -> bool:
+    """
+    `user_id` is an active account. Cached under the permissions version,
+    which deactivating a user bumps.
+    """
+    key = f"account:active:{permissions_version()}:{user_id}"
+    active = cache.get(key)
+    if active is None:
+        active = get_user_model().objects.filter(pk=user_id, is_active=True).exists()
+        cache.set(key, active, timeout=settings.PERMISSION_CACHE_TIMEOUT)
+    return active
+
+
+def _load(user: User) -> UserAccess:
+    if user.is_superuser:
+        permissions = Permission.objects.all()
+    else:
+        permissions = Permission.objects.filter(role__users=user).distinct()
+
+    modules = (
+        Module.objects.filter(role__users=user)
+        .values_list("code", "is_active")
+        .distinct()
+        .order_by("code")
+    )
+
+    return UserAccess(
+        permissions=frozenset(
+            f"{app_label}.{codename}"
+            for app_label, codename in permissions.values_list(
+                "content_type__app_label", "codename"
+            )
+        ),
+        modules=tuple(code for code, _ in modules),
+        active_modules=frozenset(code for code, is_active in modules if is_active),
+        is_superuser=user.is_superuser,
+    )
+
+
+def resolve_access(user: User) -> UserAccess:
+    """
+    Permissions and module codes granted to `user` through their roles.
+
+    One query each on a cold cache, none on a warm one: the result is kept on
+    the user instance and in the cache, keyed by the permissions version.
+    """
+    if not user.is_active or user.is_anonymous:
+        return _NO_ACCESS
+
+    access = getattr(user, _INSTANCE_ATTR, None)
+    if access is not None:
+        return access
+
+    # The flags are part of the key, so editing them on a user needs no bump.
+    key = (
+        f"account:access:{permissions_version()}:{user.pk}:{int(user.is_superuser)}"
+    )
+    access = cache.get(key)
+    if access is None:
+        access = _load(user)
+        cache.set(key, access, timeout=settings.PERMISSION_CACHE_TIMEOUT)
+
+    setattr(user, _INSTANCE_ATTR, access)
+    return access
+
+
+# --- Token snapshots ---
+
+
+@dataclass(frozen=True)
+class _Catalog:
+    # Bit positions in the token bitsets are primary keys.
+    permissions: dict[int, str]
+    modules: dict[int, tuple[str, bool]]
+
+
+def _catalog(version: int) -> _Catalog:
+    key = f"account:catalog:{version}"
+    catalog = cache.get(key)
+    if catalog is None:
+        catalog = _Catalog(
+            permissions={
+                pk: f"{app_label}.{codename}"
+                for pk, app_label, codename in Permission.objects.values_list(
+                    "pk", "content_type__app_label", "codename"
+                )
+            },
+            modules={
+                pk: (code, is_active)
+                for pk, code, is_active in Module.objects.values_list("pk", "code", "is_active")
+            },
+        )
+        cache.set(key, catalog, timeout=settings.PERMISSION_CACHE_TIMEOUT)
+    return catalog
+
+
+def _encode_bits(positions) -> str:
+    bits = 0
+    for position in positions:
+        bits |= 1 << position
+    raw = bits.to_bytes(max(1, (bits.bit_length() + 7) // 8), "little")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _decode_bits(value: str):
+    raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+    bits = int.from_bytes(raw, "little")
+    position = 0
+    while bits:
+        if bits & 1:
+            yield position
+        bits >>= 1
+        position += 1
+
+
+def access_claims(user: User) -> dict:
+    """
+    Claims embedding `user`'s access in a token: permission and module
+    bitsets indexed by primary key, plus the version they were taken at.
+    """
+    version = permissions_version()
+    access = resolve_access(user)
+    catalog = _catalog(version)
+
+    # Superusers hold every permission; the flag alone says so.
+    permissions = () if access.is_superuser else access.permissions
+    return {
+        PERM_VERSION_CLAIM: version,
+        PERMISSIONS_CLAIM: _encode_bits(
+            pk for pk, name in catalog.permissions.items() if name in permissions
+        ),
+        MODULES_CLAIM: _encode_bits(
+            pk for pk, (code, _) in catalog.modules.items() if code in access.modules
+        ),
+        SUPERUSER_CLAIM: access.is_superuser,
+    }
+
+
+def token_access(token) -> UserAccess | None:
+    """
+    The access snapshot in a validated token, or None when it has none, it
+    was taken before the last permissions change or snapshots are not
+    trusted here (see snapshots_trusted()).
+    """
+    if token is None or not snapshots_trusted():
+        return None
+
+    access = getattr(token, _INSTANCE_ATTR, None)
+    if access is not None:
+        return access
+
+    try:
+        version = token[PERM_VERSION_CLAIM]
+        permission_bits = token[PERMISSIONS_CLAIM]
+        module_bits = token[MODULES_CLAIM]
+        is_superuser = bool(token[SUPERUSER_CLAIM])
+    except KeyError:
+        return None
+
+    if version != permissions_version():
+        return None
+
+    catalog = _catalog(version)
+    if is_superuser:
+        permissions = frozenset(catalog.permissions.values())
+    else:
+        permissions = frozenset(
+            catalog.permissions[pk]
+            for pk in _decode_bits(permission_bits)
+            if pk in catalog.permissions
+        )
+    modules = [catalog.modules[pk] for pk in _decode_bits(module_bits) if pk in catalog.modules]
+
+    access = UserAccess(
+        permissions=permissions,
+        modules=tuple(sorted(code for code, _ in modules)),
+        active_modules=frozenset(code for code, is_active in modules if is_active),
+        is_superuser=is_superuser,
+    )
+    setattr(token, _INSTANCE_ATTR, access)
+    return access
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.contrib.auth import get_user_model
+from django.utils.functional import SimpleLazyObject
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from services.account.permission_cache import is_active_user, token_access
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "TokenUser",
+    "TokenAccessAuthentication",
+)
+
+
+class TokenUser(SimpleLazyObject):
+    """
+    The authenticated user, loaded from the database only when a view reads
+    something the token does not carry.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, func, user_id):
+        super().__init__(func)
+        self.__dict__["_user_id"] = user_id
+
+    def __bool__(self):
+        return True
+
+    @property
+    def pk(self):
+        return self.__dict__["_user_id"]
+
+    @property
+    def id(self):
+        return self.__dict__["_user_id"]
+
+
+class TokenAccessAuthentication(JWTAuthentication):
+    """
+    JWT authentication that trusts the access snapshot in the token (see
+    TokenObtainPairSerializer) instead of looking the user up on every call.
+
+    Tokens without a current snapshot load the user straight away, which
+    also re-checks that the account is still active; trusted ones check it
+    through is_active_user().
+    """
+
+    def get_user(self, validated_token):
+        if token_access(validated_token) is None:
+            return super().get_user(validated_token)
+
+        # The claim is a string; views compare pk with integer foreign keys.
+        user_id = get_user_model()._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])
+        if not is_active_user(user_id):
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        # 🚀 Permission checks read the token; the user query runs only if used
+        return TokenUser(
+            lambda: super(TokenAccessAuthentication, self).get_user(validated_token),
+            user_id,
+        )
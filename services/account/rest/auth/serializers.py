@@ -3,10 +3,14 @@ from typing import TYPE_CHECKING
 from django.utils.translation import gettext_lazy as _
 import logging
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer as BaseTokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer as BaseTokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
 
 from services.account.models.user import User
+from services.account.permission_cache import access_claims
 
 if TYPE_CHECKING:
     pass
@@ -15,6 +19,7 @@ logger = logging.getLogger(__name__)
 
 __all__ = (
     "TokenObtainPairSerializer",
+    "TokenRefreshSerializer",
 )
 
 class TokenObtainPairSerializer(BaseTokenObtainPairSerializer):
@@ -24,10 +29,24 @@ class TokenObtainPairSerializer(BaseTokenObtainPairSerializer):
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
-        # You can add custom claims to the token here if needed
-        # For example: token['first_name'] = user.first_name
+        # Permission/module snapshot, so requests authorize without queries
+        token.payload.update(access_claims(user))
         return token
 
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    """
+    Issues access tokens with a fresh permission/module snapshot.
+    """
+    def validate(self, attrs):
+        data = super().validate(attrs)
+
+        access = AccessToken(data["access"])
+        user = User.objects.get(**{api_settings.USER_ID_FIELD: access[api_settings.USER_ID_CLAIM]})
+        access.payload.update(access_claims(user))
+        data["access"] = str(access)
+        return data
+
 class RegisterSerializer(serializers.ModelSerializer):
     """
     Serializer for user registration.
@@ -3,9 +3,8 @@ from typing import TYPE_CHECKING
 from django.utils.translation import gettext_lazy as _
 import logging
 from rest_framework import permissions
-from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from services.account.rest.user.serializers import ProfileSerializer
-from .serializers import TokenObtainPairSerializer
+from .serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework.permissions import AllowAny
 from rest_framework.decorators import api_view, permission_classes
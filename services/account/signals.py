@@ -0,0 +1,55 @@
+from django.contrib.auth.models import Permission
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from services.account.models.module import Module
+from services.account.models.role import Role
+from services.account.models.user import User
+from services.account.permission_cache import bump_permissions_version
+
+
+@receiver(m2m_changed, sender=Role.permissions.through)
+@receiver(m2m_changed, sender=Role.module.through)
+@receiver(m2m_changed, sender=User.roles.through)
+def invalidate_access_on_m2m(sender, instance, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_permissions_version()
+        # A user editing their own roles keeps using this instance.
+        instance.__dict__.pop("_access_cache", None)
+
+
+@receiver(post_delete, sender=Role)
+@receiver([post_save, post_delete], sender=Module)
+@receiver([post_save, post_delete], sender=Permission)
+@receiver(post_delete, sender=User)
+def invalidate_access(sender, **kwargs):
+    bump_permissions_version()
+
+
+# Access tokens skip loading the user while their snapshot is current, so a
+# deactivated user must make every snapshot stale.
+_TOKEN_USER_FIELDS = ("is_active", "is_superuser")
+_LOADED_ATTR = "_token_user_fields"
+
+
+def _token_user_values(instance):
+    # Deferred fields are not in __dict__; reading them would query.
+    return tuple(instance.__dict__.get(name) for name in _TOKEN_USER_FIELDS)
+
+
+@receiver(post_init, sender=User)
+def remember_token_user_fields(sender, instance, **kwargs):
+    instance.__dict__[_LOADED_ATTR] = _token_user_values(instance)
+
+
+@receiver(post_save, sender=User)
+def invalidate_access_on_user(sender, instance, created, update_fields=None, **kwargs):
+    values = _token_user_values(instance)
+    loaded = instance.__dict__.get(_LOADED_ATTR)
+    instance.__dict__[_LOADED_ATTR] = values
+    if created:
+        return
+    # A bump drops every user's snapshot and cached response: only when
+    # the flags tokens carry actually changed.
+    if values != loaded:
+        bump_permissions_version()
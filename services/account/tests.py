@@ -1,3 +1,74 @@
-from django.test import TestCase
+import tempfile
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from services.account.models.user import User
+from services.account.permission_cache import (
+    access_claims,
+    permissions_version,
+    token_access,
+)
+from services.account.rest.auth.authentication import TokenAccessAuthentication, TokenUser
+
+SHARED_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": tempfile.mkdtemp(prefix="account-tests-"),
+    }
+}
+LOCAL_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=SHARED_CACHE)
+class TokenSnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="staff", email="staff@example.com", password="x")
+        self.auth = TokenAccessAuthentication()
+
+    def token(self):
+        token = AccessToken.for_user(self.user)
+        token.payload.update(access_claims(self.user))
+        return self.auth.get_validated_token(str(token).encode())
+
+    def test_current_snapshot_skips_loading_the_user(self):
+        token = self.token()
+        with self.assertNumQueries(1):  # the cached is_active check only
+            user = self.auth.get_user(token)
+        self.assertIsInstance(user, TokenUser)
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_version_does_not_restart_after_the_cache_is_lost(self):
+        token = self.token()
+        cache.clear()
+        self.assertIsNone(token_access(token))
+
+    def test_deactivated_user_is_refused(self):
+        token = self.token()
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.get_user(token)
+
+    def test_saving_unrelated_fields_keeps_snapshots(self):
+        token = self.token()
+        version = permissions_version()
+        self.user.first_name = "Budi"
+        self.user.save()
+        self.assertEqual(permissions_version(), version)
+        self.assertIsNotNone(token_access(token))
+
+    def test_superuser_change_drops_snapshots(self):
+        token = self.token()
+        self.user.is_superuser = True
+        self.user.save()
+        self.assertIsNone(token_access(token))
+
+    @override_settings(CACHES=LOCAL_CACHE)
+    def test_per_process_cache_never_trusts_snapshots(self):
+        token = self.token()
+        self.assertIsNone(token_access(token))
+        self.assertIsInstance(self.auth.get_user(token), User)
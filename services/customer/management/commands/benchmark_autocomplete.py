@@ -0,0 +1,155 @@
+import random
+import statistics
+import string
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from services.customer.models.customer import Customer
+from services.customer.rest.customer.views import CustomerViewSet
+from services.printer.models.printer import Printer
+from services.product.models.product import Product
+from services.product.rest.product.views import ProductViewSet
+from services.store.models.store import Store
+from services.warehouse.models import Material
+from services.warehouse.rest.material.views import MaterialViewSet
+
+RESOURCES = (
+    ("customers", Customer, CustomerViewSet),
+    ("products", Product, ProductViewSet),
+    ("materials", Material, MaterialViewSet),
+)
+
+# p95 of an uncached autocomplete request, per keystroke
+TARGET_MS = 50
+
+
+def _word(rng, length):
+    return "".join(rng.choices(string.ascii_lowercase, k=length)).capitalize()
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the customer, product and material autocomplete endpoints per "
+        "prefix length, uncached, against the list endpoint they replaced "
+        "and a p95 target."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Insert this many synthetic rows per table first (e.g. 100000); they are rolled back afterwards.",
+        )
+        parser.add_argument("--lengths", type=int, nargs="+", default=[1, 2, 3, 5])
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--target-ms", type=float, default=TARGET_MS)
+        parser.add_argument("--random-seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.filter(is_superuser=True, is_active=True).first()
+        if user is None:
+            raise CommandError("An active superuser is needed to call the views.")
+
+        rng = random.Random(options["random_seed"])
+        with transaction.atomic():
+            if options["seed"]:
+                self.seed(rng, options["seed"])
+            failed = self.run(user, options)
+            # Never keep the synthetic rows.
+            transaction.set_rollback(True)
+
+        if failed:
+            self.stdout.write(self.style.WARNING(f"Over the {options['target_ms']:.0f} ms p95 target: {', '.join(failed)}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"All within the {options['target_ms']:.0f} ms p95 target."))
+
+    def seed(self, rng, rows):
+        printer = Printer.objects.create(name="BENCH printer")
+        store = Store.objects.create(name="BENCH store")
+        customers, products, materials = [], [], []
+        for i in range(rows):
+            name = f"{_word(rng, rng.randint(3, 9))} {_word(rng, rng.randint(3, 9))}"
+            customers.append(
+                Customer(
+                    identity=f"BENCH-{i:07d}",
+                    name=name,
+                    phone=f"08{rng.randrange(10**10):010d}",
+                    address="-",
+                    source="konveksi",
+                )
+            )
+            products.append(
+                Product(name=f"{name} {i}", sku=f"BENCH-{i:07d}", printer=printer, store=store)
+            )
+            materials.append(
+                Material(
+                    code=f"BENCH-{i:07d}",
+                    name=name,
+                    category=Material.CategoryChoices.KAIN,
+                    unit=Material.UnitChoices.ROLL,
+                )
+            )
+            if len(customers) == 5000:
+                self._flush(customers, products, materials)
+        self._flush(customers, products, materials)
+        self.stdout.write(f"Seeded {rows} customers, products and materials.")
+
+    def _flush(self, *batches):
+        for batch in batches:
+            if batch:
+                type(batch[0]).objects.bulk_create(batch)
+                batch.clear()
+
+    def run(self, user, options):
+        factory = APIRequestFactory()
+
+        def call(view, path, params):
+            request = factory.get(path, params)
+            force_authenticate(request, user=user)
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = view(request)
+                response.render()
+                elapsed = (time.perf_counter() - started) * 1000
+            if response.status_code != 200:
+                raise CommandError(f"{path} {params}: HTTP {response.status_code}")
+            return elapsed, len(queries)
+
+        def summary(timings, queries):
+            timings = sorted(timings)
+            p95 = timings[max(round(0.95 * len(timings)) - 1, 0)]
+            return p95, f"{statistics.median(timings):7.1f} {p95:7.1f} ms {queries:2d} q"
+
+        failed = []
+        header = f"{'resource':<10} {'rows':>8} {'prefix':>6}  {'autocomplete p50/p95':>24}  {'list ?search= p50/p95':>24}"
+        self.stdout.write(header)
+        for resource, model, viewset in RESOURCES:
+            autocomplete = viewset.as_view({"get": "prefix_autocomplete"})
+            listing = viewset.as_view({"get": "list"})
+            path = f"/api/{resource}/"
+            total = model.objects.count()
+            if not total:
+                self.stdout.write(f"{resource:<10} no rows")
+                continue
+
+            # Prefixes of random rows, taken from each matched field in turn
+            fields = viewset.autocomplete_fields
+            rows = model.objects.order_by("?").values_list(*fields)[: options["repeat"]]
+            values = [row[i % len(fields)] for i, row in enumerate(rows) if row[i % len(fields)]]
+            for length in options["lengths"]:
+                prefixes = [value[:length] for value in values]
+                done = [call(autocomplete, path, {"search": prefix}) for prefix in prefixes]
+                p95, cell = summary([ms for ms, _ in done], done[-1][1])
+                listed = [call(listing, path, {"search": prefix, "limit": 10}) for prefix in prefixes[:5]]
+                _, list_cell = summary([ms for ms, _ in listed], listed[-1][1])
+
+                self.stdout.write(f"{resource:<10} {total:>8} {length:>6}  {cell:>24}  {list_cell:>24}")
+                if p95 > options["target_ms"]:
+                    failed.append(f"{resource} prefix {length}")
+        return failed
@@ -47,8 +47,9 @@ class Customer(get_subid_model()):
         null=True,
         help_text=_("Auto-generated customer code, e.g., CUSTK-0001"),
     )
-    name = models.CharField(max_length=255)
-    phone = models.CharField(max_length=50)
+    # Indexed for autocomplete prefix lookups
+    name = models.CharField(max_length=255, db_index=True)
+    phone = models.CharField(max_length=50, db_index=True)
     address = models.TextField()
     source = models.CharField(
         max_length=20,
@@ -46,3 +46,6 @@ class CustomerViewSet(BaseViewSet):
         "autocomplete": CustomerSerializerSimple,
     }
     filterset_class = CustomerFilterSet
+    autocomplete_fields = ("name", "phone", "identity")
+    autocomplete_label_fields = ("name", "phone")
+    cache_tags = ("customer.customer",)
@@ -7,7 +7,8 @@ from .views import (
     TotalOrderView,
     TotalComplaintView,
     TotalCustomerDepositView,
-    TotalCustomerFixDepositView
+    TotalCustomerFixDepositView,
+    StageLatencyView,
 )
 
 urlpatterns = [
@@ -18,4 +19,5 @@ urlpatterns = [
     path("forecast-reminder/", ForecastEstimateReminderView.as_view()),
     path("total-customer-deposit/", TotalCustomerDepositView.as_view()),
     path("total-fix-customer-deposit/", TotalCustomerFixDepositView.as_view()),
+    path("stage-latency/", StageLatencyView.as_view()),
 ]
@@ -9,11 +9,13 @@ from datetime import datetime, time
 
 from django.utils import timezone
 from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from services.forecast.models import Forecast
+from services.dashboard.stage_latency import GROUP_FIELDS, stage_latency
+from services.forecast.models import Forecast, ForecastStageEvent
 from services.verification.models import QCFinishingDefect
 from services.order.models import Order
 from services.deposit.models import Deposit
@@ -106,30 +108,31 @@ class ForecastEstimateReminderView(APIView):
         days_limit = int(request.query_params.get("days", 3))
         search = request.query_params.get("search")
 
-        qs = Forecast.objects.filter(
-            estimate_sent__isnull=False,
-            estimate_sent__gte=today,
-            estimate_sent__lte=today + timedelta(days=days_limit),
+        # due_date covers stock, konveksi (Deposit.estimate_sent) and marketplace
+        qs = Forecast.objects.with_due_date().filter(
+            due_date__isnull=False,
+            due_date__gte=today,
+            due_date__lte=today + timedelta(days=days_limit),
         )
 
         # 🔍 search by forecast_number only
         if search:
             qs = qs.filter(forecast_number__icontains=search)
 
-        qs = qs.order_by("estimate_sent")
+        qs = qs.order_by("due_date")
 
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(qs, request)
 
         data = []
         for f in page:
-            remaining_days = (f.estimate_sent - today).days
+            remaining_days = (f.due_date - today).days
 
             data.append(
                 {
                     "pk": f.subid,
                     "forecast_number": f.forecast_number,
-                    "estimate_sent": f.estimate_sent,
+                    "estimate_sent": f.due_date,
                     "remaining_days": remaining_days,
                     "message": f"{remaining_days} Hari tersisa",
                 }
@@ -156,4 +159,43 @@ class TotalCustomerFixDepositView(APIView):
         qs = Deposit.objects.all().filter(paid_off_at__isnull=False)
         qs = apply_date_filter(qs, "paid_off_at", request)
 
-        return Response({"count": qs.count()})
\ No newline at end of file
+        return Response({"count": qs.count()})
+
+
+class StageLatencyView(APIView):
+    """
+    p50/p90 time forecasts wait in each workflow stage, from the stage
+    transitions logged between start_date and end_date.
+
+    Example:
+        ?start_date=2026-07-01&end_date=2026-07-31&group_by=printer,priority
+    """
+
+    required_module_code = "dashboard"
+    permission_classes = [IsAuthenticated, HasModulePermission]
+
+    def get(self, request):
+        group_by = [
+            name.strip()
+            for name in request.query_params.get("group_by", "").split(",")
+            if name.strip()
+        ]
+        unknown = [name for name in group_by if name not in GROUP_FIELDS]
+        if unknown:
+            raise ValidationError(
+                {"group_by": f"Unknown grouping {', '.join(unknown)}; use {', '.join(GROUP_FIELDS)}."}
+            )
+
+        # Whole days in local time, [start 00:00, end + 1 day 00:00)
+        events = ForecastStageEvent.objects.all()
+        start = parse_date(request.query_params.get("start_date") or "")
+        if start:
+            events = events.filter(at__gte=timezone.make_aware(datetime.combine(start, time.min)))
+        end = parse_date(request.query_params.get("end_date") or "")
+        if end:
+            events = events.filter(
+                at__lt=timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min))
+            )
+
+        return Response({"results": stage_latency(events, group_by)})
+
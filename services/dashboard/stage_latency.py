@@ -0,0 +1,81 @@
+"""
+Dwell-time percentiles per workflow stage, from ForecastStageEvent.
+
+One query streams the events' dwell times ordered by group and duration;
+each group's percentiles are read off by nearest rank as the stream passes,
+so only one group's durations are held at a time.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from itertools import groupby
+from operator import itemgetter
+
+from services.forecast.models.forecast import ForecastStage
+from services.printer.models.printer import Printer
+
+__all__ = (
+    "GROUP_FIELDS",
+    "PERCENTILES",
+    "percentile",
+    "stage_latency",
+)
+
+# ?group_by= names, on top of the stage
+GROUP_FIELDS = {
+    "printer": "printer_subid",
+    "priority": "priority_status",
+}
+
+PERCENTILES = (50, 90)
+
+
+def percentile(ordered, p: int):
+    """Nearest-rank percentile of an ascending sequence."""
+    return ordered[max(math.ceil(p / 100 * len(ordered)), 1) - 1]
+
+
+def stage_latency(events, group_by=()) -> list[dict]:
+    """
+    p50/p90 dwell seconds per stage waited in, further split by the
+    GROUP_FIELDS named in `group_by`. `events` is a ForecastStageEvent
+    queryset, e.g. filtered to a date range.
+    """
+    fields = ["from_stage", *(GROUP_FIELDS[name] for name in group_by)]
+    rows = (
+        events.filter(dwell_seconds__isnull=False)
+        .order_by(*fields, "dwell_seconds")
+        .values_list(*fields, "dwell_seconds")
+        .iterator(chunk_size=5000)
+    )
+
+    groups = []
+    for key, group in groupby(rows, key=itemgetter(*range(len(fields)))):
+        key = key if isinstance(key, tuple) else (key,)
+        durations = array("L", (row[-1] for row in group))
+        stats = {"count": len(durations)}
+        for p in PERCENTILES:
+            stats[f"p{p}_seconds"] = percentile(durations, p)
+        stats["max_seconds"] = durations[-1]
+        groups.append((dict(zip(fields, key)), stats))
+
+    printers = {}
+    if "printer" in group_by:
+        subids = {values["printer_subid"] for values, _ in groups} - {None}
+        printers = dict(Printer.objects.filter(subid__in=subids).values_list("subid", "name"))
+
+    results = []
+    for values, stats in groups:
+        stage = values["from_stage"]
+        result = {"stage": stage, "stage_label": ForecastStage(stage).label}
+        if "printer" in group_by:
+            subid = values["printer_subid"]
+            result["printer"] = {"subid": subid, "name": printers.get(subid)} if subid else None
+        if "priority" in group_by:
+            result["priority_status"] = values["priority_status"]
+        results.append({**result, **stats})
+
+    return results
+
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.common.workdays import add_working_days_bulk
+from services.deposit.models import Deposit
+
+
+class Command(BaseCommand):
+    help = "Backfill Deposit.estimate_sent from accepted_at and lead_time in chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every deposit, not only those missing estimate_sent.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+
+        qs = Deposit.objects.filter(accepted_at__isnull=False, lead_time__gt=0)
+        if not options["all"]:
+            qs = qs.filter(estimate_sent__isnull=True)
+
+        qs = qs.only("pk", "accepted_at", "lead_time", "estimate_sent").order_by("pk")
+
+        updated_count = 0
+        last_pk = 0
+
+        while True:
+            deposits = list(qs.filter(pk__gt=last_pk)[:chunk_size])
+            if not deposits:
+                break
+
+            due_dates = add_working_days_bulk(
+                deposit.get_estimate_sent_source() for deposit in deposits
+            )
+
+            changed = []
+            for deposit, due_date in zip(deposits, due_dates):
+                if deposit.estimate_sent != due_date:
+                    deposit.estimate_sent = due_date
+                    changed.append(deposit)
+
+            with transaction.atomic():
+                Deposit.objects.bulk_update(changed, ["estimate_sent"])
+
+            updated_count += len(changed)
+            last_pk = deposits[-1].pk
+
+            self.stdout.write(f"Processed up to pk={last_pk} ({updated_count} updated)")
+
+        self.stdout.write(self.style.SUCCESS(f"Done! Updated: {updated_count}"))
@@ -0,0 +1,86 @@
+import datetime
+import random
+import time
+
+import holidays
+from django.core.management.base import BaseCommand
+
+from core.common.workdays import add_working_days_bulk
+
+
+def _legacy_estimate_sent(accepted_at, lead_time):
+    """Per-row loop previously used by DepositListSerializer."""
+    id_holidays = holidays.country_holidays("ID", years=accepted_at.year)
+
+    current_date = accepted_at
+    days_added = 0
+
+    while days_added < lead_time:
+        current_date += datetime.timedelta(days=1)
+
+        if current_date.weekday() >= 5:
+            continue
+
+        if current_date in id_holidays:
+            continue
+
+        days_added += 1
+
+    return current_date
+
+
+class Command(BaseCommand):
+    help = "Benchmark estimate_sent computation per page for growing lead times."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--lead-times",
+            type=str,
+            default="5,30,90,180,365",
+            help="Comma separated lead times (working days) to benchmark.",
+        )
+
+    def _time(self, func, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best * 1000
+
+    def handle(self, *args, **options):
+        page_size = options["page_size"]
+        repeat = options["repeat"]
+        lead_times = [int(v) for v in options["lead_times"].split(",") if v]
+
+        rng = random.Random(0)
+        today = datetime.date.today()
+        starts = [
+            today - datetime.timedelta(days=rng.randint(0, 365))
+            for _ in range(page_size)
+        ]
+
+        # Warm the calendar so the numbers reflect steady state.
+        add_working_days_bulk([(today, max(lead_times))])
+
+        self.stdout.write(
+            f"{'lead_time':>10} {'legacy (ms)':>12} {'batched (ms)':>13}"
+        )
+
+        for lead_time in lead_times:
+            pairs = [(start, lead_time) for start in starts]
+
+            legacy = self._time(
+                lambda: [_legacy_estimate_sent(s, d) for s, d in pairs], repeat
+            )
+            batched = self._time(lambda: add_working_days_bulk(pairs), repeat)
+
+            if [_legacy_estimate_sent(s, d) for s, d in pairs] != add_working_days_bulk(pairs):
+                self.stdout.write(self.style.ERROR(f"Mismatch at lead_time={lead_time}"))
+
+            self.stdout.write(f"{lead_time:>10} {legacy:>12.2f} {batched:>13.2f}")
+
+        self.stdout.write(self.style.SUCCESS("Done!"))
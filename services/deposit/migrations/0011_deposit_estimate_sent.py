@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-17 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('deposit', '0010_deposit_pic'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='deposit',
+            name='estimate_sent',
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -4,9 +4,11 @@ import logging
 from typing import TYPE_CHECKING
 
 from django.db import models
+from django.utils import timezone
 
 # from django.utils.translation import gettext_lazy as _
 from core.common.models import get_subid_model
+from core.common.workdays import add_working_days
 from services.order.models import Order
 
 if TYPE_CHECKING:
@@ -61,6 +63,9 @@ class Deposit(get_subid_model()):
     created = models.DateTimeField(auto_now_add=True)
     updated = models.DateTimeField(auto_now=True)
     accepted_at = models.DateTimeField(blank=True, null=True)
+    # accepted_at + lead_time working days, recomputed by save(). Writers
+    # going through QuerySet.update()/bulk_update() have to set it too.
+    estimate_sent = models.DateField(blank=True, null=True, db_index=True)
     
     pic = models.CharField(max_length=200, blank=True, null=True)
 
@@ -79,6 +84,27 @@ class Deposit(get_subid_model()):
     def __str__(self):
         return f"Deposit {self.pk} - {self.customer} ({self.status})"
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"accepted_at", "lead_time"} & set(update_fields):
+            self.estimate_sent = self.compute_estimate_sent()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "estimate_sent"}
+        super().save(*args, **kwargs)
+
+    def get_estimate_sent_source(self):
+        accepted_at = self.accepted_at
+        if accepted_at and timezone.is_aware(accepted_at):
+            accepted_at = timezone.localtime(accepted_at)
+        return accepted_at, self.lead_time
+
+    def compute_estimate_sent(self):
+        return add_working_days(*self.get_estimate_sent_source())
+
+    def get_estimate_sent(self):
+        """Stored due date, computed on the fly for rows not backfilled yet."""
+        return self.estimate_sent or self.compute_estimate_sent()
+
     @property
     def is_reminder_one(self):
         return self.reminder_one is not None
@@ -16,9 +16,18 @@ class DepositFilterSet(django_filters.FilterSet):
     
     paid_off_at = django_filters.DateTimeFromToRangeFilter()
 
+    estimate_sent = django_filters.DateFromToRangeFilter()
+
     class Meta:
         model = Deposit
-        fields = ["order", "is_paid_off", "is_expired", "created_by", "paid_off_at"]
+        fields = [
+            "order",
+            "is_paid_off",
+            "is_expired",
+            "created_by",
+            "paid_off_at",
+            "estimate_sent",
+        ]
 
     def filter_is_expired(self, queryset, name, value):
         """
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-import datetime
-
 # from django.utils.translation import gettext_lazy as _
 import logging
 from typing import TYPE_CHECKING
 
-import holidays
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
 
-from core.common.serializers import BaseModelSerializer
+from core.common.response_cache import bump_tags
+from core.common.serializers import (
+    BaseModelSerializer,
+    DueDateListSerializer,
+    DueDateMixin,
+)
 from services.deposit.models.deposit import Deposit
 from services.order.models import Order, OrderItem
 from services.order.models.invoice import Invoice
@@ -21,7 +25,12 @@ from services.order.rest.order.serializers import (
     OrderItemListSerializer,
     OrderKonveksiListSerializer,
 )
-from services.order.rest.order.utils import get_dynamic_item_price, get_qty_value
+from services.order.rest.order.utils import (
+    build_order_items,
+    get_dynamic_item_prices,
+    get_qty_value,
+    sync_order_items,
+)
 from services.queue_entry.models import QueueEntry
 
 if TYPE_CHECKING:
@@ -120,32 +129,31 @@ class DepositCreateSerializer(BaseModelSerializer):
 
     # --- 4. New Helper methods for create/update ---
 
+    def validate_items(self, items_data):
+        """Price every item in one pass so tier errors surface as a 400."""
+        try:
+            prices = get_dynamic_item_prices(items_data)
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(e.messages)
+
+        for item_data, (final_price, _) in zip(items_data, prices):
+            item_data["price"] = final_price
+
+        return items_data
+
     def _create_order_items(self, order, deposit, items_data):
         """Helper to create order items."""
-        for item_data in items_data:
-            product = item_data["product"]
-            fabric_type = item_data["fabric_type"]
-            variant_type = item_data.get("variant_type")
-            qty = item_data["quantity"]
-
-            final_price, _ = get_dynamic_item_price(
-                product, fabric_type, variant_type, qty
-            )
-
-            OrderItem.objects.create(
-                order=order,
-                deposit=deposit,
-                product=product,
-                fabric_type=fabric_type,
-                variant_type=variant_type,
-                quantity=qty,
-                price=final_price,
-            )
+        OrderItem.objects.bulk_create(build_order_items(order, deposit, items_data))
+        bump_tags(OrderItem)
 
     def _create_extra_costs(self, order, deposit, extra_costs_data):
         """Helper to create extra costs."""
-        for extra_data in extra_costs_data:
-            OrderExtraCost.objects.create(order=order, deposit=deposit, **extra_data)
+        OrderExtraCost.objects.bulk_create(
+            [
+                OrderExtraCost(order=order, deposit=deposit, **extra_data)
+                for extra_data in extra_costs_data
+            ]
+        )
 
     def _create_discounts(self, order, deposit, discounts_data):
         """Helper to create extra costs."""
@@ -153,27 +161,35 @@ class DepositCreateSerializer(BaseModelSerializer):
             # change into negative if positive, if already negative do nothing
             if discount["amount"] > 0:
                 discount["amount"] = -discount["amount"]
-            OrderExtraCost.objects.create(order=order, deposit=deposit, **discount)
+
+        OrderExtraCost.objects.bulk_create(
+            [
+                OrderExtraCost(order=order, deposit=deposit, **discount)
+                for discount in discounts_data
+            ]
+        )
 
     def _update_order_items(self, instance, items_data):
-        """Helper to update order items (delete and recreate)."""
+        """Helper to update order items (diff by subid)."""
         if items_data is not None:
-            instance.items.all().delete()
-            self._create_order_items(instance, items_data)
+            sync_order_items(instance.items.all(), instance.order, instance, items_data)
 
     def _update_extra_costs(self, instance, extra_costs_data, discounts_data):
         """Helper to update extra costs (delete and recreate)."""
         if extra_costs_data is not None:
             instance.extra_costs.exclude(type="discount").delete()
-            self._create_extra_costs(instance, extra_costs_data)
+            self._create_extra_costs(instance.order, instance, extra_costs_data)
 
         if discounts_data is not None:
             instance.extra_costs.filter(type="discount").delete()
-            self._create_discounts(instance, discounts_data)
+            self._create_discounts(instance.order, instance, discounts_data)
 
     # --- End Helper methods ---
     #
     def to_representation(self, instance):
+        prefetch_related_objects(
+            [instance], "items__product", "items__fabric_type", "items__variant_type"
+        )
         data = super().to_representation(instance)
         extra_costs = instance.extra_costs.exclude(type="discount")
         discounts = instance.extra_costs.filter(type="discount")
@@ -197,11 +213,12 @@ class DepositCreateSerializer(BaseModelSerializer):
             order = validated_data.pop("order")
             items_data = validated_data.pop("items", [])
 
-            deposit = Deposit.objects.create(
+            deposit = Deposit(
                 order=order,
                 created_by=self.context["request"].user,
                 **validated_data,
             )
+            deposit.save()
 
             # --- Refactored: Use helper methods ---
             self._create_order_items(order, deposit, items_data)
@@ -263,6 +280,13 @@ class DepositCreateSerializer(BaseModelSerializer):
             
             print(validated_data.get("accepted_at"))
             
+            # --- Refactored: Use helper methods ---
+            # Update order items first so queue entries point at the final rows
+            self._update_order_items(instance, items_data)
+            # Update extra costs if provided
+            self._update_extra_costs(instance, extra_costs_data, discounts_data)
+            # --- End Refactored ---
+
             order_items = instance.items.all()
 
             if validated_data.get("accepted_at"):
@@ -277,13 +301,6 @@ class DepositCreateSerializer(BaseModelSerializer):
                         },
                     )
 
-            # --- Refactored: Use helper methods ---
-            # Update order items if provided
-            self._update_order_items(instance, items_data)
-            # Update extra costs if provided
-            self._update_extra_costs(instance, extra_costs_data, discounts_data)
-            # --- End Refactored ---
-
             # # Update invoice if exists
             # invoice = getattr(instance, "invoice", None)
             # if invoice:
@@ -347,7 +364,9 @@ class DepositItemListSerializer(
         return variant_type.unit.upper() if variant_type and variant_type.unit else None
 
 
-class DepositListSerializer(FloatToIntRepresentationMixin, BaseModelSerializer):
+class DepositListSerializer(
+    DueDateMixin, FloatToIntRepresentationMixin, BaseModelSerializer
+):
     order = OrderKonveksiListSerializer(read_only=True)
     invoice = serializers.SerializerMethodField()
     invoice_deposit = serializers.SerializerMethodField()
@@ -389,42 +408,31 @@ class DepositListSerializer(FloatToIntRepresentationMixin, BaseModelSerializer):
             "estimate_sent",
             "pic",
         ]
+        list_serializer_class = DueDateListSerializer
 
+    # The list view prefetches these into `*_list` attributes (see
+    # DepositViewSet.get_queryset); fall back to a query otherwise.
     def get_extra_costs(self, obj):
-        qs = obj.extra_costs.exclude(type="discount")
+        qs = getattr(obj, "extra_cost_list", None)
+        if qs is None:
+            qs = obj.extra_costs.exclude(type="discount")
         return OrderExtraCostSerializer(qs, many=True).data
 
     def get_discounts(self, obj):
-        qs = obj.extra_costs.filter(type="discount")
+        qs = getattr(obj, "discount_list", None)
+        if qs is None:
+            qs = obj.extra_costs.filter(type="discount")
         return OrderExtraCostSerializer(qs, many=True).data
 
-    def get_estimate_sent(self, obj):
-        accepted_at = getattr(obj, "accepted_at", None)
-        lead_time = getattr(obj, "lead_time", 0)
-
-        if not accepted_at or not lead_time:
-            return None
-
-        # Use Indonesian public holidays
-        id_holidays = holidays.country_holidays("ID", years=accepted_at.year)
-
-        current_date = accepted_at
-        days_added = 0
-
-        while days_added < lead_time:
-            current_date += datetime.timedelta(days=1)
+    def get_due_date_source(self, obj):
+        # Rows with a stored estimate_sent don't need to be computed
+        if obj.estimate_sent:
+            return None, 0
+        return obj.get_estimate_sent_source()
 
-            # Skip weekends (Saturday=5, Sunday=6)
-            if current_date.weekday() >= 5:
-                continue
-
-            # Skip Indonesian holidays
-            if current_date in id_holidays:
-                continue
-
-            days_added += 1
-
-        return current_date.strftime("%Y-%m-%d")
+    def get_estimate_sent(self, obj):
+        due_date = obj.estimate_sent or self.resolve_due_date(obj)
+        return due_date.strftime("%Y-%m-%d") if due_date else None
 
     # to_representation is now handled by FloatToIntRepresentationMixin
     def get_detail_order(self, obj):
@@ -434,8 +442,8 @@ class DepositListSerializer(FloatToIntRepresentationMixin, BaseModelSerializer):
             "3 ATASAN + 2 STEL"
             "3 + 2 ATASAN"  (if some variant_type are null)
         """
-        items = OrderItem.objects.filter(order=obj.order)
-        if not items.exists():
+        items = obj.order.items.all()
+        if not items:
             return None  # return None instead of ""
 
         parts = []
@@ -473,8 +481,12 @@ class DepositListSerializer(FloatToIntRepresentationMixin, BaseModelSerializer):
                 - 2 STEL (2x multiplier)
             Result = (3×1) + (2×2) = 7
         """
-        items = OrderItem.objects.filter(order=obj.order)
-        if not items.exists():
+        weighted_qty = getattr(obj, "weighted_qty", None)
+        if weighted_qty is not None:
+            return weighted_qty
+
+        items = obj.order.items.all()
+        if not items:
             return 0
 
         total_qty = 0
@@ -488,12 +500,20 @@ class DepositListSerializer(FloatToIntRepresentationMixin, BaseModelSerializer):
 
         return total_qty
     
+    def _get_invoice(self, obj, is_deposit_invoice):
+        prefetched = getattr(
+            obj, "deposit_invoice_list" if is_deposit_invoice else "invoice_list", None
+        )
+        if prefetched is not None:
+            return prefetched[0] if prefetched else None
+        return obj.invoice.filter(is_deposit_invoice=is_deposit_invoice).first()
+
     def get_invoice(self, obj):
-        invoice = obj.invoice.filter(is_deposit_invoice=False).first()
+        invoice = self._get_invoice(obj, is_deposit_invoice=False)
         return InvoiceSummarySerializer(invoice, context=self.context).data if invoice else None
 
     def get_invoice_deposit(self, obj):
-        invoice = obj.invoice.filter(is_deposit_invoice=True).first()
+        invoice = self._get_invoice(obj, is_deposit_invoice=True)
         return InvoiceSummarySerializer(invoice, context=self.context).data if invoice else None
 
 
@@ -1,42 +1,44 @@
 from __future__ import annotations
 
 import logging
-import os
-from decimal import Decimal
-from io import BytesIO
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.http import HttpResponse
-from django.utils.translation import gettext_lazy as _
-
-# Report lab
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import mm
-from reportlab.platypus import (
-    Image,
-    Paragraph,
-    SimpleDocTemplate,
-    Spacer,
-    Table,
-    TableStyle,
+from django.db.models import (
+    Case,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    Prefetch,
+    Subquery,
+    Sum,
+    Value,
+    When,
 )
+from django.db.models.functions import Coalesce
+from django.utils.translation import gettext_lazy as _
 from rest_framework import status
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 
+from core.common.pdf import cached_pdf_response, pdf_cache_key
 from core.common.viewsets import BaseViewSet
-from core.media import media_to_path
 from services.deposit.models import Deposit
+from services.deposit.rest.deposit.pdf import (
+    INVOICE_PDF_VERSION,
+    invoice_cache_parts,
+    render_invoice_deposit_pdf,
+    render_invoice_pdf,
+)
 from services.deposit.rest.deposit.filtersets import DepositFilterSet
 from services.deposit.rest.deposit.serializers import (
     DepositCreateSerializer,
     DepositDetailSerializer,
     DepositListSerializer,
 )
+from services.forecast.models import Forecast
+from services.order.models import Order, OrderExtraCost, OrderForm, OrderItem
 from services.order.models.invoice import Invoice
 
 if TYPE_CHECKING:
@@ -71,12 +73,91 @@ class DepositViewSet(BaseViewSet):
         # "invoice__invoice_no",
         "pic",
     ]
+    ordering_fields = ["created", "estimate_sent"]
+    # Read by the forecast_exists/order_form_exists annotations. Only feeds
+    # the list ETag: deposit responses are not cached.
+    cache_tags = ("forecast.forecast", "order.orderform")
+    cache_actions = ()
     serializer_map = {
         "create": DepositCreateSerializer,
         "partial_update": DepositCreateSerializer,
         "update": DepositCreateSerializer,
     }
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        if self.action not in ("list", "retrieve"):
+            return queryset
+
+        # 🚀 PREVENT N+1: every DepositListSerializer field reads from these caches
+        order_items = (
+            OrderItem.objects.select_related("product", "fabric_type", "variant_type")
+            .prefetch_related("variant_type__fabric_prices")
+            .annotate(
+                forecast_exists=Exists(Forecast.objects.filter(order_item=OuterRef("pk"))),
+                order_form_exists=Exists(OrderForm.objects.filter(order_item=OuterRef("pk"))),
+            )
+        )
+
+        # Same weighting as get_qty_value(): weight 0 counts as 1
+        weighted_qty = (
+            OrderItem.objects.filter(order=OuterRef("order"))
+            .values("order")
+            .annotate(
+                total=Sum(
+                    Case(
+                        When(
+                            variant_type__weight__gt=0,
+                            then=F("quantity") * F("variant_type__weight"),
+                        ),
+                        default=F("quantity"),
+                        output_field=IntegerField(),
+                    )
+                )
+            )
+            .values("total")
+        )
+
+        invoices = Invoice.objects.select_related("deposit").prefetch_related(
+            "order__items", "order__extra_costs"
+        )
+
+        # Replace the default select/prefetch with the page-wide ones below
+        queryset = queryset.select_related(None).prefetch_related(None)
+
+        return queryset.annotate(
+            weighted_qty=Coalesce(Subquery(weighted_qty), Value(0)),
+        ).prefetch_related(
+            Prefetch(
+                "order",
+                queryset=Order.objects.select_related("customer")
+                .annotate(deposit_exists=Value(True))
+                .prefetch_related(Prefetch("items", queryset=order_items)),
+            ),
+            Prefetch("items", queryset=order_items),
+            Prefetch(
+                "invoice",
+                queryset=invoices.filter(is_deposit_invoice=False),
+                to_attr="invoice_list",
+            ),
+            Prefetch(
+                "invoice",
+                queryset=invoices.filter(is_deposit_invoice=True),
+                to_attr="deposit_invoice_list",
+            ),
+            Prefetch(
+                "extra_costs",
+                queryset=OrderExtraCost.objects.exclude(type="discount"),
+                to_attr="extra_cost_list",
+            ),
+            Prefetch(
+                "extra_costs",
+                queryset=OrderExtraCost.objects.filter(type="discount"),
+                to_attr="discount_list",
+            ),
+        )
+
     def create(self, request, *args, **kwargs):
         order_subid = request.data.get("order")
 
@@ -124,729 +205,31 @@ class DepositViewSet(BaseViewSet):
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
     def generate_invoice_pdf(self, request, subid):
-        invoice = get_object_or_404(Invoice, subid=subid)
-        order = invoice.order
-
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=0 * mm,
-            leftMargin=0 * mm,
-            topMargin=-3.5 * mm,
-            bottomMargin=20 * mm,
-        )
-        elements = []
-
-        # --- STYLES & COLORS ---
-        styles = getSampleStyleSheet()
-        styles.add(ParagraphStyle(name="Bold", fontName="Helvetica-Bold", fontSize=10))
-        styles.add(ParagraphStyle(name="Small", fontSize=8, parent=styles["Normal"]))
-        styles.add(
-            ParagraphStyle(name="Right", alignment=TA_RIGHT, parent=styles["Normal"])
-        )
-        styles.add(
-            ParagraphStyle(
-                name="RightBold",
-                alignment=TA_RIGHT,
-                fontName="Helvetica-Bold",
-                fontSize=10,
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="LeftBold",
-                alignment=TA_LEFT,
-                fontName="Helvetica-Bold",
-                fontSize=10,
-            )
-        )
-
-        TARGET_BLUE = colors.HexColor("#EAD548")
-
-        # --- 1. HEADER (Logo, Bill To, Invoice Info) ---
-
-        # Logo
-        logo_path = media_to_path("media/ez_full.png")  # Corrected path
-        logo_image = None
-        try:
-            if os.path.exists(logo_path):
-                logo_image = Image(
-                    logo_path, width=50 * mm, height=7 * mm, hAlign="LEFT"
-                )
-            else:
-                print(f"⚠️ Logo not found at {logo_path}")
-                logo_image = Paragraph("<b>Graphics Family</b>", styles["Bold"])
-        except Exception:
-            logo_image = Paragraph("<b>Graphics Family</b>", styles["Bold"])
-
-        # Bill To
-        bill_to = [
-            Spacer(1, 28 * mm),
-            logo_image,
-            Spacer(1, 5 * mm),
-            Paragraph("<b>Invoice To</b>", styles["Bold"]),
-            Paragraph(
-                f"{order.convection_name}", styles["Normal"]
-            ),  # Placeholder from image
-            Paragraph(f"{order.customer.address}", styles["Normal"]),  # Placeholder
-            Paragraph(f"{order.customer.phone}", styles["Normal"]),  # Placeholder
-            # Paragraph(f"M: {order.customer.email}", styles["Normal"]),  # Placeholder
-        ]
-
-        # Invoice Info (Right Side)
-        invoice_title_table = Table(
-            [["INVOICE"]], colWidths=[60 * mm], rowHeights=[40 * mm]
-        )
-        invoice_title_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, -1), TARGET_BLUE),
-                    ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
-                    ("FONTNAME", (0, 0), (-1, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 35),
-                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                    ("VALIGN", (0, 0), (-1, -1), "BOTTOM"),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 35),
-                ]
-            )
+        invoice = get_object_or_404(
+            Invoice.objects.select_related("order__customer", "deposit"), subid=subid
         )
 
-        invoice_details_data = [
-            ["Invoice", f": {invoice.invoice_no}"],
-            # ["Account", ": 000 123 456 789"],  # Placeholder from image
-            ["Date", f": {invoice.issued_date.strftime('%d %b %Y')}"],
-        ]
-        invoice_details_table = Table(
-            invoice_details_data,
-            colWidths=[20 * mm, 40 * mm],
-            style=[("FONTNAME", (0, 0), (-1, -1), "Helvetica")],
+        return cached_pdf_response(
+            request,
+            namespace="invoice",
+            object_id=invoice.subid,
+            key=pdf_cache_key(INVOICE_PDF_VERSION, "invoice", invoice_cache_parts(invoice)),
+            render=lambda: render_invoice_pdf(invoice),
+            filename=f"{invoice.invoice_no}.pdf",
         )
 
-        invoice_info = [
-            invoice_title_table,
-            Spacer(1, 5 * mm),
-            invoice_details_table,
-        ]
-
-        # Combine Header
-        header_table = Table(
-            [[bill_to, invoice_info]],
-            colWidths=[105 * mm, 105 * mm],
-            style=[("VALIGN", (0, 0), (-1, -1), "TOP")],
-        )
-
-        # Add padding to the entire header block
-        header_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    # background for entire header
-                    ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#FAFAFA")),
-                    # global padding
-                    ("LEFTPADDING", (0, 0), (-1, -1), 65),  # left padding 10px
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 65),  # right padding 10px
-                    ("TOPPADDING", (0, 0), (-1, -1), 0),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 20),
-                    # optional border
-                    ("BOX", (0, 0), (-1, -1), 0.5, colors.HexColor("#FAFAFA")),
-                ]
-            )
-        )
-        elements.append(header_table)
-        elements.append(Spacer(1, 10 * mm))
-
-        # --- 2. ITEM TABLE ---
-        item_data = [
-            [
-                Paragraph("<b>NO</b>", styles["Bold"]),
-                Paragraph("<b>ITEM DESCRIPTION</b>", styles["Bold"]),
-                Paragraph("<b>PRICE</b>", styles["RightBold"]),
-                Paragraph("<b>QTY</b>", styles["RightBold"]),
-                Paragraph("<b>TOTAL</b>", styles["RightBold"]),
-            ]
-        ]
-        total_invoice = Decimal("0.00")
-        total_extra_cost = Decimal("0.00")
-
-        # Add Order Items
-        for i, item in enumerate(order.items.all(), start=1):
-            subtotal = item.subtotal
-            total_invoice += subtotal
-
-            product = getattr(item, "product", None)
-            product_name = getattr(product, "name", "-")
-            variant_type = getattr(item, "variant_type", None)
-            variant_code = getattr(variant_type, "code", None)
-
-            display_name = (
-                f"{variant_code} - {product_name}" if variant_code else product_name
-            )
-
-            # Cell with main description and sub-description
-            item_description_cell = [
-                Paragraph(display_name, styles["Bold"]),
-                Paragraph(item.fabric_type.name, styles["Small"]),
-            ]
-
-            item_data.append(
-                [
-                    str(i),
-                    item_description_cell,
-                    Paragraph(f"Rp {item.price:,.0f}", styles["Right"]),
-                    Paragraph(str(item.quantity), styles["Right"]),
-                    Paragraph(f"Rp {subtotal:,.0f}", styles["Right"]),
-                ]
-            )
-
-        # Add Extra Costs
-        for i, cost in enumerate(order.extra_costs.all(), start=len(item_data)):
-            total_extra_cost += cost.total_amount
-
-            # Calculate unit price if possible, handle division by zero
-            unit_price = Decimal("0.00")
-            if cost.quantity:
-                unit_price = cost.total_amount / cost.quantity
-
-            item_description_cell = [
-                Paragraph(cost.description, styles["Bold"]),
-                Paragraph("Biaya Tambahan", styles["Small"]),
-            ]
-
-            item_data.append(
-                [
-                    str(i),
-                    item_description_cell,
-                    Paragraph(f"Rp {unit_price:,.0f}", styles["Right"]),
-                    Paragraph(str(cost.quantity), styles["Right"]),
-                    Paragraph(f"Rp {cost.total_amount:,.0f}", styles["Right"]),
-                ]
-            )
-
-        item_table = Table(
-            item_data,
-            colWidths=[10 * mm, 80 * mm, 30 * mm, 15 * mm, 30 * mm],
-            repeatRows=1,
-        )
-        item_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), TARGET_BLUE),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("VALIGN", (0, 1), (-1, -1), "TOP"),
-                    ("LINEBELOW", (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                    # Outer left border
-                    ("LINEBEFORE", (0, 0), (0, -1), 0.5, colors.lightgrey),
-                    # Inner vertical dividers
-                    ("LINEBEFORE", (1, 0), (1, -1), 0.5, colors.lightgrey),
-                    ("LINEBEFORE", (2, 0), (2, -1), 0.5, colors.lightgrey),
-                    ("LINEBEFORE", (3, 0), (3, -1), 0.5, colors.lightgrey),
-                    ("LINEBEFORE", (4, 0), (4, -1), 0.5, colors.lightgrey),
-                    # Outer right border
-                    ("LINEAFTER", (4, 0), (4, -1), 0.5, colors.lightgrey),
-                    ("ALIGN", (0, 0), (-1, 0), "LEFT"),
-                    ("ALIGN", (2, 0), (-1, 0), "RIGHT"),
-                ]
-            )
-        )
-        elements.append(item_table)
-        elements.append(Spacer(1, 5 * mm))
-
-        # --- 3. TOTALS ---
-        sub_total = total_invoice + total_extra_cost
-        # vat_rate = Decimal("0.15")  # 15% VAT from image
-        # tax = sub_total * vat_rate
-        tax = 0
-        deposit_amount = invoice.deposit.deposit_amount
-        grand_total = sub_total - deposit_amount
-
-        totals_data = [
-            ["SUB TOTAL", f"Rp {sub_total:,.0f}"],
-            ["Deposit", f"Rp -{deposit_amount:,.0f}"],
-            [
-                Paragraph("<b>GRAND TOTAL</b>", styles["RightBold"]),
-                Paragraph(f"<b>Rp {grand_total:,.0f}</b>", styles["RightBold"]),
-            ],
-        ]
-
-        totals_table = Table(totals_data, colWidths=[45 * mm, 30 * mm])
-        totals_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (-1, -1), "RIGHT"),
-                    ("TOPPADDING", (0, 0), (-1, -1), 2),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-                    (
-                        "LINEABOVE",
-                        (0, 2),
-                        (1, 2),
-                        1,
-                        colors.black,
-                    ),  # Line above grand total
-                    ("TOPPADDING", (0, 2), (1, 2), 5),
-                ]
-            )
-        )
-        totals_table.hAlign = "RIGHT"
-        # ---- RIGHT MARGIN WRAPPER (65 mm) ----
-        totals_wrapper = Table(
-            [[Spacer(1, 1), totals_table]],
-            colWidths=[87 * mm, 75 * mm],  # 65mm margin, rest for totals
-        )
-        totals_wrapper.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ]
-            )
-        )
-
-        elements.append(totals_wrapper)
-        elements.append(Spacer(1, 10 * mm))
-
-        # # --- 4. FOOTER (Payment, Terms, Signature) ---
-        # payment_info = [
-        #     Paragraph("<b>PAYMENT INFO</b>", styles["Bold"]),
-        #     Paragraph("Paypal: paypal@company.com", styles["Small"]),
-        #     Paragraph("Payonner: info@company.com", styles["Small"]),
-        # ]
-
-        # terms = [
-        #     Paragraph("<b>TERMS & CONDITIONS</b>", styles["Bold"]),
-        #     Paragraph(
-        #         "Lorem ipsum dolor sit amet, consectetuer adipiscing elit, sed diam nonummy nibh euismod.",
-        #         styles["Small"],
-        #     ),
-        # ]
-
-        # signature = [
-        #     # You could place an Image of a signature here
-        #     Paragraph("<i>Adi Barbu</i>", styles["Normal"]),
-        #     Spacer(1, 3 * mm),
-        #     Paragraph("CEO. ADI BARBU", styles["Small"]),
-        # ]
-
-        # footer_table = Table(
-        #     [[payment_info, terms, signature]], colWidths=[60 * mm, 60 * mm, 50 * mm]
-        # )
-        # footer_table.setStyle(
-        #     [
-        #         ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        #         ("ALIGN", (2, 0), (2, 0), "LEFT"),  # Align signature
-        #     ]
-        # )
-        # elements.append(footer_table)
-        # elements.append(Spacer(1, 15 * mm))  # Space before page bottom
-
-        # --- 5. PAGE BOTTOM (Contact Info) ---
-        # This will appear at the end of the content.
-        logo_path = media_to_path("media/ez.png")  # Corrected path
-        logo_image = None
-        try:
-            if os.path.exists(logo_path):
-                # ori is 170x78px
-                logo_image = Image(
-                    logo_path, width=11 * mm, height=7 * mm, hAlign="LEFT"
-                )
-            else:
-                print(f"⚠️ Logo not found at {logo_path}")
-                logo_image = Paragraph("<b>Graphics Family</b>", styles["Bold"])
-        except Exception:
-            logo_image = Paragraph("<b>Graphics Family</b>", styles["Bold"])
-        contact_logo = [
-            logo_image,
-        ]  # Placeholder for logo
-        contact_addr = [
-            Paragraph(
-                "Jl. Kepatihan Industri No. 18/C-05, Gresik - Jawa Timur",
-                styles["Small"],
-            ),
-            # Paragraph("Your Street No. 223 NY USA", styles["Small"]),
-        ]
-        # contact_phone = [
-        #     Paragraph("+00 123 456 789", styles["Small"]),
-        #     Paragraph("+00 123 456 789", styles["Small"]),
-        # ]
-        ig_logo = Image("media/ig.png", width=6 * mm, height=6 * mm)
-        tt_logo = Image("media/tiktok.png", width=6 * mm, height=6 * mm)
-        contact_web = [
-            [ig_logo, Paragraph("@ezsportswear", styles["Small"])],
-            [tt_logo, Paragraph("@ezsportswear2", styles["Small"])],
-        ]
-
-        contact_web_table = Table(contact_web, colWidths=[6 * mm, 30 * mm])
-        contact_web_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 2),
-                ]
-            )
-        )
-
-        contact_table = Table(
-            # [[contact_logo, contact_addr, contact_phone, contact_web]],
-            [[contact_logo, contact_addr, contact_web_table]],
-            # colWidths=[20 * mm, 65 * mm, 45 * mm, 40 * mm],
-            colWidths=[20 * mm, 110 * mm, 40 * mm],
-        )
-
-        contact_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    # ALTERNATIVE: This draws all internal lines
-                    ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.gray),
-                    ("LEFTPADDING", (1, 0), (3, 0), 5 * mm),
-                ]
-            )
-        )
-        elements.append(contact_table)
-
-        # --- BUILD ---
-        doc.build(elements)
-
-        pdf = buffer.getvalue()
-        buffer.close()
-        response = HttpResponse(pdf, content_type="application/pdf")
-        response["Content-Disposition"] = f'inline; filename="{invoice.invoice_no}.pdf"'
-        return response
-    
     def generate_invoice_deposit_pdf(self, request, subid):
-        invoice = get_object_or_404(Invoice, subid=subid)
-        order = invoice.order
-
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=0 * mm,
-            leftMargin=0 * mm,
-            topMargin=-3.5 * mm,
-            bottomMargin=20 * mm,
-        )
-        elements = []
-
-        # --- STYLES & COLORS ---
-        styles = getSampleStyleSheet()
-        styles.add(ParagraphStyle(name="Bold", fontName="Helvetica-Bold", fontSize=10))
-        styles.add(ParagraphStyle(name="Small", fontSize=8, parent=styles["Normal"]))
-        styles.add(
-            ParagraphStyle(name="Right", alignment=TA_RIGHT, parent=styles["Normal"])
+        invoice = get_object_or_404(
+            Invoice.objects.select_related("order__customer", "deposit"), subid=subid
         )
-        styles.add(
-            ParagraphStyle(
-                name="RightBold",
-                alignment=TA_RIGHT,
-                fontName="Helvetica-Bold",
-                fontSize=10,
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="LeftBold",
-                alignment=TA_LEFT,
-                fontName="Helvetica-Bold",
-                fontSize=10,
-            )
-        )
-
-        TARGET_BLUE = colors.HexColor("#EAD548")
-
-        # --- 1. HEADER (Logo, Bill To, Invoice Info) ---
-
-        # Logo
-        logo_path = media_to_path("media/ez_full.png")  # Corrected path
-        logo_image = None
-        try:
-            if os.path.exists(logo_path):
-                logo_image = Image(
-                    logo_path, width=50 * mm, height=7 * mm, hAlign="LEFT"
-                )
-            else:
-                print(f"⚠️ Logo not found at {logo_path}")
-                logo_image = Paragraph("<b>Graphics Family</b>", styles["Bold"])
-        except Exception:
-            logo_image = Paragraph("<b>Graphics Family</b>", styles["Bold"])
-
-        # Bill To
-        bill_to = [
-            Spacer(1, 28 * mm),
-            logo_image,
-            Spacer(1, 5 * mm),
-            Paragraph("<b>Invoice To</b>", styles["Bold"]),
-            Paragraph(
-                f"{order.convection_name}", styles["Normal"]
-            ),  # Placeholder from image
-            Paragraph(f"{order.customer.address}", styles["Normal"]),  # Placeholder
-            Paragraph(f"{order.customer.phone}", styles["Normal"]),  # Placeholder
-            # Paragraph(f"M: {order.customer.email}", styles["Normal"]),  # Placeholder
-        ]
 
-        # Invoice Info (Right Side)
-        invoice_title_table = Table(
-            [["INVOICE"]], colWidths=[60 * mm], rowHeights=[40 * mm]
-        )
-        invoice_title_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, -1), TARGET_BLUE),
-                    ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
-                    ("FONTNAME", (0, 0), (-1, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 35),
-                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                    ("VALIGN", (0, 0), (-1, -1), "BOTTOM"),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 35),
-                ]
-            )
-        )
-
-        invoice_details_data = [
-            ["Invoice", f": {invoice.invoice_no}"],
-            # ["Account", ": 000 123 456 789"],  # Placeholder from image
-            ["Date", f": {invoice.issued_date.strftime('%d %b %Y')}"],
-        ]
-        invoice_details_table = Table(
-            invoice_details_data,
-            colWidths=[20 * mm, 40 * mm],
-            style=[("FONTNAME", (0, 0), (-1, -1), "Helvetica")],
-        )
-
-        invoice_info = [
-            invoice_title_table,
-            Spacer(1, 5 * mm),
-            invoice_details_table,
-        ]
-
-        # Combine Header
-        header_table = Table(
-            [[bill_to, invoice_info]],
-            colWidths=[105 * mm, 105 * mm],
-            style=[("VALIGN", (0, 0), (-1, -1), "TOP")],
-        )
-
-        # Add padding to the entire header block
-        header_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    # background for entire header
-                    ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#FAFAFA")),
-                    # global padding
-                    ("LEFTPADDING", (0, 0), (-1, -1), 65),  # left padding 10px
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 65),  # right padding 10px
-                    ("TOPPADDING", (0, 0), (-1, -1), 0),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 20),
-                    # optional border
-                    ("BOX", (0, 0), (-1, -1), 0.5, colors.HexColor("#FAFAFA")),
-                ]
-            )
-        )
-        elements.append(header_table)
-        elements.append(Spacer(1, 10 * mm))
-        
-        deposit_amount = invoice.deposit.deposit_amount
-
-        # --- 2. ITEM TABLE ---
-        item_data = [
-            [
-                Paragraph("<b>NO</b>", styles["Bold"]),
-                Paragraph("<b>ITEM DESCRIPTION</b>", styles["Bold"]),
-                Paragraph("<b>PRICE</b>", styles["RightBold"]),
-                Paragraph("<b>QTY</b>", styles["RightBold"]),
-                Paragraph("<b>TOTAL</b>", styles["RightBold"]),
-            ],
-            [
-                "1",
-                Paragraph("Deposit", styles["Bold"]),
-                Paragraph(f"Rp {deposit_amount:,.0f}", styles["Right"]),
-                Paragraph("1", styles["Right"]),
-                Paragraph(f"Rp {deposit_amount:,.0f}", styles["Right"]),
-            ],
-        ]
-
-        item_table = Table(
-            item_data,
-            colWidths=[10 * mm, 80 * mm, 30 * mm, 15 * mm, 30 * mm],
-            repeatRows=1,
-        )
-        item_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), TARGET_BLUE),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("VALIGN", (0, 1), (-1, -1), "TOP"),
-                    ("LINEBELOW", (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                    # Outer left border
-                    ("LINEBEFORE", (0, 0), (0, -1), 0.5, colors.lightgrey),
-                    # Inner vertical dividers
-                    ("LINEBEFORE", (1, 0), (1, -1), 0.5, colors.lightgrey),
-                    ("LINEBEFORE", (2, 0), (2, -1), 0.5, colors.lightgrey),
-                    ("LINEBEFORE", (3, 0), (3, -1), 0.5, colors.lightgrey),
-                    ("LINEBEFORE", (4, 0), (4, -1), 0.5, colors.lightgrey),
-                    # Outer right border
-                    ("LINEAFTER", (4, 0), (4, -1), 0.5, colors.lightgrey),
-                    ("ALIGN", (0, 0), (-1, 0), "LEFT"),
-                    ("ALIGN", (2, 0), (-1, 0), "RIGHT"),
-                ]
-            )
-        )
-        elements.append(item_table)
-        elements.append(Spacer(1, 5 * mm))
-
-        # --- 3. TOTALS ---
-        deposit_amount = invoice.deposit.deposit_amount
-
-        sub_total = deposit_amount
-        grand_total = deposit_amount
-
-        totals_data = [
-            ["SUB TOTAL", f"Rp {sub_total:,.0f}"],
-            [
-                Paragraph("<b>GRAND TOTAL</b>", styles["RightBold"]),
-                Paragraph(f"<b>Rp {grand_total:,.0f}</b>", styles["RightBold"]),
-            ],
-        ]
-
-        totals_table = Table(totals_data, colWidths=[45 * mm, 30 * mm])
-        totals_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (-1, -1), "RIGHT"),
-                    ("TOPPADDING", (0, 0), (-1, -1), 2),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-                    ("LINEABOVE", (0, 1), (1, 1), 1, colors.black),
-                    ("TOPPADDING", (0, 1), (1, 1), 5),
-                ]
-            )
-        )
-        totals_table.hAlign = "RIGHT"
-        # ---- RIGHT MARGIN WRAPPER (65 mm) ----
-        totals_wrapper = Table(
-            [[Spacer(1, 1), totals_table]],
-            colWidths=[87 * mm, 75 * mm],  # 65mm margin, rest for totals
-        )
-        totals_wrapper.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ]
-            )
-        )
-
-        elements.append(totals_wrapper)
-        elements.append(Spacer(1, 10 * mm))
-
-        # # --- 4. FOOTER (Payment, Terms, Signature) ---
-        # payment_info = [
-        #     Paragraph("<b>PAYMENT INFO</b>", styles["Bold"]),
-        #     Paragraph("Paypal: paypal@company.com", styles["Small"]),
-        #     Paragraph("Payonner: info@company.com", styles["Small"]),
-        # ]
-
-        # terms = [
-        #     Paragraph("<b>TERMS & CONDITIONS</b>", styles["Bold"]),
-        #     Paragraph(
-        #         "Lorem ipsum dolor sit amet, consectetuer adipiscing elit, sed diam nonummy nibh euismod.",
-        #         styles["Small"],
-        #     ),
-        # ]
-
-        # signature = [
-        #     # You could place an Image of a signature here
-        #     Paragraph("<i>Adi Barbu</i>", styles["Normal"]),
-        #     Spacer(1, 3 * mm),
-        #     Paragraph("CEO. ADI BARBU", styles["Small"]),
-        # ]
-
-        # footer_table = Table(
-        #     [[payment_info, terms, signature]], colWidths=[60 * mm, 60 * mm, 50 * mm]
-        # )
-        # footer_table.setStyle(
-        #     [
-        #         ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        #         ("ALIGN", (2, 0), (2, 0), "LEFT"),  # Align signature
-        #     ]
-        # )
-        # elements.append(footer_table)
-        # elements.append(Spacer(1, 15 * mm))  # Space before page bottom
-
-        # --- 5. PAGE BOTTOM (Contact Info) ---
-        # This will appear at the end of the content.
-        logo_path = media_to_path("media/ez.png")  # Corrected path
-        logo_image = None
-        try:
-            if os.path.exists(logo_path):
-                # ori is 170x78px
-                logo_image = Image(
-                    logo_path, width=11 * mm, height=7 * mm, hAlign="LEFT"
-                )
-            else:
-                print(f"⚠️ Logo not found at {logo_path}")
-                logo_image = Paragraph("<b>Graphics Family</b>", styles["Bold"])
-        except Exception:
-            logo_image = Paragraph("<b>Graphics Family</b>", styles["Bold"])
-        contact_logo = [
-            logo_image,
-        ]  # Placeholder for logo
-        contact_addr = [
-            Paragraph(
-                "Jl. Kepatihan Industri No. 18/C-05, Gresik - Jawa Timur",
-                styles["Small"],
+        return cached_pdf_response(
+            request,
+            namespace="invoice-deposit",
+            object_id=invoice.subid,
+            key=pdf_cache_key(
+                INVOICE_PDF_VERSION, "invoice-deposit", invoice_cache_parts(invoice)
             ),
-            # Paragraph("Your Street No. 223 NY USA", styles["Small"]),
-        ]
-        # contact_phone = [
-        #     Paragraph("+00 123 456 789", styles["Small"]),
-        #     Paragraph("+00 123 456 789", styles["Small"]),
-        # ]
-        ig_logo = Image("media/ig.png", width=6 * mm, height=6 * mm)
-        tt_logo = Image("media/tiktok.png", width=6 * mm, height=6 * mm)
-        contact_web = [
-            [ig_logo, Paragraph("@ezsportswear", styles["Small"])],
-            [tt_logo, Paragraph("@ezsportswear2", styles["Small"])],
-        ]
-
-        contact_web_table = Table(contact_web, colWidths=[6 * mm, 30 * mm])
-        contact_web_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 2),
-                ]
-            )
-        )
-
-        contact_table = Table(
-            # [[contact_logo, contact_addr, contact_phone, contact_web]],
-            [[contact_logo, contact_addr, contact_web_table]],
-            # colWidths=[20 * mm, 65 * mm, 45 * mm, 40 * mm],
-            colWidths=[20 * mm, 110 * mm, 40 * mm],
-        )
-
-        contact_table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    # ALTERNATIVE: This draws all internal lines
-                    ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.gray),
-                    ("LEFTPADDING", (1, 0), (3, 0), 5 * mm),
-                ]
-            )
+            render=lambda: render_invoice_deposit_pdf(invoice),
+            filename=f"{invoice.invoice_no}.pdf",
         )
-        elements.append(contact_table)
-
-        # --- BUILD ---
-        doc.build(elements)
-
-        pdf = buffer.getvalue()
-        buffer.close()
-        response = HttpResponse(pdf, content_type="application/pdf")
-        response["Content-Disposition"] = f'inline; filename="{invoice.invoice_no}.pdf"'
-        return response
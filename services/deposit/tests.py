@@ -1,3 +1,43 @@
+from datetime import datetime
+
 from django.test import TestCase
+from django.utils import timezone
+
+from core.common.serializers import BaseModelSerializer, DueDateMixin
+from core.common.workdays import add_working_days
+from services.customer.models.customer import Customer
+from services.deposit.models.deposit import Deposit
+from services.order.models.order import Order
+
+
+class EstimateSentTests(TestCase):
+    def setUp(self):
+        customer = Customer.objects.create(name="Budi", phone="0812", address="-", source="konveksi")
+        order = Order.objects.create(customer=customer, convection_name="Konveksi", order_type="konveksi")
+        self.accepted_at = timezone.make_aware(datetime(2026, 3, 2, 9))
+        self.deposit = Deposit.objects.create(order=order, lead_time=5, accepted_at=self.accepted_at)
+
+    def test_computed_on_create(self):
+        self.assertEqual(self.deposit.estimate_sent, add_working_days(self.accepted_at, 5))
+
+    def test_follows_update_fields(self):
+        self.deposit.lead_time = 10
+        self.deposit.save(update_fields=["lead_time"])
+        self.deposit.refresh_from_db()
+        self.assertEqual(self.deposit.estimate_sent, add_working_days(self.accepted_at, 10))
+
+    def test_cleared_with_accepted_at(self):
+        self.deposit.accepted_at = None
+        self.deposit.save()
+        self.deposit.refresh_from_db()
+        self.assertIsNone(self.deposit.estimate_sent)
+
+
+class DueDateMixinTests(TestCase):
+    def test_due_date_source_is_required(self):
+        with self.assertRaises(TypeError):
 
-# Create your tests here.
+            class Incomplete(DueDateMixin, BaseModelSerializer):
+                class Meta:
+                    model = Deposit
+                    fields = ["pk"]
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class ForecastConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "services.forecast"
+
+    def ready(self):
+        from services.forecast import signals
+
+        # ForecastListRow follows every model it is built from.
+        signals.connect()
@@ -0,0 +1,235 @@
+"""
+Maintenance of ForecastListRow, the flattened read model behind every
+forecast-based list.
+
+Rows are rebuilt from the same ForecastSerializer helpers the lists used
+to run per row, so both always agree. services.forecast.signals refreshes
+the forecasts a saved or deleted source row affects, inside the writing
+transaction; saves of the shared rows in DEFERRED_SOURCE_MODELS, which can
+feed thousands of forecasts, are refreshed once when it commits. Bulk
+writes send no signals and call refresh_rows_for().
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+from typing import TYPE_CHECKING, Iterable
+
+from django.db.models import Q
+from django.utils.dateparse import parse_date
+
+from core.common.models import upsert_conflict_fields
+from core.common.response_cache import bump_tags
+from services.forecast.models.forecast import Forecast
+from services.forecast.models.forecast_list_row import ForecastListRow
+from services.order.models.order_form import OrderForm
+from services.search.registry import related_changed as search_related_changed
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "ROW_FIELDS",
+    "build_row",
+    "refresh_forecast_rows",
+    "affected_forecast_ids",
+    "refresh_rows_for",
+)
+
+BATCH_SIZE = 500
+
+# Models affected_forecast_ids() knows, see services.forecast.signals.
+# Workflow steps are not among them: `stage` follows Forecast.stage.
+SOURCE_MODELS = {
+    "forecast.forecast",
+    "forecast.stockitem",
+    "forecast.stockitemsize",
+    "order.order",
+    "order.orderitem",
+    "order.orderform",
+    "order.orderformdetail",
+    "deposit.deposit",
+    "customer.customer",
+    "product.product",
+    "product.fabrictype",
+    "printer.printer",
+}
+
+# Shared rows whose saves are refreshed on commit, see services.forecast.signals
+DEFERRED_SOURCE_MODELS = {
+    "customer.customer",
+    "product.product",
+    "product.fabrictype",
+    "printer.printer",
+}
+
+# Every column but the key, written on each refresh
+ROW_FIELDS = [
+    field.name
+    for field in ForecastListRow._meta.concrete_fields
+    if not field.primary_key
+]
+
+
+def _as_date(value) -> datetime.date | None:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, str):
+        return parse_date(value)
+    return value
+
+
+def _subid(obj):
+    return obj.subid if obj is not None else None
+
+
+def build_row(forecast: Forecast, serializer) -> ForecastListRow:
+    """
+    The list row of `forecast`, loaded with with_due_date() and
+    with_source_relations(). `serializer` is a ForecastSerializer.
+    """
+    printer = serializer.get_printer(forecast)
+    fabric_type = serializer.get_fabric_type(forecast)
+    image = serializer._get_product_image(forecast)
+    customer = serializer.get_customer(forecast)
+
+    order = forecast.order_item.order if forecast.order_item_id else None
+
+    return ForecastListRow(
+        forecast=forecast,
+        customer=dict(customer) if customer else None,
+        printer=serializer.printer_display(forecast),
+        details=forecast.details,
+        customer_name=order.customer.name if order and order.customer else None,
+        convection_name=serializer.get_convection_name(forecast),
+        product_name=serializer.get_product_name(forecast),
+        product_image=image.name if image else None,
+        sku=serializer.sku(forecast),
+        printer_subid=_subid(printer),
+        fabric_name=fabric_type.name if fabric_type else None,
+        fabric_type_subid=_subid(fabric_type),
+        priority_status=serializer.priority_status(forecast),
+        due_date=_as_date(forecast.due_date),
+        estimate_sent=_as_date(serializer.estimate_sent(forecast)),
+        lead_time=serializer.get_lead_time(forecast) or 0,
+        stage=serializer.get_progress(forecast),
+        count_po=forecast.count_po,
+        order_subid=_subid(forecast.order),
+        order_item_subid=_subid(forecast.order_item),
+        created_by_subid=_subid(forecast.created_by),
+    )
+
+
+def refresh_forecast_rows(forecast_ids: Iterable[int]) -> int:
+    """
+    Rebuilds the rows of `forecast_ids`, a batch at a time. Ids of deleted
+    forecasts are skipped; their rows went with them.
+    """
+    # Imported here: the serializer module imports the order app, which
+    # refreshes rows after its bulk writes.
+    from services.forecast.rest.forecast.serializers import ForecastSerializer
+
+    ids = sorted({pk for pk in forecast_ids if pk is not None})
+    if not ids:
+        return 0
+
+    serializer = ForecastSerializer(context={})
+    refreshed = 0
+    for start in range(0, len(ids), BATCH_SIZE):
+        forecasts = (
+            Forecast.objects.filter(pk__in=ids[start : start + BATCH_SIZE])
+            .with_due_date()
+            .with_source_relations()
+        )
+        rows = [build_row(forecast, serializer) for forecast in forecasts]
+
+        # One upsert per batch
+        ForecastListRow.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=upsert_conflict_fields("forecast"),
+            update_fields=ROW_FIELDS,
+        )
+        refreshed += len(rows)
+
+    # bulk_create sends no post_save
+    bump_tags(ForecastListRow)
+    search_related_changed(ForecastListRow, ids)
+    return refreshed
+
+
+def _forecasts(condition: Q) -> list[int]:
+    return list(Forecast.objects.filter(condition).values_list("pk", flat=True).distinct())
+
+
+def _order_form_condition(order_id, order_item_id) -> Q:
+    condition = Q(pk__in=[])
+    if order_id:
+        condition |= Q(order_id=order_id)
+    if order_item_id:
+        condition |= Q(order_item_id=order_item_id)
+    return condition
+
+
+def affected_forecast_ids(instance) -> list[int]:
+    """
+    Forecasts whose list row shows data from `instance`, or [] when its
+    model feeds no list row.
+    """
+    label = instance._meta.label_lower
+    pk = instance.pk
+
+    if label == "forecast.forecast":
+        return [pk]
+    if label == "forecast.stockitem":
+        return [instance.forecast_id]
+    if label == "forecast.stockitemsize":
+        return _forecasts(Q(stock_items__pk=instance.stock_item_id))
+    if label == "order.order":
+        return _forecasts(Q(order_id=pk) | Q(order_item__order_id=pk))
+    if label == "order.orderitem":
+        return _forecasts(Q(order_item_id=pk))
+    if label == "order.orderform":
+        return _forecasts(_order_form_condition(instance.order_id, instance.order_item_id))
+    if label == "order.orderformdetail":
+        order_form = (
+            OrderForm.objects.filter(pk=instance.order_form_id)
+            .values("order_id", "order_item_id")
+            .first()
+        )
+        if order_form is None:
+            return []
+        return _forecasts(_order_form_condition(order_form["order_id"], order_form["order_item_id"]))
+    if label == "deposit.deposit":
+        return _forecasts(Q(order_item__deposit_id=pk))
+    if label == "customer.customer":
+        return _forecasts(Q(order_item__order__customer_id=pk))
+    if label == "product.product":
+        return _forecasts(Q(order_item__product_id=pk) | Q(stock_items__product_id=pk))
+    if label == "product.fabrictype":
+        return _forecasts(
+            Q(order_item__fabric_type_id=pk)
+            | Q(stock_items__fabric_type_id=pk)
+            | Q(order__order_forms__fabric_type_id=pk)
+        )
+    if label == "printer.printer":
+        return _forecasts(
+            Q(order_item__product__printer_id=pk)
+            | Q(stock_items__product__printer_id=pk)
+            | Q(order__order_forms__printer_id=pk)
+        )
+    return []
+
+
+def refresh_rows_for(*instances) -> int:
+    """
+    Refreshes the rows every one of `instances` feeds. For writes that send
+    no model signals (bulk_create, bulk_update, QuerySet.update()).
+    """
+    ids = set()
+    for instance in instances:
+        ids.update(affected_forecast_ids(instance))
+    return refresh_forecast_rows(ids)
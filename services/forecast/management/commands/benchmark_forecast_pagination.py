@@ -0,0 +1,109 @@
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.common.paginations import CursorPagination
+from services.forecast.models.forecast import Forecast
+from services.forecast.rest.forecast.views import ForecastViewSet
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the forecast list at increasing page depths with page numbers "
+        "(exact, estimated and no count) and with keyset cursors."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Insert this many synthetic forecasts first; they are rolled back afterwards.",
+        )
+        parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 1000])
+        parser.add_argument("--limit", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.filter(is_superuser=True, is_active=True).first()
+        if user is None:
+            raise CommandError("An active superuser is needed to call the list view.")
+
+        with transaction.atomic():
+            if options["seed"]:
+                self.seed(options["seed"])
+            self.run(user, options)
+            # Never keep the synthetic rows.
+            transaction.set_rollback(True)
+
+    def seed(self, rows):
+        today = timezone.localdate()
+        batch = []
+        for i in range(rows):
+            batch.append(
+                Forecast(
+                    forecast_number=f"BENCH-{i:07d}",
+                    date_forecast=today,
+                    is_stock=True,
+                    priority_status="reguler",
+                )
+            )
+            if len(batch) == 5000:
+                Forecast.objects.bulk_create(batch)
+                batch = []
+        Forecast.objects.bulk_create(batch)
+        self.stdout.write(f"Seeded {rows} forecasts.")
+
+    def run(self, user, options):
+        view = ForecastViewSet.as_view({"get": "list"})
+        factory = APIRequestFactory()
+        limit = options["limit"]
+        total = Forecast.objects.count()
+        self.stdout.write(f"{total} forecasts, limit {limit}\n")
+
+        def call(params):
+            timings = []
+            for _ in range(options["repeat"]):
+                request = factory.get("/api/forecast/forecasts/", params)
+                force_authenticate(request, user=user)
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    response = view(request)
+                    response.render()
+                    timings.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    return f"HTTP {response.status_code}"
+            return f"{statistics.median(timings):8.1f} ms {len(queries):3d} queries"
+
+        # Cursor for the start of page N, taken from the row before it.
+        paginator = CursorPagination()
+        paginator.ordering = ("-created", "-pk")
+        paginator.base_url = "http://testserver/"
+        ordered = Forecast.objects.order_by(*paginator.ordering)
+
+        header = f"{'page':>6}  {'count=exact':>22}  {'count=estimate':>22}  {'count=none':>22}  {'cursor':>22}"
+        self.stdout.write(header)
+        for page in options["pages"]:
+            if (page - 1) * limit >= total:
+                self.stdout.write(f"{page:>6}  beyond the last page")
+                continue
+
+            cells = [
+                call({"page": page, "limit": limit, "count": mode})
+                for mode in ("exact", "estimate", "none")
+            ]
+
+            cursor_params = {"pagination": "cursor", "limit": limit}
+            if page > 1:
+                row = ordered[(page - 1) * limit - 1]
+                link = paginator.encode_cursor(row)
+                cursor_params["cursor"] = link.split("cursor=", 1)[1]
+            cells.append(call(cursor_params))
+
+            self.stdout.write(f"{page:>6}  " + "  ".join(f"{cell:>22}" for cell in cells))
@@ -0,0 +1,88 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from services.forecast.models.production_pack import ProductionPack
+from services.forecast.production_pack import (
+    build_production_pack,
+    merged_pdf_available,
+    production_pack_path,
+)
+from services.printer.models.printer import Printer
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the order forms of every forecast in a date_forecast range "
+        "into one ZIP or merged PDF."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("date_from", help="First date_forecast, YYYY-MM-DD.")
+        parser.add_argument(
+            "date_to", nargs="?", help="Last date_forecast, YYYY-MM-DD. Defaults to date_from."
+        )
+        parser.add_argument("--printer", help="Printer subid or name.")
+        parser.add_argument(
+            "--format",
+            choices=[ProductionPack.FORMAT_ZIP, ProductionPack.FORMAT_PDF],
+            default=ProductionPack.FORMAT_ZIP,
+        )
+        parser.add_argument("--workers", type=int, help="Render processes, defaults to the CPU count.")
+        parser.add_argument("--user", help="Email of the user recorded as created_by.")
+
+    def handle(self, *args, **options):
+        date_from = parse_date(options["date_from"])
+        date_to = parse_date(options["date_to"] or options["date_from"])
+        if not date_from or not date_to:
+            raise CommandError("Dates must be formatted as YYYY-MM-DD.")
+        if date_to < date_from:
+            raise CommandError("date_to must not be before date_from.")
+
+        if options["format"] == ProductionPack.FORMAT_PDF and not merged_pdf_available():
+            raise CommandError("A merged PDF needs pypdf installed; use --format zip.")
+
+        printer = None
+        if options["printer"]:
+            printer = (
+                Printer.objects.filter(subid=options["printer"]).first()
+                or Printer.objects.filter(name__iexact=options["printer"]).first()
+            )
+            if printer is None:
+                raise CommandError(f"Printer {options['printer']} not found.")
+
+        created_by = None
+        if options["user"]:
+            try:
+                created_by = get_user_model().objects.get(email=options["user"])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"User {options['user']} not found.")
+
+        pack = ProductionPack.objects.create(
+            date_from=date_from,
+            date_to=date_to,
+            printer=printer,
+            output_format=options["format"],
+            created_by=created_by,
+        )
+
+        def progress(completed, total):
+            self.stdout.write(f"\r{completed}/{total} order forms", ending="")
+            self.stdout.flush()
+
+        pack = build_production_pack(pack, workers=options["workers"], progress=progress)
+        self.stdout.write("")
+
+        for skipped in pack.skipped:
+            self.stdout.write(
+                self.style.WARNING(f"Skipped {skipped['forecast_number']}: {skipped['reason']}")
+            )
+
+        if pack.status != ProductionPack.STATUS_DONE:
+            raise CommandError(f"Production pack failed: {pack.error}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {pack.completed} order forms to {production_pack_path(pack)}."
+            )
+        )
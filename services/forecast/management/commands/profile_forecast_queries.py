@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from services.account.models import User
+from services.forecast.rest.forecast.views import ForecastViewSet
+
+
+class Command(BaseCommand):
+    help = (
+        "Count SQL queries of the forecast list for several page sizes. "
+        "The count should stay flat as the page grows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-sizes",
+            type=str,
+            default="5,10,20",
+            help="Comma separated page sizes to profile.",
+        )
+        parser.add_argument("--path", type=str, default="/api/forecast/forecasts/")
+
+    def handle(self, *args, **options):
+        page_sizes = [int(v) for v in options["page_sizes"].split(",") if v]
+
+        user = User.objects.filter(is_superuser=True, is_active=True).first()
+        if not user:
+            raise CommandError("An active superuser is required to call the endpoint.")
+
+        factory = APIRequestFactory()
+        view = ForecastViewSet.as_view({"get": "list"})
+
+        counts = []
+        for page_size in page_sizes:
+            request = factory.get(options["path"], {"limit": page_size})
+            force_authenticate(request, user=user)
+
+            with CaptureQueriesContext(connection) as ctx:
+                response = view(request)
+                response.render()
+
+            rows = len(response.data.get("results", []))
+            counts.append(len(ctx.captured_queries))
+
+            self.stdout.write(
+                f"page_size={page_size:<4} rows={rows:<4} queries={len(ctx.captured_queries)}"
+            )
+
+        if len(set(counts)) > 1:
+            self.stdout.write(self.style.WARNING("Query count grows with page size."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Query count is constant per page."))
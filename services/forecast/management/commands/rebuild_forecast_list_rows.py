@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from services.forecast import list_rows
+from services.forecast.models.forecast import Forecast
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild ForecastListRow for every forecast (or the given ids). Run after "
+        "deploying the table and after writes that bypassed model signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("ids", type=int, nargs="*", help="Forecast ids; all when omitted.")
+        parser.add_argument("--batch-size", type=int, default=list_rows.BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        ids = options["ids"] or list(Forecast.objects.order_by("pk").values_list("pk", flat=True))
+        batch_size = options["batch_size"]
+
+        refreshed = 0
+        for start in range(0, len(ids), batch_size):
+            # One transaction per batch keeps locks short on a live table.
+            with transaction.atomic():
+                refreshed += list_rows.refresh_forecast_rows(ids[start : start + batch_size])
+            self.stdout.write(f"{refreshed}/{len(ids)} rows")
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {refreshed} forecast list rows."))
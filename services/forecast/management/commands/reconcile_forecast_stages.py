@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.common.response_cache import bump_tags
+from services.forecast.list_rows import refresh_forecast_rows
+from services.forecast.models.forecast import Forecast
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute Forecast.stage from the recorded workflow steps and fix the "
+        "forecasts whose stored stage drifted (steps written outside the "
+        "verification and warehouse serializers)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the forecasts that would change.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        ids = list(Forecast.objects.order_by("pk").values_list("pk", flat=True))
+
+        fixed = 0
+        for start in range(0, len(ids), batch_size):
+            with transaction.atomic():
+                fixed += self.reconcile(ids[start : start + batch_size], options["dry_run"])
+
+        verb = "Would fix" if options["dry_run"] else "Fixed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {fixed} of {len(ids)} forecasts."))
+
+    def reconcile(self, ids, dry_run):
+        forecasts = (
+            Forecast.objects.filter(pk__in=ids)
+            .with_computed_stage()
+            .only("pk", "forecast_number", "stage")
+        )
+        now = timezone.now()
+        drifted = []
+        for forecast in forecasts:
+            if forecast.stage == forecast.computed_stage:
+                continue
+            self.stdout.write(
+                f"{forecast.forecast_number}: {forecast.stage} -> {forecast.computed_stage}"
+            )
+            forecast.stage = forecast.computed_stage
+            forecast.updated = now
+            drifted.append(forecast)
+
+        if drifted and not dry_run:
+            Forecast.objects.bulk_update(drifted, ["stage", "updated"])
+            # bulk_update sends no post_save
+            bump_tags(Forecast)
+            refresh_forecast_rows(forecast.pk for forecast in drifted)
+        return len(drifted)
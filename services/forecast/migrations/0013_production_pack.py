@@ -0,0 +1,46 @@
+# Generated by Django 5.2.6 on 2026-10-17 23:43
+
+import core.common.generators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecast', '0012_alter_forecast_forecast_number'),
+        ('printer', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductionPack',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subid', models.CharField(blank=True, db_column='subid', default=core.common.generators.default_subid_generator, editable=False, help_text='Primary key shown to user.', max_length=64, null=True, unique=True, verbose_name='subid')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('output_format', models.CharField(choices=[('pdf', 'Merged PDF'), ('zip', 'ZIP')], default='zip', max_length=10)),
+                ('date_from', models.DateField()),
+                ('date_to', models.DateField()),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('completed', models.PositiveIntegerField(default=0)),
+                ('skipped', models.JSONField(blank=True, default=list)),
+                ('error', models.TextField(blank=True, default='')),
+                ('file', models.CharField(blank=True, default='', max_length=255)),
+                ('started', models.DateTimeField(blank=True, null=True)),
+                ('finished', models.DateTimeField(blank=True, null=True)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+                ('printer', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='production_packs', to='printer.printer')),
+            ],
+            options={
+                'verbose_name': 'Production Pack',
+                'verbose_name_plural': 'Production Packs',
+                'permissions': [('add_productionpack', 'Can add production pack'), ('view_productionpack', 'Can view production pack')],
+                'default_permissions': (),
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecast', '0013_production_pack'),
+        ('order', '0043_orderformupload'),
+        ('printer', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='forecast',
+            index=models.Index(fields=['-created', '-id'], name='forecast_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecast', '0014_forecast_created_id_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ForecastListRow',
+            fields=[
+                ('forecast', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='list_row', serialize=False, to='forecast.forecast')),
+                ('customer', models.JSONField(blank=True, null=True)),
+                ('printer', models.JSONField(blank=True, null=True)),
+                ('details', models.JSONField(blank=True, default=list)),
+                ('customer_name', models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+                ('convection_name', models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+                ('product_name', models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+                ('product_image', models.CharField(blank=True, max_length=255, null=True)),
+                ('sku', models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+                ('printer_subid', models.CharField(blank=True, db_index=True, max_length=64, null=True)),
+                ('fabric_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('fabric_type_subid', models.CharField(blank=True, db_index=True, max_length=64, null=True)),
+                ('priority_status', models.CharField(blank=True, db_index=True, max_length=20, null=True)),
+                ('due_date', models.DateField(blank=True, db_index=True, null=True)),
+                ('estimate_sent', models.DateField(blank=True, null=True)),
+                ('lead_time', models.IntegerField(default=0)),
+                ('stage', models.CharField(db_index=True, max_length=50)),
+                ('count_po', models.IntegerField(default=0)),
+                ('order_subid', models.CharField(blank=True, max_length=64, null=True)),
+                ('order_item_subid', models.CharField(blank=True, max_length=64, null=True)),
+                ('created_by_subid', models.CharField(blank=True, max_length=64, null=True)),
+                ('refreshed', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Forecast List Row',
+                'verbose_name_plural': 'Forecast List Rows',
+                'default_permissions': (),
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecast', '0015_forecast_list_row'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='forecast',
+            name='stage',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Menunggu Verifikasi Print'), (2, 'Menunggu QC Press'), (3, 'Menunggu QC Line'), (4, 'Menunggu QC Cutting'), (5, 'Menunggu QC Finishing'), (6, 'Menunggu Pengiriman Gudang'), (7, 'Menunggu Penerimaan Gudang'), (8, 'Selesai')], db_index=True, default=1, editable=False),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:20
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecast', '0016_forecast_stage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ForecastStageEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_stage', models.PositiveSmallIntegerField(choices=[(1, 'Menunggu Verifikasi Print'), (2, 'Menunggu QC Press'), (3, 'Menunggu QC Line'), (4, 'Menunggu QC Cutting'), (5, 'Menunggu QC Finishing'), (6, 'Menunggu Pengiriman Gudang'), (7, 'Menunggu Penerimaan Gudang'), (8, 'Selesai')])),
+                ('to_stage', models.PositiveSmallIntegerField(choices=[(1, 'Menunggu Verifikasi Print'), (2, 'Menunggu QC Press'), (3, 'Menunggu QC Line'), (4, 'Menunggu QC Cutting'), (5, 'Menunggu QC Finishing'), (6, 'Menunggu Pengiriman Gudang'), (7, 'Menunggu Penerimaan Gudang'), (8, 'Selesai')])),
+                ('at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('dwell_seconds', models.PositiveIntegerField(blank=True, null=True)),
+                ('printer_subid', models.CharField(blank=True, max_length=64, null=True)),
+                ('priority_status', models.CharField(blank=True, max_length=20, null=True)),
+                ('forecast', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stage_events', to='forecast.forecast')),
+            ],
+            options={
+                'verbose_name': 'Forecast Stage Event',
+                'verbose_name_plural': 'Forecast Stage Events',
+                'default_permissions': (),
+                'indexes': [models.Index(fields=['at', 'from_stage'], name='forecast_stage_event_at_idx')],
+            },
+        ),
+    ]
@@ -1,3 +1,6 @@
 from .forecast import *
 from .stock_item import *
 from .stock_item_size import *
+from .production_pack import *
+from .forecast_list_row import *
+from .forecast_stage_event import *
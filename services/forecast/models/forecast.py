@@ -20,14 +20,112 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 __all__ = (
+    "ForecastStage",
+    "STAGE_STEPS",
     "ForecastQuerySet",
     "ForecastManager",
     "Forecast",
 )
 
 
+class ForecastStage(models.IntegerChoices):
+    """
+    Workflow position of a forecast: the first step not recorded yet.
+    Ordered, so "past QC Line" is `stage__gt=ForecastStage.QC_LINE`.
+    """
+
+    PRINT = 1, "Menunggu Verifikasi Print"
+    QC_PRESS = 2, "Menunggu QC Press"
+    QC_LINE = 3, "Menunggu QC Line"
+    QC_CUTTING = 4, "Menunggu QC Cutting"
+    QC_FINISHING = 5, "Menunggu QC Finishing"
+    WAREHOUSE_DELIVERY = 6, "Menunggu Pengiriman Gudang"
+    WAREHOUSE_RECEIPT = 7, "Menunggu Penerimaan Gudang"
+    DONE = 8, "Selesai"
+
+
+# The one-to-one step each stage waits for, in workflow order. A finishing
+# defect keeps the forecast at QC Finishing until it is accepted.
+STAGE_STEPS = (
+    (ForecastStage.PRINT, "print_verifications"),
+    (ForecastStage.QC_PRESS, "qc_press_verifications"),
+    (ForecastStage.QC_LINE, "qc_line_verifications"),
+    (ForecastStage.QC_CUTTING, "qc_cutting_verifications"),
+    (ForecastStage.QC_FINISHING, "qc_finishings"),
+    (ForecastStage.WAREHOUSE_DELIVERY, "warehouse_deliveries"),
+    (ForecastStage.WAREHOUSE_RECEIPT, "warehouse_receipts"),
+)
+
+
 class ForecastQuerySet(models.QuerySet):
-    pass
+    def with_computed_stage(self):
+        """
+        Annotates `computed_stage`, the stage recomputed from the step rows,
+        to reconcile the stored `stage` with.
+        """
+        return self.annotate(
+            computed_stage=models.Case(
+                *(
+                    models.When(**{f"{relation}__isnull": True}, then=models.Value(stage))
+                    for stage, relation in STAGE_STEPS
+                ),
+                default=models.Value(ForecastStage.DONE),
+                output_field=models.PositiveSmallIntegerField(),
+            )
+        )
+
+    def with_due_date(self):
+        """
+        Annotates `due_date`, the date shown as estimate_sent:
+        - stock      -> Forecast.estimate_sent
+        - konveksi   -> Deposit.estimate_sent
+        - marketplace -> Order.estimated_shipping_date
+        """
+        return self.annotate(
+            due_date=models.Case(
+                models.When(is_stock=True, then=models.F("estimate_sent")),
+                models.When(
+                    order_item__isnull=False,
+                    then=models.F("order_item__deposit__estimate_sent"),
+                ),
+                default=models.F("order__estimated_shipping_date"),
+                output_field=models.DateField(),
+            )
+        )
+
+    def with_list_relations(self):
+        """
+        Joins the flattened ForecastListRow, which is all ForecastSerializer
+        (and the verification serializers built on it) reads for the shared
+        fields. Forecasts without a row fall back to with_source_relations().
+        """
+        return self.select_related("list_row")
+
+    def with_source_relations(self):
+        """
+        Loads every relation ForecastSerializer reads to compute the shared
+        fields itself, so a batch costs a fixed number of queries regardless
+        of its size. Used to build ForecastListRow.
+        """
+        return self.select_related(
+            "created_by",
+            "order",
+            "order__customer",
+            "order_item",
+            "order_item__order",
+            "order_item__order__customer",
+            "order_item__product",
+            "order_item__product__printer",
+            "order_item__fabric_type",
+            "order_item__deposit",
+        ).prefetch_related(
+            "stock_items__product__printer",
+            "stock_items__fabric_type",
+            "stock_items__stock_item_sizes",
+            "order__order_forms__printer",
+            "order__order_forms__order_form_details",
+            "order_item__order_forms__order_form_details",
+        )
 
 
 _ForecastManagerBase = models.Manager.from_queryset(ForecastQuerySet)  # type: type[ForecastQuerySet]
@@ -78,6 +176,15 @@ class Forecast(get_subid_model()):
     )
     estimate_sent = models.DateField(blank=True, null=True)
 
+    # 🚀 Kept by the verification and warehouse serializers through
+    # refresh_stage(), so lists never probe the step tables.
+    stage = models.PositiveSmallIntegerField(
+        choices=ForecastStage.choices,
+        default=ForecastStage.PRINT,
+        db_index=True,
+        editable=False,
+    )
+
     created_by = models.ForeignKey("account.User", on_delete=models.SET_NULL, null=True)
     created = models.DateTimeField(auto_now_add=True)
     updated = models.DateTimeField(auto_now=True)
@@ -94,6 +201,10 @@ class Forecast(get_subid_model()):
         ]
         verbose_name = "Forecast"
         verbose_name_plural = "Forecasts"
+        indexes = [
+            # Keyset (cursor) pagination walks this order, see CursorPagination
+            models.Index(fields=["-created", "-id"], name="forecast_created_id_idx"),
+        ]
 
     def __str__(self):
         return f"Forecasting for {self.created_by}"
@@ -120,6 +231,29 @@ class Forecast(get_subid_model()):
 
         super().save(*args, **kwargs)
 
+    def refresh_stage(self) -> bool:
+        """
+        Recomputes `stage` after a workflow step was recorded or removed,
+        saving (and so refreshing the list row) and logging a
+        ForecastStageEvent only when it moved. Call it in the transaction
+        that wrote the step.
+        """
+        stage = (
+            Forecast.objects.filter(pk=self.pk)
+            .with_computed_stage()
+            .values_list("computed_stage", flat=True)
+            .get()
+        )
+        if stage == self.stage:
+            return False
+
+        from services.forecast.models.forecast_stage_event import ForecastStageEvent
+
+        previous, self.stage = self.stage, stage
+        self.save(update_fields=["stage", "updated"])
+        ForecastStageEvent.objects.record(self, previous)
+        return True
+
     @property
     def count_po(self) -> int:
         """
@@ -128,25 +262,15 @@ class Forecast(get_subid_model()):
         - If is_stock → use StockItem.quantity
         - Else → count OrderFormDetail rows
         """
-        from services.forecast.models import StockItem
-        from services.order.models import OrderForm, OrderFormDetail
-
         if self.is_stock:
-            stock_item = StockItem.objects.filter(forecast=self).first()
+            stock_item = self._first_related(self, "stock_items")
             return stock_item.quantity if stock_item else 0
 
-        # Detect source
-        if self.order_item:
-            order_form = OrderForm.objects.filter(order_item=self.order_item).first()
-        else:
-            order_form = OrderForm.objects.filter(order=self.order).first()
-
+        order_form = self._get_order_form()
         if not order_form:
             return 0
 
-        details = OrderFormDetail.objects.filter(order_form=order_form)
-
-        return details.count()
+        return order_form.order_form_details.count()
 
     @property
     def details(self) -> list[dict]:
@@ -157,9 +281,6 @@ class Forecast(get_subid_model()):
         - "L KIDS"  → "KIDS"
         - "XS GIRL" → "GIRL"
         """
-        from services.forecast.models import StockItemSize
-        from services.order.models import OrderForm
-
         def normalize_type(size_text: str) -> str:
             if not size_text:
                 return ""
@@ -178,9 +299,13 @@ class Forecast(get_subid_model()):
         # CASE 1: STOCK ITEM
         # -------------------------------
         if self.is_stock:
-            sizes = StockItemSize.objects.filter(stock_item__forecast=self)
+            sizes = [
+                size
+                for stock_item in self.stock_items.all()
+                for size in stock_item.stock_item_sizes.all()
+            ]
 
-            if not sizes.exists():
+            if not sizes:
                 return []
 
             result: dict[str, int] = {}
@@ -197,18 +322,36 @@ class Forecast(get_subid_model()):
         # -------------------------------
         # CASE 2: NORMAL ORDER
         # -------------------------------
-        if self.order_item:
-            order_form = OrderForm.objects.filter(order_item=self.order_item).first()
-        else:
-            order_form = OrderForm.objects.filter(order=self.order).first()
+        order_form = self._get_order_form()
 
         if not order_form:
             return []
 
-        details = OrderFormDetail.objects.filter(order_form=order_form)
+        details = order_form.order_form_details.all()
 
         normalized = (normalize_type(d.shirt_size) for d in details if d.shirt_size)
 
         counter = Counter(normalized)
 
         return [{"type": size, "count": count} for size, count in counter.items()]
+
+    @staticmethod
+    def _first_related(instance, related_name):
+        """
+        First row of a reverse relation, read from the prefetch cache
+        when the list view loaded it.
+        """
+        if instance is None:
+            return None
+
+        manager = getattr(instance, related_name)
+        if related_name in getattr(instance, "_prefetched_objects_cache", {}):
+            rows = manager.all()
+            return rows[0] if rows else None
+
+        return manager.first()
+
+    def _get_order_form(self):
+        if self.order_item_id:
+            return self._first_related(self.order_item, "order_forms")
+        return self._first_related(self.order, "order_forms")
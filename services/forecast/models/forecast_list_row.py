@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.db import models
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "ForecastListRowQuerySet",
+    "ForecastListRowManager",
+    "ForecastListRow",
+)
+
+
+class ForecastListRowQuerySet(models.QuerySet):
+    pass
+
+
+_ForecastListRowManagerBase = models.Manager.from_queryset(ForecastListRowQuerySet)  # type: type[ForecastListRowQuerySet]
+
+
+class ForecastListRowManager(_ForecastListRowManagerBase):
+    pass
+
+
+class ForecastListRow(models.Model):
+    """
+    The display fields of a forecast that ForecastSerializer would otherwise
+    resolve through its order, order item, deposit, stock items, order forms
+    and workflow steps, flattened into one row.
+
+    Kept current in the same transaction as the writes it depends on, see
+    services.forecast.list_rows. `rebuild_forecast_list_rows` regenerates it.
+    """
+
+    forecast = models.OneToOneField(
+        "forecast.Forecast",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="list_row",
+    )
+
+    # Serialized as ForecastSerializer shows them
+    customer = models.JSONField(null=True, blank=True)
+    printer = models.JSONField(null=True, blank=True)
+    details = models.JSONField(default=list, blank=True)
+
+    customer_name = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    convection_name = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    product_name = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    # Storage name of the product image
+    product_image = models.CharField(max_length=255, null=True, blank=True)
+    sku = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    printer_subid = models.CharField(max_length=64, null=True, blank=True, db_index=True)
+    fabric_name = models.CharField(max_length=255, null=True, blank=True)
+    fabric_type_subid = models.CharField(max_length=64, null=True, blank=True, db_index=True)
+    priority_status = models.CharField(max_length=20, null=True, blank=True, db_index=True)
+
+    # Forecast.objects.with_due_date(), used to filter and sort
+    due_date = models.DateField(null=True, blank=True, db_index=True)
+    # Working-day estimate shown to users
+    estimate_sent = models.DateField(null=True, blank=True)
+    lead_time = models.IntegerField(default=0)
+    stage = models.CharField(max_length=50, db_index=True)
+    count_po = models.IntegerField(default=0)
+
+    order_subid = models.CharField(max_length=64, null=True, blank=True)
+    order_item_subid = models.CharField(max_length=64, null=True, blank=True)
+    created_by_subid = models.CharField(max_length=64, null=True, blank=True)
+
+    refreshed = models.DateTimeField(auto_now=True)
+
+    objects = ForecastListRowManager()
+
+    class Meta:
+        default_permissions = ()
+        verbose_name = "Forecast List Row"
+        verbose_name_plural = "Forecast List Rows"
+
+    def __str__(self):
+        return f"List row of forecast {self.forecast_id}"
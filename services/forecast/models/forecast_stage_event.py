@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.db import models
+from django.utils import timezone
+
+from services.forecast.models.forecast import ForecastStage
+
+if TYPE_CHECKING:
+    from services.forecast.models.forecast import Forecast
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "ForecastStageEventQuerySet",
+    "ForecastStageEventManager",
+    "ForecastStageEvent",
+)
+
+
+class ForecastStageEventQuerySet(models.QuerySet):
+    pass
+
+
+_ForecastStageEventManagerBase = models.Manager.from_queryset(ForecastStageEventQuerySet)  # type: type[ForecastStageEventQuerySet]
+
+
+class ForecastStageEventManager(_ForecastStageEventManagerBase):
+    def record(self, forecast: Forecast, from_stage: int) -> ForecastStageEvent:
+        """
+        Logs `forecast` moving from `from_stage` to its current stage, with
+        the time it spent in `from_stage`: since its previous event, or
+        since it was created when it leaves the first stage.
+
+        Otherwise it is unknown: forecasts whose stage was backfilled by
+        reconcile_forecast_stages have no event for entering it, and their
+        whole lifetime would count as one stage's dwell.
+        """
+        at = timezone.now()
+        entered = (
+            self.filter(forecast=forecast)
+            .order_by("-at", "-pk")
+            .values_list("at", flat=True)
+            .first()
+        )
+        if entered is None and from_stage == ForecastStage.PRINT:
+            entered = forecast.created
+
+        row = getattr(forecast, "list_row", None)
+        return self.create(
+            forecast=forecast,
+            from_stage=from_stage,
+            to_stage=forecast.stage,
+            at=at,
+            dwell_seconds=max(int((at - entered).total_seconds()), 0) if entered else None,
+            printer_subid=row.printer_subid if row else None,
+            priority_status=row.priority_status if row else None,
+        )
+
+
+class ForecastStageEvent(models.Model):
+    """
+    Append-only log of Forecast.stage transitions, written in the same
+    transaction as the step record that caused them.
+
+    `dwell_seconds` is the time the forecast waited in `from_stage`. The
+    printer and priority are copied from the forecast at the time, so
+    lead-time reports group without joining back.
+    """
+
+    forecast = models.ForeignKey(
+        "forecast.Forecast",
+        on_delete=models.CASCADE,
+        related_name="stage_events",
+    )
+    from_stage = models.PositiveSmallIntegerField(choices=ForecastStage.choices)
+    to_stage = models.PositiveSmallIntegerField(choices=ForecastStage.choices)
+    at = models.DateTimeField(default=timezone.now, db_index=True)
+    dwell_seconds = models.PositiveIntegerField(null=True, blank=True)
+
+    printer_subid = models.CharField(max_length=64, null=True, blank=True)
+    priority_status = models.CharField(max_length=20, null=True, blank=True)
+
+    objects = ForecastStageEventManager()
+
+    class Meta:
+        default_permissions = ()
+        verbose_name = "Forecast Stage Event"
+        verbose_name_plural = "Forecast Stage Events"
+        indexes = [
+            # Latency report: a date range, grouped by the stage waited in
+            models.Index(fields=["at", "from_stage"], name="forecast_stage_event_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.forecast_id}: {self.from_stage} -> {self.to_stage}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Forecast stage events are append-only.")
+        super().save(*args, **kwargs)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.db import models
+
+from core.common.models import get_subid_model
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "ProductionPackQuerySet",
+    "ProductionPackManager",
+    "ProductionPack",
+)
+
+
+class ProductionPackQuerySet(models.QuerySet):
+    def stale(self, before):
+        """Packs still pending or running with no progress since `before`."""
+        return self.filter(
+            status__in=[ProductionPack.STATUS_PENDING, ProductionPack.STATUS_RUNNING],
+            updated__lt=before,
+        )
+
+
+_ProductionPackManagerBase = models.Manager.from_queryset(ProductionPackQuerySet)  # type: type[ProductionPackQuerySet]
+
+
+class ProductionPackManager(_ProductionPackManagerBase):
+    pass
+
+
+class ProductionPack(get_subid_model()):
+    """
+    A batch job rendering the order forms of a range of forecasts into one
+    downloadable file, see services.forecast.production_pack.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+
+    FORMAT_PDF = "pdf"
+    FORMAT_ZIP = "zip"
+
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            (STATUS_PENDING, "Pending"),
+            (STATUS_RUNNING, "Running"),
+            (STATUS_DONE, "Done"),
+            (STATUS_FAILED, "Failed"),
+        ],
+        default=STATUS_PENDING,
+    )
+    output_format = models.CharField(
+        max_length=10,
+        choices=[(FORMAT_PDF, "Merged PDF"), (FORMAT_ZIP, "ZIP")],
+        default=FORMAT_ZIP,
+    )
+
+    # Filters
+    date_from = models.DateField()
+    date_to = models.DateField()
+    printer = models.ForeignKey(
+        "printer.Printer",
+        on_delete=models.SET_NULL,
+        related_name="production_packs",
+        null=True,
+        blank=True,
+    )
+
+    # Progress
+    total = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    skipped = models.JSONField(default=list, blank=True)
+    error = models.TextField(blank=True, default="")
+
+    file = models.CharField(max_length=255, blank=True, default="")
+
+    created_by = models.ForeignKey("account.User", on_delete=models.SET_NULL, null=True)
+    started = models.DateTimeField(null=True, blank=True)
+    finished = models.DateTimeField(null=True, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    objects = ProductionPackManager()
+
+    class Meta:
+        default_permissions = ()
+        permissions = [
+            ("add_productionpack", "Can add production pack"),
+            ("view_productionpack", "Can view production pack"),
+        ]
+        verbose_name = "Production Pack"
+        verbose_name_plural = "Production Packs"
+
+    def __str__(self):
+        return f"Production pack {self.date_from} - {self.date_to} ({self.status})"
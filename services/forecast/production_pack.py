@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import io
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Callable
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.common.pdf import cached_pdf_path, store_cached_pdf
+from core.common.response_cache import bump_tags
+from services.forecast.models.forecast import Forecast
+from services.forecast.models.production_pack import ProductionPack
+from services.forecast.render_worker import init_render_worker
+from services.order.rest.order_item.pdf import (
+    ORDER_FORM_PDF_NAMESPACE,
+    order_form_cache_key,
+    order_form_pdf_data,
+    render_order_form_pdf,
+)
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "ProductionPackError",
+    "merged_pdf_available",
+    "production_pack_forecasts",
+    "production_pack_path",
+    "build_production_pack",
+    "start_production_pack",
+    "fail_stale_production_packs",
+)
+
+STALE_ERROR = "Interrupted: the process building it stopped. Queue it again."
+
+
+class ProductionPackError(Exception):
+    """Raised when a production pack cannot be assembled."""
+
+
+def merged_pdf_available() -> bool:
+    """Merging PDFs needs the optional pypdf package."""
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass
+class _Entry:
+    index: int
+    forecast_number: str
+    object_id: str
+    key: str
+    order_form: object
+
+
+def production_pack_forecasts(date_from, date_to, printer=None):
+    """Forecasts a pack covers, in print order."""
+    queryset = Forecast.objects.filter(date_forecast__range=(date_from, date_to))
+    if printer is not None:
+        queryset = queryset.filter(order_item__product__printer=printer)
+
+    return (
+        queryset.select_related("order_item")
+        .prefetch_related("order_item__order_forms")
+        .order_by("date_forecast", "forecast_number")
+    )
+
+
+def production_pack_path(pack: ProductionPack) -> str:
+    return os.path.join(settings.PRODUCTION_PACK_ROOT, f"{pack.subid}.{pack.output_format}")
+
+
+def _collect(pack: ProductionPack) -> tuple[list[_Entry], list[dict]]:
+    entries = []
+    skipped = []
+
+    for forecast in production_pack_forecasts(pack.date_from, pack.date_to, pack.printer):
+        # Only konveksi forecasts have a printable order form; stock and
+        # marketplace forecasts are listed as skipped.
+        if forecast.is_stock or forecast.order_item is None:
+            skipped.append(
+                {
+                    "forecast_number": forecast.forecast_number,
+                    "reason": "Stock" if forecast.is_stock else "Marketplace",
+                }
+            )
+            continue
+
+        order_forms = forecast.order_item.order_forms.all()
+        if not order_forms:
+            skipped.append(
+                {"forecast_number": forecast.forecast_number, "reason": "Order form not found"}
+            )
+            continue
+
+        entries.append(
+            _Entry(
+                index=len(entries),
+                forecast_number=forecast.forecast_number,
+                object_id=forecast.order_item.subid,
+                key=order_form_cache_key(order_forms[0]),
+                order_form=order_forms[0],
+            )
+        )
+
+    return entries, skipped
+
+
+def _write_atomic(path: str, write: Callable):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _write_zip(path: str, entries: list[_Entry], pdfs: dict):
+    def write(f):
+        # PDFs are already compressed.
+        with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_STORED) as archive:
+            for entry in entries:
+                if entry.index in pdfs:
+                    archive.writestr(
+                        f"{entry.index + 1:03d}_{entry.forecast_number}.pdf", pdfs[entry.index]
+                    )
+
+    _write_atomic(path, write)
+
+
+def _write_merged_pdf(path: str, entries: list[_Entry], pdfs: dict):
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        raise ProductionPackError("A merged PDF needs pypdf installed; choose ZIP instead.")
+
+    merged = PdfWriter()
+    for entry in entries:
+        if entry.index in pdfs:
+            merged.append(io.BytesIO(pdfs[entry.index]))
+
+    _write_atomic(path, merged.write)
+
+
+def build_production_pack(
+    pack: ProductionPack,
+    *,
+    workers: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> ProductionPack:
+    """
+    Renders the order forms of every forecast `pack` covers and writes them,
+    in print order, to one ZIP or merged PDF.
+
+    Forms already in the order form PDF cache are read from disk; the rest
+    are rendered in a process pool and cached on the way. `pack` is updated
+    as forms complete so clients can poll its progress.
+    """
+    pack.status = ProductionPack.STATUS_RUNNING
+    pack.started = timezone.now()
+    pack.completed = 0
+    pack.error = ""
+    pack.save(update_fields=["status", "started", "completed", "error", "updated"])
+
+    try:
+        entries, skipped = _collect(pack)
+        pack.total = len(entries)
+        pack.skipped = skipped
+        pack.save(update_fields=["total", "skipped", "updated"])
+
+        pdfs = {}
+        pending = []
+        for entry in entries:
+            try:
+                with open(cached_pdf_path(ORDER_FORM_PDF_NAMESPACE, entry.object_id, entry.key), "rb") as f:
+                    pdfs[entry.index] = f.read()
+            except FileNotFoundError:
+                pending.append(entry)
+
+        def advance():
+            pack.completed += 1
+            # update() skips signals: move `updated` and the tag by hand, or
+            # pollers holding an ETag would keep getting 304s.
+            ProductionPack.objects.filter(pk=pack.pk).update(
+                completed=pack.completed, updated=timezone.now()
+            )
+            bump_tags(ProductionPack)
+            if progress:
+                progress(pack.completed, pack.total)
+
+        for _ in pdfs:
+            advance()
+
+        if pending:
+            max_workers = min(
+                workers or settings.PRODUCTION_PACK_WORKERS or os.cpu_count() or 1,
+                len(pending),
+            )
+            # "spawn" so workers never inherit locks or connections from a
+            # threaded web process; each sets Django up once.
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_render_worker,
+                initargs=(os.getpid(),),
+            ) as executor:
+                # Serialized here, where the database is: workers only render.
+                futures = {
+                    executor.submit(render_order_form_pdf, order_form_pdf_data(entry.order_form)): entry
+                    for entry in pending
+                }
+                for future in as_completed(futures):
+                    entry = futures[future]
+                    try:
+                        pdfs[entry.index] = future.result()
+                    except Exception as e:
+                        logger.exception("Order form %s failed to render", entry.forecast_number)
+                        pack.skipped.append(
+                            {"forecast_number": entry.forecast_number, "reason": str(e)}
+                        )
+                        continue
+
+                    try:
+                        store_cached_pdf(
+                            ORDER_FORM_PDF_NAMESPACE, entry.object_id, entry.key, pdfs[entry.index]
+                        )
+                    except OSError:
+                        logger.exception("Could not cache order form %s", entry.forecast_number)
+                    advance()
+
+        if pack.output_format == ProductionPack.FORMAT_PDF:
+            _write_merged_pdf(production_pack_path(pack), entries, pdfs)
+        else:
+            _write_zip(production_pack_path(pack), entries, pdfs)
+
+        pack.file = os.path.basename(production_pack_path(pack))
+        pack.status = ProductionPack.STATUS_DONE
+    except Exception as e:
+        logger.exception("Production pack %s failed", pack.subid)
+        pack.status = ProductionPack.STATUS_FAILED
+        pack.error = str(e)
+
+    pack.finished = timezone.now()
+    pack.save()
+    return pack
+
+
+def start_production_pack(pack: ProductionPack):
+    """Builds `pack` in a background thread once the current transaction commits."""
+
+    def run():
+        try:
+            build_production_pack(ProductionPack.objects.get(pk=pack.pk))
+        finally:
+            connection.close()
+
+    transaction.on_commit(
+        lambda: threading.Thread(
+            target=run, name=f"production-pack-{pack.subid}", daemon=True
+        ).start()
+    )
+
+
+def fail_stale_production_packs() -> int:
+    """
+    Fails the packs a stopped worker left pending or running: builds run in
+    a thread of the web process, which a restart or recycle takes down
+    mid-render. A pack is stale once its progress (`updated`) has not moved
+    for PRODUCTION_PACK_STALE_AFTER seconds; clients then see it failed and
+    can queue it again.
+    """
+    now = timezone.now()
+    failed = ProductionPack.objects.stale(
+        now - timedelta(seconds=settings.PRODUCTION_PACK_STALE_AFTER)
+    ).update(status=ProductionPack.STATUS_FAILED, error=STALE_ERROR, finished=now, updated=now)
+    if failed:
+        logger.warning("Failed %s stale production packs", failed)
+        bump_tags(ProductionPack)
+    return failed
@@ -0,0 +1,29 @@
+"""
+Initializer of the production pack render processes. Kept free of model
+imports: spawned processes load it before Django is set up.
+"""
+
+import os
+import threading
+import time
+
+import django
+
+__all__ = ("init_render_worker",)
+
+# How often a render process checks that the process that started it lives
+PARENT_CHECK_SECONDS = 5
+
+
+def _exit_with_parent(parent_pid):
+    while os.getppid() == parent_pid:
+        time.sleep(PARENT_CHECK_SECONDS)
+    os._exit(1)
+
+
+def init_render_worker(parent_pid):
+    django.setup()
+
+    # A web worker restarted mid-render would otherwise leave its render
+    # processes behind, waiting for work that never comes.
+    threading.Thread(target=_exit_with_parent, args=(parent_pid,), daemon=True).start()
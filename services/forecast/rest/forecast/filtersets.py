@@ -2,6 +2,7 @@ import django_filters
 from services.forecast.rest.forecast.filters.mixins import PrinterFabricBaseFilterSet
 
 from services.forecast.models import Forecast
+from services.forecast.models.forecast import ForecastStage
 
 
 class ForecastFilterSet(PrinterFabricBaseFilterSet):
@@ -44,6 +45,12 @@ class ForecastFilterSet(PrinterFabricBaseFilterSet):
         field_name="sewer_distributions__sewer__subid", lookup_expr="exact"
     )
 
+    # 🚀 Workflow position (?stage=3&stage=4), one range on the indexed column
+    stage = django_filters.TypedMultipleChoiceFilter(
+        choices=ForecastStage.choices,
+        coerce=int,
+    )
+
     # # Print verification
     # is_approved = django_filters.BooleanFilter(
     #     field_name="print_verifications__is_approved", lookup_expr="exact"
@@ -65,20 +72,28 @@ class ForecastFilterSet(PrinterFabricBaseFilterSet):
             # "type",
             # "is_approved",
             "sewer",
+            "stage",
         ]
 
-    def filter_has_qc_finishing(self, queryset, name, value):
+    def _filter_has_step(self, queryset, relation, value):
         """
-        value = True  -> Forecast WITH QCFinishing
-        value = False -> Forecast WITHOUT QCFinishing
+        Whether the step's row exists. Not read off `stage`: steps can be
+        recorded out of order, and `stage` is only the first one missing.
         """
         if value is True:
-            return queryset.filter(qc_finishings__isnull=False)
+            return queryset.filter(**{f"{relation}__isnull": False})
         if value is False:
-            return queryset.filter(qc_finishings__isnull=True)
+            return queryset.filter(**{f"{relation}__isnull": True})
 
         return queryset
 
+    def filter_has_qc_finishing(self, queryset, name, value):
+        """
+        value = True  -> Forecast WITH QCFinishing
+        value = False -> Forecast WITHOUT QCFinishing
+        """
+        return self._filter_has_step(queryset, "qc_finishings", value)
+
     def filter_has_qc_finishing_defect(self, queryset, name, value):
         """
         value = True  -> Forecast WITH QCFinishingDefect
@@ -96,57 +111,32 @@ class ForecastFilterSet(PrinterFabricBaseFilterSet):
         value = True  -> Forecast WITH
         value = False -> Forecast WITHOUT
         """
-        if value is True:
-            return queryset.filter(qc_cutting_verifications__isnull=False)
-        if value is False:
-            return queryset.filter(qc_cutting_verifications__isnull=True)
-
-        return queryset
+        return self._filter_has_step(queryset, "qc_cutting_verifications", value)
 
     def filter_has_qc_line_verification(self, queryset, name, value):
         """
         value = True  -> Forecast WITH
         value = False -> Forecast WITHOUT
         """
-        if value is True:
-            return queryset.filter(qc_line_verifications__isnull=False)
-        if value is False:
-            return queryset.filter(qc_line_verifications__isnull=True)
-
-        return queryset
+        return self._filter_has_step(queryset, "qc_line_verifications", value)
 
     def filter_has_print_verification(self, queryset, name, value):
         """
         value = True  -> Forecast WITH
         value = False -> Forecast WITHOUT
         """
-        if value is True:
-            return queryset.filter(print_verifications__isnull=False)
-        if value is False:
-            return queryset.filter(print_verifications__isnull=True)
-
-        return queryset
+        return self._filter_has_step(queryset, "print_verifications", value)
 
     def filter_has_warehouse_delivery(self, queryset, name, value):
         """
         value = True  -> Forecast WITH
         value = False -> Forecast WITHOUT
         """
-        if value is True:
-            return queryset.filter(warehouse_deliveries__isnull=False)
-        if value is False:
-            return queryset.filter(warehouse_deliveries__isnull=True)
-
-        return queryset
+        return self._filter_has_step(queryset, "warehouse_deliveries", value)
 
     def filter_has_warehouse_receipt(self, queryset, name, value):
         """
         value = True  -> Forecast WITH
         value = False -> Forecast WITHOUT
         """
-        if value is True:
-            return queryset.filter(warehouse_receipts__isnull=False)
-        if value is False:
-            return queryset.filter(warehouse_receipts__isnull=True)
-
-        return queryset
+        return self._filter_has_step(queryset, "warehouse_receipts", value)
@@ -5,12 +5,16 @@ from typing import TYPE_CHECKING
 
 from django.db import transaction
 from django.db.models import Q
+from django.db.models.fields.files import FieldFile
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
+from core.common.images import thumbnail_url
+from core.common.response_cache import bump_tags
 from core.common.serializers import BaseModelSerializer
 from services.customer.models.customer import Customer
 from services.customer.rest.customer.serializers import CustomerSerializerSimple
-from services.deposit.rest.deposit.serializers import DepositListSerializer
+from services.forecast.list_rows import refresh_rows_for
 from services.forecast.models.forecast import Forecast
 from services.forecast.models.stock_item import StockItem
 from services.forecast.models.stock_item_size import StockItemSize
@@ -31,7 +35,7 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-__all__ = ("ForecastSerializer",)
+__all__ = ("ForecastListRowSerializer", "ForecastSerializer")
 
 
 class StockItemSizeSerializer(BaseModelSerializer):
@@ -118,6 +122,79 @@ class StockItemListSerializer(FloatToIntRepresentationMixin, BaseModelSerializer
         return variant_type.unit.upper() if variant_type and variant_type.unit else None
 
 
+class ForecastListRowSerializer(BaseModelSerializer):
+    """
+    ForecastSerializer output for a forecast joined with its ForecastListRow:
+    the fields built from related rows are read from the flattened row.
+    Read only.
+    """
+
+    customer = serializers.ReadOnlyField(source="list_row.customer")
+    convection_name = serializers.ReadOnlyField(source="list_row.convection_name")
+    product_name = serializers.ReadOnlyField(source="list_row.product_name")
+    product_image = serializers.SerializerMethodField()
+    product_image_thumb = serializers.SerializerMethodField()
+    fabric_name = serializers.ReadOnlyField(source="list_row.fabric_name")
+    priority_status = serializers.ReadOnlyField(source="list_row.priority_status")
+    estimate_sent = serializers.ReadOnlyField(source="list_row.estimate_sent")
+    sku = serializers.ReadOnlyField(source="list_row.sku")
+    order = serializers.ReadOnlyField(source="list_row.order_subid")
+    order_item = serializers.ReadOnlyField(source="list_row.order_item_subid")
+    created_by = serializers.ReadOnlyField(source="list_row.created_by_subid")
+    details = serializers.ReadOnlyField(source="list_row.details")
+    count_po = serializers.ReadOnlyField(source="list_row.count_po")
+    progress = serializers.ReadOnlyField(source="list_row.stage")
+    lead_time = serializers.ReadOnlyField(source="list_row.lead_time")
+    printer = serializers.ReadOnlyField(source="list_row.printer")
+
+    class Meta:
+        model = Forecast
+        fields = [
+            "pk",
+            "forecast_number",
+            "customer",
+            "is_stock",
+            "convection_name",
+            "product_name",
+            "product_image",
+            "product_image_thumb",
+            "fabric_name",
+            "priority_status",
+            "estimate_sent",
+            "sku",
+            "order",
+            "order_item",
+            "date_forecast",
+            "print_status",
+            "created_by",
+            "created",
+            "updated",
+            "details",
+            "count_po",
+            "progress",
+            "lead_time",
+            "printer",
+        ]
+        read_only_fields = fields
+
+    def _image(self, obj):
+        name = obj.list_row.product_image
+        return FieldFile(None, Product._meta.get_field("image"), name) if name else None
+
+    def _absolute(self, url):
+        if not url:
+            return None
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
+
+    def get_product_image(self, obj):
+        image = self._image(obj)
+        return self._absolute(image.url if image else None)
+
+    def get_product_image_thumb(self, obj):
+        return self._absolute(thumbnail_url(self._image(obj)))
+
+
 class ForecastSerializer(BaseModelSerializer):
     """
     Serializer for Forecast management.
@@ -149,6 +226,7 @@ class ForecastSerializer(BaseModelSerializer):
     stock_item = StockItemInputSerializer(write_only=True, required=False)
     product_name = serializers.SerializerMethodField()
     product_image = serializers.SerializerMethodField()
+    product_image_thumb = serializers.SerializerMethodField()
     fabric_name = serializers.SerializerMethodField()
     # priority_status = serializers.SerializerMethodField()
     # estimate_sent = serializers.SerializerMethodField()
@@ -173,6 +251,7 @@ class ForecastSerializer(BaseModelSerializer):
             "stock_item",
             "product_name",
             "product_image",
+            "product_image_thumb",
             "fabric_name",
             "priority_status",
             "estimate_sent",
@@ -205,13 +284,27 @@ class ForecastSerializer(BaseModelSerializer):
             self.fields["stock_item"].required = True
 
     def to_representation(self, instance):
+        if self._get_list_row(instance) is not None:
+            return self.row_serializer.to_representation(instance)
+
         data = super().to_representation(instance)
         data["sku"] = self.sku(instance)
         data["printer"] = self.printer_display(instance)
         data["priority_status"] = self.priority_status(instance)
         data["estimate_sent"] = self.estimate_sent(instance)
         return data
-    
+
+    # 🚀 Shared fields from the flattened ForecastListRow, see
+    # services.forecast.list_rows. Only when the queryset joined it.
+    @cached_property
+    def row_serializer(self):
+        return ForecastListRowSerializer(context=self.context)
+
+    def _get_list_row(self, obj):
+        if not isinstance(obj, Forecast) or not Forecast.list_row.is_cached(obj):
+            return None
+        return getattr(obj, "list_row", None)
+
     # 💡 HELPER METHOD: Fetch the stock item once without hitting the DB
     def _get_stock_item(self, obj):
         # Uses the prefetch_related cache. Change 'stock_items' if related_name is different.
@@ -224,7 +317,7 @@ class ForecastSerializer(BaseModelSerializer):
         order_forms = obj.order.order_forms.all()
         return order_forms[0] if order_forms else None
 
-    def printer_display(self, obj):
+    def get_printer(self, obj):
         printer = None
 
         if obj.is_stock:
@@ -242,6 +335,10 @@ class ForecastSerializer(BaseModelSerializer):
                     # Assuming the foreign key on OrderForm is named 'printer'
                     printer = order_form.printer 
 
+        return printer
+
+    def printer_display(self, obj):
+        printer = self.get_printer(obj)
         if not printer:
             return None
 
@@ -286,7 +383,7 @@ class ForecastSerializer(BaseModelSerializer):
             return f"{product.marketplace} {date} Sesi {product.session}"
         return None
     
-    def get_product_image(self, obj):
+    def _get_product_image(self, obj):
         image = None
 
         if obj.is_stock:
@@ -303,7 +400,12 @@ class ForecastSerializer(BaseModelSerializer):
                 # image = order_form.image
                 image = None
 
-        if image and image.name:
+        return image if image and image.name else None
+
+    def get_product_image(self, obj):
+        image = self._get_product_image(obj)
+
+        if image:
             request = self.context.get("request")
             if request:
                 return request.build_absolute_uri(image.url)
@@ -311,35 +413,53 @@ class ForecastSerializer(BaseModelSerializer):
 
         return None
 
-    def get_fabric_name(self, obj):
+    def get_product_image_thumb(self, obj):
+        url = thumbnail_url(self._get_product_image(obj))
+
+        if url:
+            request = self.context.get("request")
+            if request:
+                return request.build_absolute_uri(url)
+            return url
+
+        return None
+
+    def get_fabric_type(self, obj):
         if obj.is_stock:
             stock_item = self._get_stock_item(obj)
-            return stock_item.fabric_type.name if stock_item and stock_item.fabric_type else None
+            return stock_item.fabric_type if stock_item else None
             
         if obj.order_item:
-            return obj.order_item.fabric_type.name if obj.order_item.fabric_type else None
+            return obj.order_item.fabric_type
             
         product = self._get_order_form(obj)
-        return product.fabric_type.name if product and product.fabric_type else None
+        return product.fabric_type if product else None
+
+    def get_fabric_name(self, obj):
+        fabric_type = self.get_fabric_type(obj)
+        return fabric_type.name if fabric_type else None
 
     def priority_status(self, obj):
         if obj.is_stock:
-            ps = obj.priority_status.upper()
+            ps = obj.priority_status
         else:
             if obj.order_item:
-                ps = obj.order_item.deposit.priority_status.upper()
+                deposit = obj.order_item.deposit
+                ps = deposit.priority_status if deposit else None
             else:
-                ps = obj.order.priority_status.upper()
+                ps = obj.order.priority_status if obj.order else None
 
-        return ps
+        return ps.upper() if ps else None
 
     def estimate_sent(self, obj):
         if obj.is_stock:
             es = obj.estimate_sent
         else:
             if obj.order_item:
-                deposit = DepositListSerializer(obj.order_item.deposit)
-                es = deposit.data["estimate_sent"]
+                # Uses the select_related deposit, no extra query
+                deposit = obj.order_item.deposit
+                due_date = deposit.get_estimate_sent() if deposit else None
+                es = due_date.strftime("%Y-%m-%d") if due_date else None
             else:
                 es = obj.order.estimated_shipping_date
 
@@ -347,35 +467,15 @@ class ForecastSerializer(BaseModelSerializer):
 
     def get_progress(self, obj):
         """
-        Progress = first missing workflow step
+        Progress = first missing workflow step, see Forecast.stage
         """
-    
-        steps = [
-            ("print_verifications", "Menunggu Verifikasi Print"),
-            ("qc_press_verifications", "Menunggu QC Press"),
-            ("qc_line_verifications", "Menunggu QC Line"),
-            ("qc_cutting_verifications", "Menunggu QC Cutting"),
-            (("qc_finishings", "qc_finishing_defects"), "Menunggu QC Finishing"),
-            ("warehouse_deliveries", "Menunggu Pengiriman Gudang"),
-            ("warehouse_receipts", "Menunggu Penerimaan Gudang"),
-        ]
-    
-        for relation, label in steps:
-            # if relation is grouped
-            if isinstance(relation, (list, tuple)):
-                if not all(hasattr(obj, r) for r in relation):
-                    return label
-            else:
-                if not hasattr(obj, relation):
-                    return label
-    
-        return "Selesai"
+        return obj.get_stage_display()
 
     def get_lead_time(self, obj):
         if obj.is_stock:
             lt = 0
         else:
-            if obj.order_item:
+            if obj.order_item and obj.order_item.deposit:
                 lt = obj.order_item.deposit.lead_time
             else:
                 lt = 0
@@ -414,6 +514,8 @@ class ForecastSerializer(BaseModelSerializer):
                         for size_obj in sizes_data
                     ]
                 )
+                bump_tags(StockItemSize)
+                refresh_rows_for(stock_item)
                 
         # TODO: update into queue entry logic
         queue = None
@@ -1,5 +1,4 @@
 from __future__ import annotations
-from services.forecast.models.stock_item import StockItem
 from services.forecast.rest.forecast.filtersets import ForecastFilterSet
 
 import logging
@@ -10,23 +9,12 @@ from django.utils.translation import gettext_lazy as _
 from core.common.viewsets import BaseViewSet
 from services.forecast.models.forecast import Forecast
 from services.forecast.rest.forecast.serializers import ForecastSerializer
-from core.common.filter_date import apply_date_filter
+from core.common.filter_date import apply_date_filter, apply_estimate_sent_date_filter
 
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django.db.models import (
-    Case,
-    When,
-    F,
-    Value,
-    CharField,
-    OuterRef,
-    Subquery,
-)
-from django.db.models.functions import Concat
-
-from services.order.models.order_form import OrderForm
+from django.db.models import F
 
 if TYPE_CHECKING:
     pass
@@ -44,51 +32,13 @@ class ForecastViewSet(BaseViewSet):
 
     my_tags = ["Forecasts"]
     
-    stock_product = StockItem.objects.filter(
-        forecast=OuterRef("pk")
-    ).values("product__name")[:1]
-
-    order_form = OrderForm.objects.filter(
-        order=OuterRef("order")
-    )
-    
-    stock_sku = StockItem.objects.filter(
-        forecast=OuterRef("pk")
-    ).values("product__sku")[:1]
-
-    queryset = Forecast.objects.all().annotate(
-        convection_name=Case(
-            When(is_stock=True, then=Value("STOK JB")),
-            default=F("order_item__order__convection_name"),
-            output_field=CharField(),
-        ),
-        product_name=Case(
-            When(
-                is_stock=True,
-                then=Subquery(stock_product),
-            ),
-            When(
-                order_item__isnull=False,
-                then=F("order_item__product__name"),
-            ),
-            default=Concat(
-                Subquery(order_form.values("marketplace")[:1]),
-                Value(" "),
-                # email_send_date formatting here is the problem
-                Value("Sesi "),
-                Subquery(order_form.values("session")[:1]),
-                output_field=CharField(),
-            ),
-            output_field=CharField(),
-        ),
-        sku_search=Case(
-            When(
-                is_stock=True,
-                then=Subquery(stock_sku),
-            ),
-            default=Value("Custom"),
-            output_field=CharField(),
-        )
+    # 🚀 Search and sort on the flattened ForecastListRow columns instead of
+    # per-row CASE/subqueries over stock items and order forms.
+    queryset = Forecast.objects.annotate(
+        due_date=F("list_row__due_date"),
+        convection_name=F("list_row__convection_name"),
+        product_name=F("list_row__product_name"),
+        sku_search=F("list_row__sku"),
     )
     serializer_class = ForecastSerializer
     lookup_field = "subid"
@@ -100,41 +50,55 @@ class ForecastViewSet(BaseViewSet):
         "convection_name",
         "product_name",
     ]
+    # 🚀 ?search= reads this full-text index, see services/forecast/search.py
+    search_index = "forecast"
 
     filterset_class = ForecastFilterSet
 
+    ordering_fields = ["created", "due_date"]
+
     required_perms = [
         "forecast.add_forecast",
         "forecast.change_forecast",
         "forecast.delete_forecast",
         "forecast.view_forecast",
     ]
+
+    # Only the detail: the list is filtered by date and changes constantly.
+    cache_actions = ("retrieve",)
+    cache_tags = (
+        "forecast.forecast",
+        "forecast.forecastlistrow",
+        "forecast.stockitem",
+        "forecast.stockitemsize",
+        "order.order",
+        "order.orderitem",
+        "order.orderform",
+        "order.orderformdetail",
+        "deposit.deposit",
+        "customer.customer",
+        "product.product",
+        "product.fabrictype",
+        "printer.printer",
+        "account.user",
+        # Workflow steps behind the has_* filters
+        "verification.printverification",
+        "verification.qcpressverification",
+        "verification.qclineverification",
+        "verification.qccuttingverification",
+        "verification.qcfinishing",
+        "verification.qcfinishingdefect",
+        "warehouse.warehousedelivery",
+        "warehouse.warehousereceipt",
+    )
     
     def get_queryset(self):
         queryset = super().get_queryset()
         queryset = apply_date_filter(queryset, "date_forecast", self.request)
+        queryset = apply_estimate_sent_date_filter(queryset, "due_date", self.request)
 
-        # 🚀 PREVENT N+1: Fetch all related foreign keys in one go
-        queryset = queryset.select_related(
-            "order",
-            "order__customer",
-            "order_item",
-            "order_item__order",
-            "order_item__order__customer",
-            "order_item__product",
-            "order_item__product__printer",
-            "order_item__fabric_type",
-            "order_item__deposit",
-        )
-
-        # 🚀 PREVENT N+1: Fetch reverse relations (like StockItem and OrderForm)
-        # Note: Change "stock_items" and "order_forms" if you defined custom related_names on those models.
-        queryset = queryset.prefetch_related(
-            "stock_items__product__printer",
-            "stock_items__fabric_type",
-            "order__order_forms", 
-            "order__order_forms__printer", # <-- ADD THIS LINE
-        )
+        # 🚀 PREVENT N+1: Fetch every relation the serializer reads in one go
+        queryset = queryset.with_list_relations()
 
         return queryset
 
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from rest_framework import serializers
+
+from core.common.serializers import BaseModelSerializer
+from services.forecast.models.production_pack import ProductionPack
+from services.forecast.production_pack import merged_pdf_available
+from services.printer.models.printer import Printer
+from services.printer.rest.printer.serializers import PrinterSerializer
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "ProductionPackSerializer",
+    "ProductionPackCreateSerializer",
+)
+
+
+class ProductionPackSerializer(BaseModelSerializer):
+    printer = PrinterSerializer(read_only=True)
+
+    class Meta:
+        model = ProductionPack
+        fields = (
+            "pk",
+            "status",
+            "output_format",
+            "date_from",
+            "date_to",
+            "printer",
+            "total",
+            "completed",
+            "skipped",
+            "error",
+            "started",
+            "finished",
+            "created",
+        )
+        read_only_fields = fields
+
+
+class ProductionPackCreateSerializer(BaseModelSerializer):
+    printer = serializers.SlugRelatedField(
+        slug_field="subid",
+        queryset=Printer.objects.all(),
+        required=False,
+        allow_null=True,
+    )
+
+    class Meta:
+        model = ProductionPack
+        fields = (
+            "date_from",
+            "date_to",
+            "printer",
+            "output_format",
+        )
+
+    def validate_output_format(self, value):
+        if value == ProductionPack.FORMAT_PDF and not merged_pdf_available():
+            raise serializers.ValidationError(
+                "A merged PDF is not available on this server; choose zip instead."
+            )
+        return value
+
+    def validate(self, attrs):
+        if attrs["date_to"] < attrs["date_from"]:
+            raise serializers.ValidationError(
+                {"date_to": "date_to must not be before date_from."}
+            )
+        return attrs
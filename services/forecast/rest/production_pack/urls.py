@@ -0,0 +1,13 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .views import ProductionPackViewSet
+
+# --- Router for ViewSets ---
+router = DefaultRouter()
+router.register(r"production-packs", ProductionPackViewSet, basename="production-pack")
+# --- End Router ---
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
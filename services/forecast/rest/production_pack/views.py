@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from core.common.media import send_file
+from core.common.viewsets import BaseViewSet
+from services.forecast.models.production_pack import ProductionPack
+from services.forecast.production_pack import (
+    fail_stale_production_packs,
+    production_pack_path,
+    start_production_pack,
+)
+from services.forecast.rest.production_pack.serializers import (
+    ProductionPackCreateSerializer,
+    ProductionPackSerializer,
+)
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = ("ProductionPackViewSet",)
+
+
+class ProductionPackViewSet(BaseViewSet):
+    """
+    Batch downloads of the order forms for a range of forecasts.
+
+    POST queues a pack and returns it straight away; poll it until `status`
+    is "done", then fetch the file from `download/`. A failed pack, including
+    one interrupted by a worker restart, is queued again with `retry/`.
+    """
+
+    required_module_code = "forecasting"
+
+    queryset = ProductionPack.objects.select_related("printer")
+    serializer_class = ProductionPackSerializer
+    serializer_map = {
+        "create": ProductionPackCreateSerializer,
+    }
+    lookup_field = "subid"
+    http_method_names = ["get", "post", "head", "options"]
+
+    filterset_fields = ["status"]
+
+    required_perms = [
+        "forecast.add_productionpack",
+        "forecast.view_productionpack",
+    ]
+    my_tags = ["Production Packs"]
+
+    def list(self, request, *args, **kwargs):
+        fail_stale_production_packs()
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        fail_stale_production_packs()
+        return super().retrieve(request, *args, **kwargs)
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        pack = serializer.save(created_by=request.user)
+
+        # 🚀 Rendering happens in the background; this request returns at once
+        start_production_pack(pack)
+
+        return Response(
+            ProductionPackSerializer(pack).data, status=status.HTTP_202_ACCEPTED
+        )
+
+    @action(detail=True, methods=["post"], url_path="retry")
+    def retry(self, request, *args, **kwargs):
+        pack = self.get_object()
+
+        if pack.status != ProductionPack.STATUS_FAILED:
+            return Response(
+                {"detail": f"Production pack is {pack.status}."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        pack.status = ProductionPack.STATUS_PENDING
+        pack.error = ""
+        pack.finished = None
+        pack.save(update_fields=["status", "error", "finished", "updated"])
+        start_production_pack(pack)
+
+        return Response(
+            ProductionPackSerializer(pack).data, status=status.HTTP_202_ACCEPTED
+        )
+
+    @action(detail=True, methods=["get"], url_path="download")
+    def download(self, request, *args, **kwargs):
+        pack = self.get_object()
+
+        if pack.status != ProductionPack.STATUS_DONE:
+            return Response(
+                {"detail": f"Production pack is {pack.status}."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        try:
+            return send_file(
+                request,
+                production_pack_path(pack),
+                as_attachment=True,
+                filename=f"production_pack_{pack.date_from}_{pack.date_to}.{pack.output_format}",
+            )
+        except FileNotFoundError:
+            return Response(
+                {"detail": "Production pack file not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
@@ -1,9 +1,11 @@
 from django.urls import include, path
 
 from .forecast import urls as forecast_urls
+from .production_pack import urls as production_pack_urls
 
 app_name = "forecast"
 
 urlpatterns = [
     path("forecast/", include(forecast_urls)),
+    path("forecast/", include(production_pack_urls)),
 ]
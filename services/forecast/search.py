@@ -0,0 +1,14 @@
+from services.forecast.models.forecast import Forecast
+from services.search.registry import register
+
+# ForecastViewSet: the shared columns come from ForecastListRow
+register(
+    "forecast",
+    Forecast,
+    [
+        "forecast_number",
+        "list_row__sku",
+        "list_row__convection_name",
+        "list_row__product_name",
+    ],
+)
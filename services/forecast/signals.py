@@ -0,0 +1,93 @@
+from django.apps import apps
+from django.db import connection, transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+
+from services.forecast.list_rows import (
+    DEFERRED_SOURCE_MODELS,
+    SOURCE_MODELS,
+    affected_forecast_ids,
+    refresh_forecast_rows,
+    refresh_rows_for,
+)
+
+# Set on instances being deleted, read back once the delete went through
+_AFFECTED_ATTR = "_list_row_forecasts"
+
+# Saved shared rows waiting for the transaction to commit, on the connection
+_PENDING_ATTR = "_list_row_sources"
+
+
+def _flush_pending():
+    pending = connection.__dict__.pop(_PENDING_ATTR, None)
+    if pending:
+        refresh_rows_for(*pending.values())
+
+
+def _schedule_refresh(instance):
+    """
+    Refreshes the rows `instance` feeds when the current transaction
+    commits, once per saved row however often it is saved.
+    """
+    if not connection.in_atomic_block:
+        refresh_rows_for(instance)
+        return
+
+    pending = connection.__dict__.get(_PENDING_ATTR)
+    # A rolled back transaction drops its callbacks but not our dict.
+    scheduled = any(func is _flush_pending for _, func, *_ in connection.run_on_commit)
+    if pending is None or not scheduled:
+        pending = connection.__dict__[_PENDING_ATTR] = {}
+        transaction.on_commit(_flush_pending)
+    pending[(instance._meta.label_lower, instance.pk)] = instance
+
+
+def refresh_list_rows(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if instance._meta.label_lower in DEFERRED_SOURCE_MODELS:
+        _schedule_refresh(instance)
+        return
+    refresh_forecast_rows(affected_forecast_ids(instance))
+
+
+def collect_list_rows(sender, instance, **kwargs):
+    # Relations may be gone (or set to NULL) after the delete.
+    setattr(instance, _AFFECTED_ATTR, affected_forecast_ids(instance))
+
+
+def refresh_deleted_list_rows(sender, instance, **kwargs):
+    refresh_forecast_rows(getattr(instance, _AFFECTED_ATTR, ()))
+
+
+def refresh_deleted_step_stage(sender, instance, **kwargs):
+    # After commit: when the forecast itself is being deleted, its steps go
+    # first and there is nothing left to refresh.
+    forecast_id = instance.forecast_id
+
+    def refresh():
+        from services.forecast.models.forecast import Forecast
+
+        forecast = Forecast.objects.filter(pk=forecast_id).first()
+        if forecast is not None:
+            forecast.refresh_stage()
+
+    transaction.on_commit(refresh)
+
+
+def connect():
+    from services.forecast.models.forecast import STAGE_STEPS, Forecast
+
+
+    for label in SOURCE_MODELS:
+        model = apps.get_model(label)
+        uid = f"forecast_list_rows:{label}"
+        post_save.connect(refresh_list_rows, sender=model, dispatch_uid=uid)
+        pre_delete.connect(collect_list_rows, sender=model, dispatch_uid=uid)
+        post_delete.connect(refresh_deleted_list_rows, sender=model, dispatch_uid=uid)
+
+    # Undoing a workflow step moves the stored stage back.
+    for _, relation in STAGE_STEPS:
+        model = Forecast._meta.get_field(relation).related_model
+        post_delete.connect(
+            refresh_deleted_step_stage, sender=model, dispatch_uid=f"forecast_stage:{relation}"
+        )
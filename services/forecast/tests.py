@@ -1,3 +1,338 @@
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from services.account.models.user import User
+from services.customer.models.customer import Customer
+from services.deposit.models.deposit import Deposit
+from services.forecast.list_rows import refresh_rows_for
+from services.forecast.models import Forecast, ForecastStageEvent
+from services.forecast.models.forecast import ForecastStage
+from services.forecast.models.stock_item import StockItem
+from services.forecast.models.forecast_list_row import ForecastListRow
+from services.forecast.models.production_pack import ProductionPack
+from services.forecast.production_pack import STALE_ERROR
+from services.forecast.rest.forecast.filtersets import ForecastFilterSet
+from services.forecast.rest.forecast.serializers import ForecastSerializer
+from services.order.models.order import Order
+from services.order.models.order_item import OrderItem
+from services.printer.models.printer import Printer
+from services.product.models.fabric_type import FabricType
+from services.product.models.product import Product
+from services.store.models.store import Store
+from services.tracking.rest.order.serializers import TrackingSerializer
+from services.verification.models.print_verification import PrintVerification
+from services.verification.models.qc_line_verification import QCLineVerification
+from services.verification.models.qc_press_verification import QCPressVerification
+
+
+def stock_forecast(**kwargs):
+    return Forecast.objects.create(date_forecast=timezone.localdate(), is_stock=True, priority_status="reguler", **kwargs)
+
+
+def forecast_sources():
+    printer = Printer.objects.create(name="Printer")
+    store = Store.objects.create(name="Toko")
+    product = Product.objects.create(name="Jersey", sku="J-1", printer=printer, store=store)
+    fabric_type = FabricType.objects.create(name="Dryfit")
+    customer = Customer.objects.create(name="Budi", phone="0812", address="-", source="konveksi")
+    return printer, product, fabric_type, customer
+
+
+def make_forecasts(count, printer, product, fabric_type, customer):
+    """`count` each of stock, konveksi and marketplace forecasts."""
+    forecasts = []
+    for i in range(count):
+        stock = stock_forecast(printer=printer)
+        StockItem.objects.create(forecast=stock, product=product, fabric_type=fabric_type, quantity=3)
+
+        order = Order.objects.create(customer=customer, convection_name=f"Konveksi {i}", order_type="konveksi")
+        deposit = Deposit.objects.create(order=order, lead_time=7)
+        item = OrderItem.objects.create(
+            order=order, deposit=deposit, product=product, fabric_type=fabric_type, price=Decimal(1), quantity=3
+        )
+        konveksi = Forecast.objects.create(order_item=item, order=order, date_forecast=timezone.localdate(), printer=printer)
+
+        shop = Order.objects.create(customer=customer, order_type="marketplace", marketplace="shopee", order_number=f"S-{i}")
+        marketplace = Forecast.objects.create(order=shop, date_forecast=timezone.localdate(), printer=printer)
+        forecasts += [stock, konveksi, marketplace]
+    return forecasts
+
+
+class ForecastListQueryTests(TestCase):
+    url = "/api/forecast/forecasts/"
+
+    @classmethod
+    def setUpTestData(cls):
+        make_forecasts(4, *forecast_sources())
+        cls.user = User.objects.create_superuser(username="admin", email="admin@example.com", password="x")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        # Warm the per-user permission cache; the page is then validators,
+        # count and one joined select
+        self.client.get(self.url, {"limit": 1})
+
+    def test_query_count_does_not_grow_with_the_page(self):
+        for limit in (3, 12):
+            with self.subTest(limit=limit), self.assertNumQueries(3):
+                response = self.client.get(self.url, {"limit": limit})
+            self.assertEqual(len(response.data["results"]), limit)
+
+    def test_uncounted_pages_skip_the_validators(self):
+        # No MAX(updated)/COUNT(*) aggregate, no count: the page select only
+        for params in ({"count": "none"}, {"pagination": "cursor"}):
+            with self.subTest(**params), self.assertNumQueries(1):
+                response = self.client.get(self.url, {"limit": 3, **params})
+            self.assertNotIn("ETag", response)
+
+    def test_counted_pages_answer_conditional_gets(self):
+        etag = self.client.get(self.url, {"limit": 3})["ETag"]
+        response = self.client.get(self.url, {"limit": 3}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Signed media URLs in the body rotate with the signing period
+        later = time.time() + settings.MEDIA_URL_MAX_AGE
+        with mock.patch("core.common.storage.time.time", return_value=later):
+            response = self.client.get(self.url, {"limit": 3}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class CursorPaginationTests(TestCase):
+    url = "/api/forecast/forecasts/"
+
+    @classmethod
+    def setUpTestData(cls):
+        for _ in range(11):
+            stock_forecast()
+        # Ties on the sort key: the primary key has to break them.
+        Forecast.objects.filter(pk__in=list(Forecast.objects.values_list("pk", flat=True)[:6])).update(
+            created=timezone.now() - timedelta(days=1)
+        )
+        cls.user = User.objects.create_superuser(username="admin", email="admin@example.com", password="x")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def walk(self, params):
+        pages, response = [], self.client.get(self.url, params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            pages.append([row["forecast_number"] for row in response.data["results"]])
+            if not response.data["next"]:
+                return pages, response
+            response = self.client.get(response.data["next"])
+
+    def test_pages_cover_every_row_once_in_order(self):
+        expected = list(Forecast.objects.order_by("-created", "-id").values_list("forecast_number", flat=True))
+        pages, last = self.walk({"pagination": "cursor", "limit": 4})
+        self.assertEqual([len(page) for page in pages], [4, 4, 3])
+        self.assertEqual(sum(pages, []), expected)
+
+        # And back again from the last page
+        previous, response = [], last
+        while response.data["previous"]:
+            response = self.client.get(response.data["previous"])
+            previous.insert(0, [row["forecast_number"] for row in response.data["results"]])
+        self.assertEqual(previous, pages[:-1])
+
+    def test_follows_the_requested_ordering(self):
+        expected = list(Forecast.objects.order_by("created", "id").values_list("forecast_number", flat=True))
+        pages, _ = self.walk({"pagination": "cursor", "limit": 5, "ordering": "created"})
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_no_count_unless_asked(self):
+        response = self.client.get(self.url, {"pagination": "cursor", "limit": 4})
+        self.assertIsNone(response.data.get("count"))
+
+
+class ListRowTests(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.printer, self.product, self.fabric_type, self.customer = forecast_sources()
+            self.forecasts = make_forecasts(1, self.printer, self.product, self.fabric_type, self.customer)
+
+    def assertRowsMatchSource(self):
+        from_rows = ForecastSerializer(Forecast.objects.with_list_relations().order_by("pk"), many=True).data
+        from_source = ForecastSerializer(Forecast.objects.with_source_relations().order_by("pk"), many=True).data
+        self.assertEqual(len(from_rows), len(self.forecasts))
+        for row, source in zip(from_rows, from_source):
+            self.assertEqual(dict(row), dict(source))
+
+    def test_every_forecast_gets_a_row(self):
+        self.assertEqual(ForecastListRow.objects.count(), len(self.forecasts))
+        self.assertRowsMatchSource()
+
+    def test_source_edits_refresh_the_rows(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.customer.name = "Budi Santoso"
+            self.customer.save()
+            self.product.name = "Jersey Pro"
+            self.product.save()
+            self.product.save()
+        # Shared rows are refreshed once, after commit
+        refreshes = [callback for callback in callbacks if callback.__module__ == "services.forecast.signals"]
+        self.assertEqual(len(refreshes), 1)
+        # QuerySet.update() sends no signals: bulk callers refresh by hand
+        Deposit.objects.update(lead_time=14)
+        refresh_rows_for(*Deposit.objects.all())
+        self.assertRowsMatchSource()
+
+    def test_deleted_forecast_drops_its_row(self):
+        self.forecasts[0].delete()
+        self.assertFalse(ForecastListRow.objects.filter(forecast_id=self.forecasts[0].pk).exists())
+
+
+class StageTests(TestCase):
+    def filtered(self, **params):
+        return set(ForecastFilterSet(params, queryset=Forecast.objects.all()).qs.values_list("pk", flat=True))
+
+    def test_stage_is_the_first_missing_step(self):
+        forecast = stock_forecast()
+        self.assertEqual(forecast.stage, ForecastStage.PRINT)
+
+        PrintVerification.objects.create(forecast=forecast)
+        QCLineVerification.objects.create(forecast=forecast, defect_area=[])
+        forecast.refresh_stage()
+        self.assertEqual(forecast.stage, ForecastStage.QC_PRESS)
+
+        QCPressVerification.objects.create(forecast=forecast, defect_area=[])
+        forecast.refresh_stage()
+        self.assertEqual(forecast.stage, ForecastStage.QC_CUTTING)
+        self.assertEqual(forecast.stage_events.count(), 2)
+
+    def test_step_filters_follow_the_rows_not_the_stage(self):
+        # QC Line recorded before QC Press: the stage still waits for press.
+        forecast = stock_forecast()
+        PrintVerification.objects.create(forecast=forecast)
+        QCLineVerification.objects.create(forecast=forecast, defect_area=[])
+        forecast.refresh_stage()
+        other = stock_forecast()
+
+        self.assertEqual(self.filtered(has_qc_line_verification="true"), {forecast.pk})
+        self.assertEqual(self.filtered(has_qc_line_verification="false"), {other.pk})
+        self.assertEqual(self.filtered(stage=[str(ForecastStage.QC_PRESS)]), {forecast.pk})
+        self.assertEqual(self.filtered(stage=[str(ForecastStage.PRINT), str(ForecastStage.QC_PRESS)]), {forecast.pk, other.pk})
+
+    def test_tracking_shows_steps_recorded_out_of_order(self):
+        forecast = make_forecasts(1, *forecast_sources())[1]
+        QCPressVerification.objects.create(forecast=forecast, defect_area=[])
+        forecast.refresh_stage()
+        self.assertEqual(forecast.stage, ForecastStage.PRINT)
+
+        steps = TrackingSerializer().build_response(forecast.order)["forecasts"][0]["steps"]
+        self.assertEqual(
+            [step["status"] for step in steps[:3]], ["PENDING", "ACC", "PENDING"]
+        )
+
+    def test_deleting_a_step_moves_the_stage_back(self):
+        forecast = stock_forecast()
+        step = PrintVerification.objects.create(forecast=forecast)
+        forecast.refresh_stage()
+        self.assertEqual(forecast.stage, ForecastStage.QC_PRESS)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            step.delete()
+        forecast.refresh_from_db()
+        self.assertEqual(forecast.stage, ForecastStage.PRINT)
+        self.assertEqual(forecast.stage_events.count(), 2)
+
+    def test_deleting_a_forecast_with_steps(self):
+        forecast = stock_forecast()
+        PrintVerification.objects.create(forecast=forecast)
+        forecast.refresh_stage()
+        with self.captureOnCommitCallbacks(execute=True):
+            forecast.delete()
+        self.assertFalse(Forecast.objects.exists())
+
+
+class StageEventTests(TestCase):
+    def test_first_stage_dwell_counts_from_creation(self):
+        forecast = stock_forecast()
+        Forecast.objects.filter(pk=forecast.pk).update(created=timezone.now() - timedelta(hours=2))
+        forecast.refresh_from_db()
+
+        PrintVerification.objects.create(forecast=forecast)
+        self.assertTrue(forecast.refresh_stage())
+
+        event = forecast.stage_events.get()
+        self.assertEqual((event.from_stage, event.to_stage), (ForecastStage.PRINT, ForecastStage.QC_PRESS))
+        self.assertAlmostEqual(event.dwell_seconds, 7200, delta=5)
+
+    def test_later_stage_without_an_entry_event_has_no_dwell(self):
+        # A stage backfilled by reconcile_forecast_stages logs nothing.
+        forecast = stock_forecast()
+        forecast.stage = ForecastStage.QC_LINE
+        event = ForecastStageEvent.objects.record(forecast, ForecastStage.QC_PRESS)
+        self.assertIsNone(event.dwell_seconds)
+
+    def test_dwell_counts_from_the_previous_event(self):
+        forecast = stock_forecast()
+        PrintVerification.objects.create(forecast=forecast)
+        forecast.refresh_stage()
+        ForecastStageEvent.objects.filter(forecast=forecast).update(at=timezone.now() - timedelta(minutes=30))
+
+        forecast.stage = ForecastStage.QC_LINE
+        event = ForecastStageEvent.objects.record(forecast, ForecastStage.QC_PRESS)
+        self.assertAlmostEqual(event.dwell_seconds, 1800, delta=5)
+
+
+class StageLatencyViewTests(TestCase):
+    url = "/api/dashboard/stage-latency/"
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_superuser(username="admin", email="admin@example.com", password="x")
+        )
+
+    def test_end_date_includes_the_whole_day(self):
+        forecast = stock_forecast()
+        for day, hour in ((30, 9), (31, 23), (32, 0)):
+            at = timezone.make_aware(datetime(2026, 7, 1) + timedelta(days=day - 1, hours=hour))
+            ForecastStageEvent.objects.create(
+                forecast=forecast, from_stage=ForecastStage.PRINT, to_stage=ForecastStage.QC_PRESS, at=at, dwell_seconds=60
+            )
+
+        response = self.client.get(self.url, {"start_date": "2026-07-30", "end_date": "2026-07-31"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["count"], 2)
+
+
+class ProductionPackRecoveryTests(TestCase):
+    url = "/api/forecast/production-packs/"
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_superuser(username="admin", email="admin@example.com", password="x")
+        )
+        today = timezone.localdate()
+        self.pack = ProductionPack.objects.create(date_from=today, date_to=today, status=ProductionPack.STATUS_RUNNING)
+
+    def test_pack_making_progress_keeps_running(self):
+        response = self.client.get(f"{self.url}{self.pack.subid}/")
+        self.assertEqual(response.data["status"], ProductionPack.STATUS_RUNNING)
+
+    def test_interrupted_pack_fails_and_can_be_retried(self):
+        ProductionPack.objects.filter(pk=self.pack.pk).update(updated=timezone.now() - timedelta(hours=2))
+
+        response = self.client.get(f"{self.url}{self.pack.subid}/")
+        self.assertEqual(response.data["status"], ProductionPack.STATUS_FAILED)
+        self.assertEqual(response.data["error"], STALE_ERROR)
 
-# Create your tests here.
+        with mock.patch("services.forecast.rest.production_pack.views.start_production_pack") as start:
+            response = self.client.post(f"{self.url}{self.pack.subid}/retry/")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["status"], ProductionPack.STATUS_PENDING)
+        start.assert_called_once()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from PIL import Image, UnidentifiedImageError
+
+from services.order.models.order_form_upload import OrderFormUpload
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "ALLOWED_FORMATS",
+    "ChunkedUploadError",
+    "upload_part_path",
+    "start_upload",
+    "write_chunk",
+    "complete_upload",
+    "discard_upload",
+)
+
+# Pillow format -> MIME type accepted for order form files
+ALLOWED_FORMATS = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+}
+
+_COPY_BUFFER = 64 * 1024
+
+
+class ChunkedUploadError(Exception):
+    """Raised when a chunk or a finished upload is rejected."""
+
+
+def upload_part_path(upload: OrderFormUpload) -> str:
+    """The partially received file; chunks are written at their own offset."""
+    return os.path.join(settings.CHUNKED_UPLOAD_ROOT, f"{upload.subid}.part")
+
+
+def start_upload(upload: OrderFormUpload):
+    """Reserves the part file, so chunks can arrive in any order."""
+    path = upload_part_path(upload)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        # Sparse on most filesystems: no disk is used until chunks arrive
+        f.truncate(upload.size)
+
+
+def _chunk_length(upload: OrderFormUpload, index: int) -> int:
+    return min(upload.chunk_size, upload.size - index * upload.chunk_size)
+
+
+def write_chunk(upload: OrderFormUpload, index: int, stream) -> OrderFormUpload:
+    """
+    Streams chunk `index` from `stream` into the part file. Sending a chunk
+    again overwrites it, which is how a client resumes after a dropped
+    connection: it asks which chunks arrived and sends the rest.
+    """
+    if upload.status != OrderFormUpload.STATUS_PENDING:
+        raise ChunkedUploadError("Upload is already complete.")
+    if not 0 <= index < upload.chunk_count:
+        raise ChunkedUploadError(f"Chunk index must be between 0 and {upload.chunk_count - 1}.")
+
+    expected = _chunk_length(upload, index)
+    written = 0
+
+    try:
+        f = open(upload_part_path(upload), "r+b")
+    except FileNotFoundError:
+        raise ChunkedUploadError("Upload has expired, start a new one.")
+
+    with f:
+        f.seek(index * upload.chunk_size)
+        # 🚀 Constant memory: never more than one buffer of the body in RAM
+        while written <= expected:
+            data = stream.read(_COPY_BUFFER)
+            if not data:
+                break
+            written += len(data)
+            if written > expected:
+                break
+            f.write(data)
+
+    if written != expected:
+        raise ChunkedUploadError(f"Chunk {index} must be exactly {expected} bytes.")
+
+    # Chunks of one upload may arrive in parallel; record them one at a time.
+    with transaction.atomic():
+        upload = OrderFormUpload.objects.select_for_update().get(pk=upload.pk)
+        if index not in upload.received_chunks:
+            upload.received_chunks = sorted([*upload.received_chunks, index])
+            upload.save(update_fields=["received_chunks", "updated"])
+    return upload
+
+
+def _verify(upload: OrderFormUpload, path: str):
+    if os.path.getsize(path) != upload.size:
+        raise ChunkedUploadError("Assembled file does not match the declared size.")
+
+    if upload.checksum:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for data in iter(lambda: f.read(_COPY_BUFFER), b""):
+                digest.update(data)
+        if digest.hexdigest() != upload.checksum.lower():
+            raise ChunkedUploadError("Checksum does not match, resend the file.")
+
+    # Image.open() only parses the header; verify() checks PNG chunk CRCs
+    # block by block. Neither decodes the pixels.
+    try:
+        with Image.open(path) as image:
+            image_format = image.format
+            image.verify()
+    except (OSError, UnidentifiedImageError, SyntaxError, Image.DecompressionBombError):
+        raise ChunkedUploadError("File is not a readable image.")
+
+    if image_format not in ALLOWED_FORMATS:
+        raise ChunkedUploadError(
+            f"Invalid file type '{image_format}'. Only JPEG and PNG images are allowed."
+        )
+
+
+def complete_upload(upload: OrderFormUpload) -> OrderFormUpload:
+    """
+    Checks the assembled file and attaches it to the order form field.
+    """
+    if upload.status != OrderFormUpload.STATUS_PENDING:
+        raise ChunkedUploadError("Upload is already complete.")
+
+    missing = sorted(set(range(upload.chunk_count)) - set(upload.received_chunks))
+    if missing:
+        raise ChunkedUploadError(f"Missing chunks: {missing[:20]}")
+
+    path = upload_part_path(upload)
+    if not os.path.exists(path):
+        raise ChunkedUploadError("Upload has expired, start a new one.")
+
+    _verify(upload, path)
+
+    order_form = upload.order_form
+    with open(path, "rb") as f:
+        # Storage reads the file in chunks too, so this stays streaming.
+        getattr(order_form, upload.field).save(upload.filename, File(f), save=False)
+    order_form.save(update_fields=[upload.field, "updated"])
+
+    upload.status = OrderFormUpload.STATUS_COMPLETE
+    upload.completed = timezone.now()
+    upload.save(update_fields=["status", "completed", "updated"])
+
+    discard_upload(upload, delete=False)
+    return upload
+
+
+def discard_upload(upload: OrderFormUpload, *, delete: bool = True):
+    """Removes the part file and, unless `delete` is False, the upload itself."""
+    try:
+        os.remove(upload_part_path(upload))
+    except FileNotFoundError:
+        pass
+    if delete:
+        upload.delete()
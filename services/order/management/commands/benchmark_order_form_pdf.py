@@ -0,0 +1,95 @@
+import random
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from services.order.rest.order_item.pdf import render_order_form_pdf
+
+_SIZES = ["S", "M", "L", "XL", "XXL", "3XL", "4XL", "5XL"]
+_GENDERS = ["", " WOMEN", " KIDS"]
+_NAMES = ["BUDI", "SITI", "AGUS", "DEWI", "RIZKY", "PUTRI", "ANDI", "MUHAMMAD FARHAN"]
+
+
+_IMAGE_FIELDS = (
+    "design_front",
+    "design_back",
+    "preview_print_front",
+    "preview_print_back",
+    "logo_chest_right",
+    "logo_center",
+    "logo_chest_left",
+    "logo_back",
+    "logo_pants",
+)
+
+
+def _synthetic_order_form(rows: int, seed: int = 0, image: str | None = None) -> dict:
+    rng = random.Random(seed)
+    return {
+        **{field: image for field in _IMAGE_FIELDS},
+        "order_item_display": {"fabric_type": "Dryfit Milano", "unit": "pcs"},
+        "printer": {"name": "Printer 1"},
+        "deposit": {"priority_status": "normal", "order": {"identifier": "EZK-BENCHMARK"}},
+        "customer": {"name": "Benchmark FC"},
+        "team_name": "Benchmark FC",
+        "total_qty": rows,
+        "jersey_pattern": "Full print",
+        "jersey_type": "Setelan",
+        "jersey_cutting": "Reguler",
+        "collar_type": "V-neck",
+        "pants_cutting": "Reguler",
+        "details": [
+            {
+                "back_name": f"{rng.choice(_NAMES)} {i}",
+                "jersey_number": str(i % 100),
+                "shirt_size": rng.choice(_SIZES) + rng.choice(_GENDERS),
+                "pants_size": rng.choice(_SIZES),
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = "Render synthetic order form PDFs and report render time and peak memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[50, 500, 2000],
+            help="Roster sizes to render.",
+        )
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument(
+            "--image",
+            help="Image (path or /media/ URL) used for every design, preview and logo slot.",
+        )
+
+    def handle(self, *args, **options):
+        # Warm up module level caches (styles, fonts) outside the measurements.
+        render_order_form_pdf(_synthetic_order_form(1, image=options["image"]))
+
+        self.stdout.write(f"{'rows':>6} {'best ms':>10} {'mean ms':>10} {'peak MB':>9} {'size KB':>9}")
+        for rows in options["rows"]:
+            data = _synthetic_order_form(rows, image=options["image"])
+
+            timings = []
+            for _ in range(options["repeat"]):
+                start = time.perf_counter()
+                pdf = render_order_form_pdf(data)
+                timings.append(time.perf_counter() - start)
+
+            # Peak memory is measured separately; tracing slows the render down.
+            tracemalloc.start()
+            render_order_form_pdf(data)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            self.stdout.write(
+                f"{rows:>6} {min(timings) * 1000:>10.1f} "
+                f"{sum(timings) / len(timings) * 1000:>10.1f} "
+                f"{peak / 1024 / 1024:>9.1f} {len(pdf) / 1024:>9.1f}"
+            )
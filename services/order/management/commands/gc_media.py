@@ -0,0 +1,148 @@
+import os
+import posixpath
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.utils import timezone
+
+from core.common.images import THUMBNAIL_DIR
+from core.common.storage import content_addressed_fields
+from services.order.chunked_upload import discard_upload
+from services.order.models.order_form_upload import OrderFormUpload
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete content-addressed uploads that no row references anymore, "
+        "together with their thumbnails, and abandoned chunked uploads."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-age",
+            type=float,
+            default=24,
+            help="Only delete files older than this many hours, so uploads whose "
+            "row is not saved yet are left alone. Defaults to 24.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        fields = content_addressed_fields()
+        if not fields:
+            self.stdout.write("No content-addressed fields, nothing to do.")
+            return
+
+        storage = fields[0][1].storage
+        referenced = self.referenced_names(options["chunk_size"])
+
+        # upload_to callables only use the filename, so a stand-in works here.
+        roots = sorted(
+            {posixpath.dirname(field.generate_filename(None, "x")) for _, field in fields}
+        )
+        cutoff = time.time() - options["min_age"] * 3600
+        dry_run = options["dry_run"]
+
+        deleted = freed = 0
+        for root in roots:
+            for name, path in self.walk(storage.path(root), root):
+                if name in referenced:
+                    continue
+
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                if stat.st_mtime > cutoff:
+                    continue
+
+                deleted += 1
+                freed += stat.st_size
+                if dry_run:
+                    self.stdout.write(f"Would delete {name}")
+                    continue
+
+                os.remove(path)
+                self.delete_derivatives(path)
+
+        orphans = 0 if dry_run else self.delete_orphan_derivatives(storage, roots)
+
+        abandoned = OrderFormUpload.objects.filter(
+            status=OrderFormUpload.STATUS_PENDING,
+            updated__lt=timezone.now() - timedelta(hours=options["min_age"]),
+        )
+        if dry_run:
+            self.stdout.write(f"Would discard {abandoned.count()} abandoned chunked uploads")
+        else:
+            for upload in abandoned.iterator(chunk_size=options["chunk_size"]):
+                discard_upload(upload)
+
+        verb = "Would free" if dry_run else "Freed"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {freed / 1024 / 1024:.1f} MB in {deleted} unreferenced files"
+                f" ({len(referenced)} referenced, {orphans} orphan thumbnails removed)."
+            )
+        )
+
+    def referenced_names(self, chunk_size):
+        """
+        Every file name stored in any FileField, streamed in chunks so the
+        tables are never loaded whole. All file fields count, not only the
+        content-addressed ones, in case another field shares an upload folder.
+        """
+        referenced = set()
+        for model in apps.get_models():
+            names = [f.name for f in model._meta.get_fields() if isinstance(f, models.FileField)]
+            if not names:
+                continue
+
+            rows = model._default_manager.values_list(*names).iterator(chunk_size=chunk_size)
+            for values in rows:
+                referenced.update(value for value in values if value)
+        return referenced
+
+    def walk(self, directory, prefix):
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [d for d in dirnames if d != THUMBNAIL_DIR]
+            relative = os.path.relpath(dirpath, directory)
+            for filename in filenames:
+                if filename.startswith("."):
+                    continue
+                name = posixpath.normpath(posixpath.join(prefix, relative, filename))
+                yield name, os.path.join(dirpath, filename)
+
+    def delete_derivatives(self, path):
+        directory, filename = os.path.split(path)
+        thumbs = os.path.join(directory, THUMBNAIL_DIR)
+        try:
+            derivatives = os.listdir(thumbs)
+        except FileNotFoundError:
+            return
+
+        for derivative in derivatives:
+            if derivative.startswith(f"{filename}."):
+                os.remove(os.path.join(thumbs, derivative))
+
+    def delete_orphan_derivatives(self, storage, roots):
+        """
+        Thumbnails left behind by originals removed some other way.
+        """
+        removed = 0
+        for root in roots:
+            for dirpath, _, filenames in os.walk(storage.path(root)):
+                if os.path.basename(dirpath) != THUMBNAIL_DIR:
+                    continue
+
+                parent = os.path.dirname(dirpath)
+                for filename in filenames:
+                    # front.png.md.webp -> front.png
+                    original = filename.rsplit(".", 2)[0]
+                    if not os.path.exists(os.path.join(parent, original)):
+                        os.remove(os.path.join(dirpath, filename))
+                        removed += 1
+        return removed
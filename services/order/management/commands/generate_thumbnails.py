@@ -0,0 +1,53 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import models
+
+from core.common.images import THUMBNAIL_BUCKETS, ensure_derivative, pdf_derivative
+from services.order.models.order_form import OrderForm
+
+
+class Command(BaseCommand):
+    help = (
+        "Render missing or outdated image derivatives for every uploaded image, "
+        "so the first request after a deploy does not pay for them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--buckets",
+            nargs="+",
+            choices=list(THUMBNAIL_BUCKETS),
+            default=["md"],
+        )
+
+    def handle(self, *args, **options):
+        rendered = failed = 0
+
+        for model in apps.get_models():
+            if not model.__module__.startswith("services."):
+                continue
+
+            fields = [f.name for f in model._meta.get_fields() if isinstance(f, models.FileField)]
+            if not fields:
+                continue
+
+            for values in model.objects.values_list(*fields).iterator():
+                for name, value in zip(fields, values):
+                    if not value:
+                        continue
+
+                    path = model._meta.get_field(name).storage.path(value)
+
+                    for bucket in options["buckets"]:
+                        if ensure_derivative(path, bucket, "webp"):
+                            rendered += 1
+                        else:
+                            failed += 1
+
+                    # Order form uploads are also embedded in the order form PDF.
+                    if model is OrderForm and not pdf_derivative(path):
+                        failed += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{rendered} derivatives up to date, {failed} images unreadable.")
+        )
@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from core.common.spreadsheets import SpreadsheetError
+from services.order.marketplace_import import (
+    CHUNK_SIZE,
+    MARKETPLACE_CHOICES,
+    ORDER_CHOICE_CHOICES,
+    import_marketplace_orders,
+    read_marketplace_orders,
+)
+
+
+class Command(BaseCommand):
+    help = "Import marketplace orders from a Shopee/TikTok/Tokopedia CSV or XLSX export."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--marketplace", required=True, choices=MARKETPLACE_CHOICES)
+        parser.add_argument(
+            "--order-choice",
+            choices=ORDER_CHOICE_CHOICES,
+            help="Used for rows without an order choice column.",
+        )
+        parser.add_argument("--user", help="Email of the user recorded as created_by.")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        created_by = None
+        if options["user"]:
+            try:
+                created_by = get_user_model().objects.get(email=options["user"])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"User {options['user']} not found.")
+
+        try:
+            with open(options["path"], "rb") as upload:
+                report = import_marketplace_orders(
+                    read_marketplace_orders(upload),
+                    marketplace=options["marketplace"],
+                    order_choice=options["order_choice"],
+                    created_by=created_by,
+                    chunk_size=options["chunk_size"],
+                    dry_run=options["dry_run"],
+                )
+        except (OSError, SpreadsheetError) as e:
+            raise CommandError(str(e))
+
+        for error in report.errors:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Row {error['row']} ({error['order_number']}): {error['errors']}"
+                )
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Would create' if options['dry_run'] else 'Created'} {report.created}, "
+                f"skipped {report.skipped}, failed {report.failed}."
+            )
+        )
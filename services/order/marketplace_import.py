@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from django.db import DatabaseError, connection, transaction
+
+from core.common.response_cache import bump_tags
+from core.common.spreadsheets import cell_text, read_sheet
+from services.order.models.order import Order
+from services.queue_entry.models import QueueEntry
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "MARKETPLACE_CHOICES",
+    "ORDER_CHOICE_CHOICES",
+    "MarketplaceImportReport",
+    "read_marketplace_orders",
+    "import_marketplace_orders",
+)
+
+CHUNK_SIZE = 500
+
+MARKETPLACE_CHOICES = [value for value, _ in Order._meta.get_field("marketplace").choices]
+ORDER_CHOICE_CHOICES = [value for value, _ in Order._meta.get_field("order_choice").choices]
+
+# Shopee, TikTok Shop and Tokopedia export labels, see normalize_header().
+_HEADER_ALIASES = {
+    # order_number
+    "order number": "order_number",
+    "no pesanan": "order_number",
+    "nomor pesanan": "order_number",
+    "order id": "order_number",
+    "nomor invoice": "order_number",
+    "invoice": "order_number",
+    # user_name
+    "user name": "user_name",
+    "username (pembeli)": "user_name",
+    "username pembeli": "user_name",
+    "buyer username": "user_name",
+    "nama pembeli": "user_name",
+    "buyer name": "user_name",
+    # quantity
+    "quantity": "quantity",
+    "qty": "quantity",
+    "jumlah": "quantity",
+    "jumlah produk": "quantity",
+    "jumlah produk dibeli": "quantity",
+    # estimated_shipping_date
+    "estimated shipping date": "estimated_shipping_date",
+    "pesanan harus dikirimkan sebelum (menghindari keterlambatan)": "estimated_shipping_date",
+    "batas waktu pengiriman": "estimated_shipping_date",
+    "ship by date": "estimated_shipping_date",
+    # order_choice
+    "order choice": "order_choice",
+}
+
+_REQUIRED_COLUMNS = ("order_number", "user_name", "quantity")
+
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%d/%m/%Y",
+    "%d/%m/%Y %H:%M",
+    "%d-%m-%Y",
+)
+
+
+@dataclass
+class MarketplaceImportReport:
+    created: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: list = field(default_factory=list)
+
+    def fail(self, line, order_number, errors):
+        self.failed += 1
+        self.errors.append({"row": line, "order_number": order_number, "errors": errors})
+
+    def as_dict(self):
+        return {
+            "created": self.created,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "errors": self.errors,
+        }
+
+
+def _parse_date(value):
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+
+    text = cell_text(value)
+    if not text:
+        return None
+
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized date '{text}'.")
+
+
+def _parse_quantity(value) -> int:
+    text = cell_text(value).replace(".", "").replace(",", "")
+    return int(text or 0)
+
+
+def read_marketplace_orders(upload) -> Iterator[tuple[int, dict]]:
+    """
+    Streams (row number, row) pairs out of a marketplace export.
+
+    Exports list one line per product, so consecutive lines of the same order
+    are merged and their quantities summed.
+    """
+    pending = None
+    for line, raw in read_sheet(upload, _HEADER_ALIASES, _REQUIRED_COLUMNS):
+        row = {name: raw.get(name) for name in _HEADER_ALIASES.values()}
+        row["order_number"] = cell_text(row["order_number"])
+
+        if pending and row["order_number"] and pending[1]["order_number"] == row["order_number"]:
+            pending[1]["lines"].append(row["quantity"])
+            continue
+
+        if pending:
+            yield pending
+        row["lines"] = [row.pop("quantity")]
+        pending = (line, row)
+
+    if pending:
+        yield pending
+
+
+def _clean(row: dict, order_choice) -> dict:
+    errors = {}
+
+    order_number = row["order_number"]
+    if not order_number:
+        errors["order_number"] = ["This field is required."]
+    elif len(order_number) > 100:
+        errors["order_number"] = ["Ensure this field has no more than 100 characters."]
+
+    user_name = cell_text(row.get("user_name"))
+    if not user_name:
+        errors["user_name"] = ["This field is required."]
+    elif len(user_name) > 150:
+        errors["user_name"] = ["Ensure this field has no more than 150 characters."]
+
+    try:
+        quantity = sum(_parse_quantity(value) for value in row["lines"])
+        if quantity < 1:
+            errors["quantity"] = ["Ensure this value is greater than or equal to 1."]
+    except ValueError:
+        quantity = None
+        errors["quantity"] = ["A valid integer is required."]
+
+    choice = cell_text(row.get("order_choice")).lower() or order_choice
+    if choice not in ORDER_CHOICE_CHOICES:
+        errors["order_choice"] = [f'"{choice or ""}" is not a valid choice.']
+
+    try:
+        estimated_shipping_date = _parse_date(row.get("estimated_shipping_date"))
+    except ValueError as e:
+        estimated_shipping_date = None
+        errors["estimated_shipping_date"] = [str(e)]
+
+    if errors:
+        raise ValueError(errors)
+
+    return {
+        "order_number": order_number,
+        "user_name": user_name,
+        "quantity": quantity,
+        "order_choice": choice,
+        "estimated_shipping_date": estimated_shipping_date,
+    }
+
+
+def _generate_order_ids(count: int) -> list[str]:
+    # generate_order_id() is keyed on the millisecond, which a whole chunk
+    # shares, so keep its format but draw suffixes without repeats.
+    ts = int(time.time() * 1000)
+    identifiers = []
+    while len(identifiers) < count:
+        for suffix in random.sample(range(100, 1000), min(900, count - len(identifiers))):
+            identifiers.append(f"EZK-{ts}-{suffix}")
+        ts += 1
+    return identifiers
+
+
+def _batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _insert(orders: list[Order], created_by):
+    Order.objects.bulk_create(orders)
+    bump_tags(Order)
+
+    # MySQL does not hand back ids from a multi-row INSERT.
+    if not connection.features.can_return_rows_from_bulk_insert:
+        ids = dict(
+            Order.objects.filter(subid__in=[order.subid for order in orders]).values_list(
+                "subid", "pk"
+            )
+        )
+        for order in orders:
+            order.pk = ids[order.subid]
+
+    tickets = QueueEntry.generate_ticket_numbers(len(orders))
+    QueueEntry.objects.bulk_create(
+        [
+            QueueEntry(order=order, ticket_number=ticket, created_by=created_by)
+            for order, ticket in zip(orders, tickets)
+        ]
+    )
+
+
+def import_marketplace_orders(
+    rows: Iterable[tuple[int, dict]],
+    *,
+    marketplace: str,
+    order_choice: str | None = None,
+    created_by=None,
+    chunk_size: int = CHUNK_SIZE,
+    dry_run: bool = False,
+) -> MarketplaceImportReport:
+    """
+    Creates draft marketplace orders, each with its queue entry, from
+    `read_marketplace_orders` rows.
+
+    Orders whose number already exists for `marketplace` are skipped. Each
+    chunk costs one lookup and a handful of bulk INSERTs in its own
+    transaction, so a failing chunk does not roll back earlier ones.
+    """
+    report = MarketplaceImportReport()
+    seen = set()
+
+    for chunk in _batched(rows, chunk_size):
+        numbers = {row["order_number"] for _, row in chunk if row["order_number"]}
+        existing = set(
+            Order.objects.filter(
+                order_type="marketplace",
+                marketplace=marketplace,
+                order_number__in=numbers,
+            ).values_list("order_number", flat=True)
+        )
+
+        # Duplicates are skipped before validation so re-importing a file
+        # does not report every old row as failed.
+        orders = []
+        lines = []
+        for line, row in chunk:
+            if row["order_number"] in existing or row["order_number"] in seen:
+                report.skipped += 1
+                continue
+
+            try:
+                data = _clean(row, order_choice)
+            except ValueError as e:
+                report.fail(line, row["order_number"], e.args[0])
+                continue
+
+            seen.add(data["order_number"])
+            orders.append(
+                Order(
+                    order_type="marketplace",
+                    marketplace=marketplace,
+                    status="draft",
+                    created_by=created_by,
+                    **data,
+                )
+            )
+            lines.append((line, data["order_number"]))
+
+        if not orders:
+            continue
+
+        for order, identifier in zip(orders, _generate_order_ids(len(orders))):
+            order.identifier = identifier
+
+        if dry_run:
+            report.created += len(orders)
+            continue
+
+        try:
+            with transaction.atomic():
+                _insert(orders, created_by)
+        except DatabaseError as e:
+            logger.exception("Marketplace import chunk failed")
+            for line, order_number in lines:
+                report.fail(line, order_number, {"non_field_errors": [str(e)]})
+            continue
+
+        report.created += len(orders)
+
+    return report
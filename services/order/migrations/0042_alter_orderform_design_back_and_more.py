@@ -0,0 +1,59 @@
+# Generated by Django 5.2.6 on 2026-10-17 23:52
+
+import core.common.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0041_alter_order_identifier'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='orderform',
+            name='design_back',
+            field=models.FileField(blank=True, max_length=255, null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='designs/'),
+        ),
+        migrations.AlterField(
+            model_name='orderform',
+            name='design_front',
+            field=models.FileField(blank=True, max_length=255, null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='designs/'),
+        ),
+        migrations.AlterField(
+            model_name='orderform',
+            name='logo_back',
+            field=models.FileField(blank=True, max_length=255, null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='logos/'),
+        ),
+        migrations.AlterField(
+            model_name='orderform',
+            name='logo_center',
+            field=models.FileField(blank=True, max_length=255, null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='logos/'),
+        ),
+        migrations.AlterField(
+            model_name='orderform',
+            name='logo_chest_left',
+            field=models.FileField(blank=True, max_length=255, null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='logos/'),
+        ),
+        migrations.AlterField(
+            model_name='orderform',
+            name='logo_chest_right',
+            field=models.FileField(blank=True, max_length=255, null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='logos/'),
+        ),
+        migrations.AlterField(
+            model_name='orderform',
+            name='logo_pants',
+            field=models.FileField(blank=True, max_length=255, null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='logos/'),
+        ),
+        migrations.AlterField(
+            model_name='orderform',
+            name='preview_print_back',
+            field=models.FileField(blank=True, max_length=255, null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='preview_prints/'),
+        ),
+        migrations.AlterField(
+            model_name='orderform',
+            name='preview_print_front',
+            field=models.FileField(blank=True, max_length=255, null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='preview_prints/'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.6 on 2026-10-17 23:56
+
+import core.common.generators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0042_alter_orderform_design_back_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderFormUpload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subid', models.CharField(blank=True, db_column='subid', default=core.common.generators.default_subid_generator, editable=False, help_text='Primary key shown to user.', max_length=64, null=True, unique=True, verbose_name='subid')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('complete', 'Complete')], default='pending', max_length=20)),
+                ('field', models.CharField(choices=[('design_front', 'design_front'), ('design_back', 'design_back'), ('preview_print_front', 'preview_print_front'), ('preview_print_back', 'preview_print_back'), ('logo_chest_right', 'logo_chest_right'), ('logo_center', 'logo_center'), ('logo_chest_left', 'logo_chest_left'), ('logo_back', 'logo_back'), ('logo_pants', 'logo_pants')], max_length=30)),
+                ('filename', models.CharField(max_length=255)),
+                ('size', models.PositiveBigIntegerField()),
+                ('chunk_size', models.PositiveIntegerField()),
+                ('checksum', models.CharField(blank=True, default='', max_length=64)),
+                ('received_chunks', models.JSONField(blank=True, default=list)),
+                ('completed', models.DateTimeField(blank=True, null=True)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+                ('order_form', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='uploads', to='order.orderform')),
+            ],
+            options={
+                'verbose_name': 'Order Form Upload',
+                'verbose_name_plural': 'Order Form Uploads',
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:45
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0043_orderformupload'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='orderformupload',
+            options={'default_permissions': (), 'verbose_name': 'Order Form Upload', 'verbose_name_plural': 'Order Form Uploads'},
+        ),
+    ]
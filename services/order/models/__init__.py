@@ -4,3 +4,4 @@ from .invoice import *
 from .order_extra_cost import *
 from .order_form import *
 from .order_form_detail import *
+from .order_form_upload import *
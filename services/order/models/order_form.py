@@ -7,6 +7,7 @@ from django.db import models
 
 # from django.utils.translation import gettext_lazy as _
 from core.common.models import get_subid_model
+from core.common.storage import content_addressed_storage
 from services.printer.models.printer import Printer
 from services.product.models.fabric_type import FabricType
 
@@ -49,16 +50,32 @@ class OrderForm(get_subid_model()):
     team_name = models.CharField(max_length=255, null=True, blank=True)
 
     design_front = models.FileField(
-        upload_to="designs/", max_length=255, null=True, blank=True
+        upload_to="designs/",
+        storage=content_addressed_storage,
+        max_length=255,
+        null=True,
+        blank=True,
     )
     design_back = models.FileField(
-        upload_to="designs/", max_length=255, null=True, blank=True
+        upload_to="designs/",
+        storage=content_addressed_storage,
+        max_length=255,
+        null=True,
+        blank=True,
     )
     preview_print_front = models.FileField(
-        upload_to="preview_prints/", max_length=255, null=True, blank=True
+        upload_to="preview_prints/",
+        storage=content_addressed_storage,
+        max_length=255,
+        null=True,
+        blank=True,
     )
     preview_print_back = models.FileField(
-        upload_to="preview_prints/", max_length=255, null=True, blank=True
+        upload_to="preview_prints/",
+        storage=content_addressed_storage,
+        max_length=255,
+        null=True,
+        blank=True,
     )
 
     jersey_pattern = models.CharField(max_length=255, null=True, blank=True)
@@ -72,19 +89,39 @@ class OrderForm(get_subid_model()):
     tag_size_shoulder = models.CharField(max_length=255, null=True, blank=True)
 
     logo_chest_right = models.FileField(
-        upload_to="logos/", max_length=255, null=True, blank=True
+        upload_to="logos/",
+        storage=content_addressed_storage,
+        max_length=255,
+        null=True,
+        blank=True,
     )
     logo_center = models.FileField(
-        upload_to="logos/", max_length=255, null=True, blank=True
+        upload_to="logos/",
+        storage=content_addressed_storage,
+        max_length=255,
+        null=True,
+        blank=True,
     )
     logo_chest_left = models.FileField(
-        upload_to="logos/", max_length=255, null=True, blank=True
+        upload_to="logos/",
+        storage=content_addressed_storage,
+        max_length=255,
+        null=True,
+        blank=True,
     )
     logo_back = models.FileField(
-        upload_to="logos/", max_length=255, null=True, blank=True
+        upload_to="logos/",
+        storage=content_addressed_storage,
+        max_length=255,
+        null=True,
+        blank=True,
     )
     logo_pants = models.FileField(
-        upload_to="logos/", max_length=255, null=True, blank=True
+        upload_to="logos/",
+        storage=content_addressed_storage,
+        max_length=255,
+        null=True,
+        blank=True,
     )
 
     # Marketplace
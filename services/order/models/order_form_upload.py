@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.db import models
+
+from core.common.models import get_subid_model
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "OrderFormUploadQuerySet",
+    "OrderFormUploadManager",
+    "OrderFormUpload",
+)
+
+
+class OrderFormUploadQuerySet(models.QuerySet):
+    pass
+
+
+_OrderFormUploadManagerBase = models.Manager.from_queryset(OrderFormUploadQuerySet)  # type: type[OrderFormUploadQuerySet]
+
+
+class OrderFormUploadManager(_OrderFormUploadManagerBase):
+    pass
+
+
+class OrderFormUpload(get_subid_model()):
+    """
+    A design file sent in chunks, attached to an order form field once every
+    chunk has arrived, see services.order.chunked_upload.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_COMPLETE = "complete"
+
+    FILE_FIELDS = (
+        "design_front",
+        "design_back",
+        "preview_print_front",
+        "preview_print_back",
+        "logo_chest_right",
+        "logo_center",
+        "logo_chest_left",
+        "logo_back",
+        "logo_pants",
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=[(STATUS_PENDING, "Pending"), (STATUS_COMPLETE, "Complete")],
+        default=STATUS_PENDING,
+    )
+    order_form = models.ForeignKey(
+        "order.OrderForm",
+        on_delete=models.CASCADE,
+        related_name="uploads",
+    )
+    field = models.CharField(max_length=30, choices=[(f, f) for f in FILE_FIELDS])
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    chunk_size = models.PositiveIntegerField()
+    # Hex SHA-256 of the whole file, checked on completion when given
+    checksum = models.CharField(max_length=64, blank=True, default="")
+    received_chunks = models.JSONField(default=list, blank=True)
+
+    created_by = models.ForeignKey("account.User", on_delete=models.SET_NULL, null=True)
+    completed = models.DateTimeField(null=True, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    objects = OrderFormUploadManager()
+
+    class Meta:
+        # Uploads are authorized through the order form permissions.
+        default_permissions = ()
+        verbose_name = "Order Form Upload"
+        verbose_name_plural = "Order Form Uploads"
+
+    def __str__(self):
+        return f"Upload of {self.filename} to {self.field} ({self.status})"
+
+    @property
+    def chunk_count(self) -> int:
+        return max(1, -(-self.size // self.chunk_size))
@@ -82,7 +82,18 @@ class OrderItem(get_subid_model()):
         fabric_price_obj = None
         if variant_type and fabric_type:
             fabric_price_qs = getattr(variant_type, "fabric_prices", None)
-            if fabric_price_qs is not None:
+            prefetched = getattr(variant_type, "_prefetched_objects_cache", {})
+            if "fabric_prices" in prefetched:
+                # List views prefetch variant_type__fabric_prices
+                fabric_price_obj = next(
+                    (
+                        fp
+                        for fp in fabric_price_qs.all()
+                        if fp.fabric_type_id == fabric_type.pk
+                    ),
+                    None,
+                )
+            elif fabric_price_qs is not None:
                 fabric_price_qs_filtered = fabric_price_qs.filter(
                     fabric_type=fabric_type, variant_type=variant_type
                 )
@@ -6,15 +6,25 @@ from typing import TYPE_CHECKING
 
 from rest_framework import serializers
 
-from core.common.serializers import BaseModelSerializer
+from core.common.response_cache import bump_tags
+from core.common.serializers import (
+    BaseModelSerializer,
+    BulkSlugListSerializer,
+    PrefetchedSlugRelatedField,
+)
 from services.customer.models.customer import Customer
 from services.customer.rest.customer.serializers import CustomerSerializer
 from services.deposit.models.deposit import Deposit
 from services.forecast.models.forecast import Forecast
+from services.order.marketplace_import import MARKETPLACE_CHOICES, ORDER_CHOICE_CHOICES
 from services.order.models import Order, OrderItem
 from services.order.models.invoice import Invoice
 from services.order.models.order_extra_cost import OrderExtraCost
-from services.order.rest.order.utils import get_dynamic_item_price, get_qty_value
+from services.order.rest.order.utils import (
+    build_order_items,
+    get_qty_value,
+    sync_order_items,
+)
 from services.product.models import FabricType, Product, ProductVariantType
 from services.queue_entry.models import QueueEntry
 
@@ -23,7 +33,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-__all__ = ("OrderItemInputSerializer", "OrderCreateSerializer")
+__all__ = (
+    "OrderItemInputSerializer",
+    "OrderCreateSerializer",
+    "MarketplaceImportSerializer",
+)
 
 
 # --- 1. New Helper Function ---
@@ -111,13 +125,15 @@ class OrderExtraCostSerializer(FloatToIntRepresentationMixin, BaseModelSerialize
 
 
 class OrderItemInputSerializer(BaseModelSerializer):
-    product = serializers.SlugRelatedField(
+    # Existing item subid, lets updates keep the row instead of recreating it
+    pk = serializers.CharField(source="subid", required=False, allow_null=True)
+    product = PrefetchedSlugRelatedField(
         slug_field="subid", queryset=Product.objects.all()
     )
-    fabric_type = serializers.SlugRelatedField(
+    fabric_type = PrefetchedSlugRelatedField(
         slug_field="subid", queryset=FabricType.objects.all()
     )
-    variant_type = serializers.SlugRelatedField(
+    variant_type = PrefetchedSlugRelatedField(
         slug_field="subid",
         queryset=ProductVariantType.objects.all(),
         required=False,
@@ -129,12 +145,27 @@ class OrderItemInputSerializer(BaseModelSerializer):
     class Meta:
         model = OrderItem
         fields = (
+            "pk",
             "product",
             "fabric_type",
             "variant_type",
             "quantity",
             # "price",
         )
+        list_serializer_class = BulkSlugListSerializer
+
+
+class MarketplaceImportSerializer(serializers.Serializer):
+    """
+    Upload for importing marketplace orders from a CSV/XLSX export
+    """
+
+    file = serializers.FileField()
+    marketplace = serializers.ChoiceField(choices=MARKETPLACE_CHOICES)
+    order_choice = serializers.ChoiceField(
+        choices=ORDER_CHOICE_CHOICES, required=False, allow_null=True, default=None
+    )
+    dry_run = serializers.BooleanField(default=False)
 
 
 class OrderCreateSerializer(BaseModelSerializer):
@@ -226,35 +257,19 @@ class OrderCreateSerializer(BaseModelSerializer):
 
     def _create_order_items(self, order, items_data):
         """Helper to create order items."""
-        for item_data in items_data:
-            product = item_data["product"]
-            fabric_type = item_data["fabric_type"]
-            variant_type = item_data.get("variant_type")
-            qty = item_data["quantity"]
-
-            final_price, _ = get_dynamic_item_price(
-                product, fabric_type, variant_type, qty
-            )
-
-            OrderItem.objects.create(
-                order=order,
-                product=product,
-                fabric_type=fabric_type,
-                variant_type=variant_type,
-                quantity=qty,
-                price=final_price,
-            )
+        OrderItem.objects.bulk_create(build_order_items(order, None, items_data))
+        bump_tags(OrderItem)
 
     def _create_extra_costs(self, order, extra_costs_data):
         """Helper to create extra costs."""
-        for extra_data in extra_costs_data:
-            OrderExtraCost.objects.create(order=order, **extra_data)
+        OrderExtraCost.objects.bulk_create(
+            [OrderExtraCost(order=order, **extra_data) for extra_data in extra_costs_data]
+        )
 
     def _update_order_items(self, instance, items_data):
-        """Helper to update order items (delete and recreate)."""
+        """Helper to update order items (diff by subid)."""
         if items_data is not None:
-            instance.items.all().delete()
-            self._create_order_items(instance, items_data)
+            sync_order_items(instance.items.all(), instance, None, items_data)
 
     def _update_extra_costs(self, instance, extra_costs_data):
         """Helper to update extra costs (delete and recreate)."""
@@ -395,6 +410,10 @@ class OrderItemListSerializer(FloatToIntRepresentationMixin, BaseModelSerializer
 
     # to_representation is now handled by FloatToIntRepresentationMixin
     def get_has_forecast(self, instance):
+        # Annotated by list querysets that prefetch items
+        forecast_exists = getattr(instance, "forecast_exists", None)
+        if forecast_exists is not None:
+            return forecast_exists
         return Forecast.objects.filter(order_item=instance).exists()
 
     def get_product_name(self, instance):
@@ -435,6 +454,9 @@ class _OrderItemSerializer(OrderItemListSerializer):
         )
 
     def get_has_order_form(self, obj: OrderItem) -> bool:
+        order_form_exists = getattr(obj, "order_form_exists", None)
+        if order_form_exists is not None:
+            return order_form_exists
         return obj.order_forms.exists()
 
 
@@ -602,6 +624,9 @@ class OrderKonveksiListSerializer(FloatToIntRepresentationMixin, BaseModelSerial
     # 2. NullInvoiceIfEmptyItemsMixin handles setting invoice=None
     #
     def get_is_deposit(self, obj):
+        deposit_exists = getattr(obj, "deposit_exists", None)
+        if deposit_exists is not None:
+            return deposit_exists
         return Deposit.objects.filter(order=obj).exists()
 
     # def get_has_forecast(self, obj):
@@ -23,4 +23,13 @@ urlpatterns = [
         ),
         name="order-form-marketplace",
     ),
+    path(
+        "orders/<str:subid>/order-form/roster/",
+        OrderViewSet.as_view(
+            {
+                "post": "roster_import",
+            }
+        ),
+        name="order-form-marketplace-roster",
+    ),
 ]
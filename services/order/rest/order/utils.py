@@ -1,7 +1,11 @@
 # common/utils/pricing.py
 
-from django.core.exceptions import ValidationError
-from django.db.models import Q
+from core.common.response_cache import bump_tags
+from services.forecast.list_rows import refresh_rows_for
+from services.order.models import OrderItem
+from services.product.pricing import PriceLine, price_index
+
+ORDER_ITEM_FIELDS = ("product", "fabric_type", "variant_type", "quantity", "price")
 
 
 def get_dynamic_item_price(
@@ -13,46 +17,115 @@ def get_dynamic_item_price(
     Returns:
         tuple (final_price, subtotal)
     """
+    return price_index.quote(product, fabric_type, variant_type, qty)
 
-    # 1️⃣ Find applicable price tier
-    tier_qs = product.price_tiers.all()
-    if variant_type:
-        tier_qs = tier_qs.filter(variant_type=variant_type)
-    else:
-        tier_qs = tier_qs.filter(variant_type__isnull=True)
-
-    # tier = tier_qs.filter(min_qty__lte=qty, max_qty__gte=qty).first()
-    # 🔹 Fix: include null max_qty (means "no upper limit")
-    tier = (
-        tier_qs.filter(
-            min_qty__lte=qty,
-        )
-        .filter(Q(max_qty__gte=qty) | Q(max_qty__isnull=True))
-        .first()
+
+def get_dynamic_item_prices(items_data) -> list[tuple[float, float]]:
+    """
+    Batch version of `get_dynamic_item_price` for validated item dicts
+    (product, fabric_type, variant_type, quantity), in input order.
+    """
+    return price_index.quote_many(
+        [
+            PriceLine(
+                product=item["product"],
+                fabric_type=item.get("fabric_type"),
+                variant_type=item.get("variant_type"),
+                quantity=item["quantity"],
+            )
+            for item in items_data
+        ]
     )
 
-    if not tier:
-        raise ValidationError(
-            f"No valid price tier found for quantity {qty} on product {product.name}."
-        )
 
-    # 2️⃣ Base price
-    base_price = tier.base_price or 0
+def build_order_items(order, deposit, items_data) -> list[OrderItem]:
+    """
+    Unsaved OrderItem rows for `items_data`, priced in one batch.
+
+    Items already priced by the serializer (`price` key) are kept as is.
+    Subids come from the field default, so rows can be bulk created and
+    looked up again without relying on returned primary keys.
+    """
+    unpriced = [item for item in items_data if "price" not in item]
+    prices = iter(get_dynamic_item_prices(unpriced))
+
+    return [
+        OrderItem(
+            order=order,
+            deposit=deposit,
+            product=item_data["product"],
+            fabric_type=item_data["fabric_type"],
+            variant_type=item_data.get("variant_type"),
+            quantity=item_data["quantity"],
+            price=item_data["price"] if "price" in item_data else next(prices)[0],
+        )
+        for item_data in items_data
+    ]
 
-    # 3️⃣ Fabric price adjustment
-    fabric_price = 0
-    if tier.variant_type:
-        fabric_price_obj = tier.variant_type.fabric_prices.filter(
-            fabric_type=fabric_type
-        ).first()
-        if fabric_price_obj:
-            fabric_price = fabric_price_obj.price or 0
 
-    # 4️⃣ Calculate final per-unit price and subtotal
-    final_price = base_price + fabric_price
-    subtotal = final_price * qty
+def sync_order_items(existing_items, order, deposit, items_data) -> None:
+    """
+    Diff `items_data` against `existing_items` instead of delete + recreate,
+    so Forecast and QueueEntry rows pointing at kept items survive.
 
-    return final_price, subtotal
+    Incoming rows are matched by subid (`pk` in the payload) first, then by
+    (product, fabric_type, variant_type). Matched rows are updated, the rest
+    are created, and existing rows left unmatched are deleted.
+    """
+    existing_items = list(existing_items)
+    by_subid = {item.subid: item for item in existing_items}
+    by_key: dict = {}
+    for item in existing_items:
+        key = (item.product_id, item.fabric_type_id, item.variant_type_id)
+        by_key.setdefault(key, []).append(item)
+
+    matched = {}
+    unmatched = []
+    for index, item_data in enumerate(items_data):
+        item = by_subid.pop(item_data.get("subid"), None)
+        if item is not None:
+            matched[index] = item
+        else:
+            unmatched.append(index)
+
+    claimed = {item.pk for item in matched.values()}
+    for index in list(unmatched):
+        item_data = items_data[index]
+        variant_type = item_data.get("variant_type")
+        key = (
+            item_data["product"].pk,
+            item_data["fabric_type"].pk,
+            variant_type.pk if variant_type else None,
+        )
+        candidates = [i for i in by_key.get(key, []) if i.pk not in claimed]
+        if candidates:
+            matched[index] = candidates[0]
+            claimed.add(candidates[0].pk)
+            unmatched.remove(index)
+
+    new_items = build_order_items(order, deposit, items_data)
+
+    to_update = []
+    for index, item in matched.items():
+        fresh = new_items[index]
+        for field in ORDER_ITEM_FIELDS:
+            setattr(item, field, getattr(fresh, field))
+        to_update.append(item)
+
+    stale = [item.pk for item in existing_items if item.pk not in claimed]
+    if stale:
+        OrderItem.objects.filter(pk__in=stale).delete()
+
+    if to_update:
+        OrderItem.objects.bulk_update(to_update, list(ORDER_ITEM_FIELDS))
+
+    if unmatched:
+        OrderItem.objects.bulk_create([new_items[index] for index in unmatched])
+
+    # Bulk writes send no model signals.
+    bump_tags(OrderItem)
+    # Only updated items can already have forecasts.
+    refresh_rows_for(*to_update)
 
 
 def mapping_product_sum(unit: str) -> int:
@@ -8,19 +8,30 @@ from django.utils.translation import gettext_lazy as _
 # Report lab
 from reportlab.lib.pagesizes import A4
 from rest_framework import status
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from core.common.spreadsheets import SpreadsheetError
 from core.common.viewsets import BaseViewSet
+from services.order.marketplace_import import (
+    import_marketplace_orders,
+    read_marketplace_orders,
+)
 from services.order.models import Order
 from services.order.rest.order.filtersets import OrderFilterSet
 from services.order.rest.order.serializers import (
+    MarketplaceImportSerializer,
     OrderCreateSerializer,
     OrderDetailSerializer,
     OrderKonveksiListSerializer,
     OrderListSerializer,
     OrderMarketplaceListSerializer,
 )
-from services.order.rest.order_form.serializers import OrderFormMarketplaceSerializer
+from services.order.rest.order_form.serializers import (
+    OrderFormMarketplaceSerializer,
+    RosterImportSerializer,
+)
+from services.order.roster import import_roster, read_roster
 
 if TYPE_CHECKING:
     pass
@@ -59,6 +70,8 @@ class OrderViewSet(BaseViewSet):
         "customer__address",
         
     ]
+    # 🚀 One full-text lookup instead of icontains over customer and invoice
+    search_index = "order"
     serializer_map = {
         "create": OrderCreateSerializer,
         "konveksi": OrderKonveksiListSerializer,
@@ -69,6 +82,9 @@ class OrderViewSet(BaseViewSet):
     required_perms = []  # fallback
 
     def get_required_perms(self):
+        if self.action == "import_marketplace":
+            return ["order.can_add_order_marketplace"]
+
         order_type = self.request.query_params.get("order_type")
 
         if order_type == "marketplace":
@@ -259,3 +275,50 @@ class OrderViewSet(BaseViewSet):
 
         order_form.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def roster_import(self, request, *args, **kwargs):
+        """Upsert the order form roster from an uploaded CSV/XLSX file."""
+        order = self.get_object()
+        order_form = order.order_forms.first()
+
+        if not order_form:
+            return Response(
+                {"detail": "Order form not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        serializer = RosterImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            report = import_roster(
+                order_form,
+                read_roster(serializer.validated_data["file"]),
+                replace=serializer.validated_data["replace"],
+                dry_run=serializer.validated_data["dry_run"],
+            )
+        except SpreadsheetError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            report.as_dict(),
+            status=status.HTTP_400_BAD_REQUEST if report.errors else status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=["post"], url_path="import-marketplace")
+    def import_marketplace(self, request, *args, **kwargs):
+        """Bulk create marketplace orders from a Shopee/TikTok/Tokopedia export."""
+        serializer = MarketplaceImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            report = import_marketplace_orders(
+                read_marketplace_orders(serializer.validated_data["file"]),
+                marketplace=serializer.validated_data["marketplace"],
+                order_choice=serializer.validated_data["order_choice"],
+                created_by=request.user,
+                dry_run=serializer.validated_data["dry_run"],
+            )
+        except SpreadsheetError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(report.as_dict(), status=status.HTTP_200_OK)
@@ -7,7 +7,9 @@ from typing import TYPE_CHECKING
 from rest_framework import serializers
 
 from core import settings
-from core.common.serializers import BaseModelSerializer
+from core.common.response_cache import bump_tags
+from services.forecast.list_rows import refresh_rows_for
+from core.common.serializers import BaseModelSerializer, ThumbnailField
 from services.customer.rest.customer.serializers import CustomerSerializerSimple
 from services.deposit.models.deposit import Deposit
 from services.order.models.order import Order
@@ -20,6 +22,7 @@ from services.order.rest.order.serializers import (
     OrderMarketplaceListSerializer,
 )
 from services.order.rest.order.utils import get_qty_value
+from services.order.roster import replace_roster
 from services.printer.models.printer import Printer
 from services.printer.rest.printer.serializers import PrinterSerializer
 from services.product.models.fabric_type import FabricType
@@ -31,7 +34,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-__all__ = ("OrderFormSerializer", "OrderFormDetailSerializer")
+__all__ = (
+    "OrderFormSerializer",
+    "OrderFormDetailSerializer",
+    "RosterImportSerializer",
+)
 
 
 class _OrderSerializer(BaseModelSerializer):
@@ -74,6 +81,16 @@ class OrderFormDetailSerializer(BaseModelSerializer):
         fields = ["pk", "back_name", "jersey_number", "shirt_size", "pants_size"]
 
 
+class RosterImportSerializer(serializers.Serializer):
+    """
+    Upload for importing an order form roster from a CSV/XLSX file
+    """
+
+    file = serializers.FileField()
+    replace = serializers.BooleanField(default=False)
+    dry_run = serializers.BooleanField(default=False)
+
+
 class OrderFormSerializer(BaseModelSerializer):
     """
     Serializer for order form
@@ -96,6 +113,17 @@ class OrderFormSerializer(BaseModelSerializer):
     )
     deposit = _DepositListSerializer(source="order_item.deposit", read_only=True)
 
+    # Small WebP variants for phones; the originals stay available above
+    design_front_thumb = ThumbnailField(source="design_front")
+    design_back_thumb = ThumbnailField(source="design_back")
+    preview_print_front_thumb = ThumbnailField(source="preview_print_front")
+    preview_print_back_thumb = ThumbnailField(source="preview_print_back")
+    logo_chest_right_thumb = ThumbnailField(source="logo_chest_right")
+    logo_center_thumb = ThumbnailField(source="logo_center")
+    logo_chest_left_thumb = ThumbnailField(source="logo_chest_left")
+    logo_back_thumb = ThumbnailField(source="logo_back")
+    logo_pants_thumb = ThumbnailField(source="logo_pants")
+
     class Meta:
         model = OrderForm
         fields = [
@@ -124,6 +152,15 @@ class OrderFormSerializer(BaseModelSerializer):
             "logo_chest_left",
             "logo_back",
             "logo_pants",
+            "design_front_thumb",
+            "design_back_thumb",
+            "preview_print_front_thumb",
+            "preview_print_back_thumb",
+            "logo_chest_right_thumb",
+            "logo_center_thumb",
+            "logo_chest_left_thumb",
+            "logo_back_thumb",
+            "logo_pants_thumb",
             "total_qty",
             "details",
         ]
@@ -226,7 +263,6 @@ class OrderFormSerializer(BaseModelSerializer):
         """
         data = data.copy()
         parsed = self._parse_json_field(data, "details")
-        print(parsed)
         if parsed is not None:
             # assign the parsed structure so DRF will validate it using the declared field
             data["details"] = parsed
@@ -255,9 +291,12 @@ class OrderFormSerializer(BaseModelSerializer):
 
         order_form = super().create(validated_data)
 
-        # Create OrderFormDetail rows
-        for detail in details_data:
-            OrderFormDetail.objects.create(order_form=order_form, **detail)
+        # 🚀 One INSERT for the whole roster
+        OrderFormDetail.objects.bulk_create(
+            [OrderFormDetail(order_form=order_form, **detail) for detail in details_data]
+        )
+        bump_tags(OrderFormDetail)
+        refresh_rows_for(order_form)
         
         # if order_form.order:
         #     QueueEntry.objects.update_or_create(
@@ -300,14 +339,9 @@ class OrderFormSerializer(BaseModelSerializer):
         # --- ADD THIS LOGIC ---
         # If 'details' was part of the request, update the nested items.
         if details_key_present:
-            # 'details_data' will be a list (possibly empty)
-
-            # 1. Delete all existing details for this form
-            instance.order_form_details.all().delete()
-
-            # 2. Create the new details from the request data
-            for detail in details_data:
-                OrderFormDetail.objects.create(order_form=instance, **detail)
+            # 'details_data' will be a list (possibly empty). Rows are matched
+            # on jersey number so only changed players are written.
+            replace_roster(instance, details_data)
 
         # If 'details' was not in the request, we do nothing,
         # preserving the existing details.
@@ -357,6 +391,9 @@ class OrderFormMarketplaceSerializer(BaseModelSerializer):
 
     details = OrderFormDetailSerializer(many=True, required=False, allow_null=True)
 
+    preview_print_front_thumb = ThumbnailField(source="preview_print_front")
+    preview_print_back_thumb = ThumbnailField(source="preview_print_back")
+
     class Meta:
         model = OrderForm
         fields = [
@@ -370,6 +407,8 @@ class OrderFormMarketplaceSerializer(BaseModelSerializer):
             "session",
             "preview_print_front",
             "preview_print_back",
+            "preview_print_front_thumb",
+            "preview_print_back_thumb",
             "details",
         ]
         read_only_fields = ["pk"]
@@ -433,7 +472,6 @@ class OrderFormMarketplaceSerializer(BaseModelSerializer):
         """
         data = data.copy()
         parsed = self._parse_json_field(data, "details")
-        print(parsed)
         if parsed is not None:
             # assign the parsed structure so DRF will validate it using the declared field
             data["details"] = parsed
@@ -450,7 +488,7 @@ class OrderFormMarketplaceSerializer(BaseModelSerializer):
         return data
         return data
 
-    def create(self, instance, validated_data):
+    def create(self, validated_data):
         details_data = validated_data.pop("details", None)
 
         # fallback when DRF wipes nested data
@@ -467,16 +505,19 @@ class OrderFormMarketplaceSerializer(BaseModelSerializer):
         order_form = super().create(validated_data)
         
         QueueEntry.objects.update_or_create(
-            order=instance.order,
+            order=order_form.order,
             defaults={
                 "forecast": None,
                 "created_by": self.context["request"].user,
             },
         )
 
-        # Create OrderFormDetail rows
-        for detail in details_data:
-            OrderFormDetail.objects.create(order_form=order_form, **detail)
+        # 🚀 One INSERT for the whole roster
+        OrderFormDetail.objects.bulk_create(
+            [OrderFormDetail(order_form=order_form, **detail) for detail in details_data]
+        )
+        bump_tags(OrderFormDetail)
+        refresh_rows_for(order_form)
 
         return order_form
 
@@ -508,14 +549,9 @@ class OrderFormMarketplaceSerializer(BaseModelSerializer):
         # --- ADD THIS LOGIC ---
         # If 'details' was part of the request, update the nested items.
         if details_key_present:
-            # 'details_data' will be a list (possibly empty)
-
-            # 1. Delete all existing details for this form
-            instance.order_form_details.all().delete()
-
-            # 2. Create the new details from the request data
-            for detail in details_data:
-                OrderFormDetail.objects.create(order_form=instance, **detail)
+            # 'details_data' will be a list (possibly empty). Rows are matched
+            # on jersey number so only changed players are written.
+            replace_roster(instance, details_data)
 
         # If 'details' was not in the request, we do nothing,
         # preserving the existing details.
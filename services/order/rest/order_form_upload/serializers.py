@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from rest_framework import serializers
+
+from core.common.serializers import BaseModelSerializer
+from services.order.models.order_form import OrderForm
+from services.order.models.order_form_upload import OrderFormUpload
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "OrderFormUploadSerializer",
+    "OrderFormUploadCreateSerializer",
+)
+
+
+class OrderFormUploadSerializer(BaseModelSerializer):
+    order_form = serializers.SlugRelatedField(slug_field="subid", read_only=True)
+    chunk_count = serializers.IntegerField(read_only=True)
+    file = serializers.SerializerMethodField()
+
+    class Meta:
+        model = OrderFormUpload
+        fields = (
+            "pk",
+            "status",
+            "order_form",
+            "field",
+            "filename",
+            "size",
+            "chunk_size",
+            "chunk_count",
+            "received_chunks",
+            "file",
+            "completed",
+            "created",
+        )
+        read_only_fields = fields
+
+    def get_file(self, obj):
+        if obj.status != OrderFormUpload.STATUS_COMPLETE:
+            return None
+
+        file = getattr(obj.order_form, obj.field)
+        if not file:
+            return None
+
+        request = self.context.get("request")
+        return request.build_absolute_uri(file.url) if request else file.url
+
+
+class OrderFormUploadCreateSerializer(BaseModelSerializer):
+    order_form = serializers.SlugRelatedField(
+        slug_field="subid", queryset=OrderForm.objects.all()
+    )
+
+    class Meta:
+        model = OrderFormUpload
+        fields = (
+            "order_form",
+            "field",
+            "filename",
+            "size",
+            "checksum",
+        )
+
+    def validate_filename(self, value):
+        value = os.path.basename(value)
+        if os.path.splitext(value)[1].lower() not in (".jpg", ".jpeg", ".png"):
+            raise serializers.ValidationError("Only JPEG and PNG images are allowed.")
+        return value
+
+    def validate_size(self, value):
+        if value <= 0:
+            raise serializers.ValidationError("File is empty.")
+        if value > settings.CHUNKED_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                f"File size too large ({value / 1024 / 1024:.1f} MB). "
+                f"Maximum allowed is {settings.CHUNKED_UPLOAD_MAX_SIZE / 1024 / 1024:.1f} MB."
+            )
+        return value
+
+    def validate_checksum(self, value):
+        if value and not re.fullmatch(r"[0-9a-fA-F]{64}", value):
+            raise serializers.ValidationError("Checksum must be a hex SHA-256 digest.")
+        return value.lower()
@@ -0,0 +1,13 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .views import OrderFormUploadViewSet
+
+# --- Router for ViewSets ---
+router = DefaultRouter()
+router.register(r"order-form-uploads", OrderFormUploadViewSet, basename="order-form-upload")
+# --- End Router ---
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
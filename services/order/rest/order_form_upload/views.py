@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from core.common.viewsets import BaseViewSet
+from services.order.chunked_upload import (
+    ChunkedUploadError,
+    complete_upload,
+    discard_upload,
+    start_upload,
+    write_chunk,
+)
+from services.order.models.order_form_upload import OrderFormUpload
+from services.order.rest.order_form_upload.serializers import (
+    OrderFormUploadCreateSerializer,
+    OrderFormUploadSerializer,
+)
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = ("OrderFormUploadViewSet",)
+
+
+class OrderFormUploadViewSet(BaseViewSet):
+    """
+    Chunked uploads of large design files to an order form.
+
+    1. POST the file's order_form, field, filename and size (optionally a
+       SHA-256 checksum); the reply gives `chunk_size` and `chunk_count`.
+    2. PUT the raw bytes of every chunk to `chunks/<index>/`.
+    3. POST `complete/` to check the image and attach it to the field.
+
+    After a dropped connection, GET the upload and resend the chunks missing
+    from `received_chunks`.
+    """
+
+    queryset = OrderFormUpload.objects.select_related("order_form")
+    serializer_class = OrderFormUploadSerializer
+    serializer_map = {
+        "create": OrderFormUploadCreateSerializer,
+    }
+    lookup_field = "subid"
+    http_method_names = ["get", "post", "put", "delete", "head", "options"]
+
+    filterset_fields = ["status", "field"]
+
+    required_perms = [
+        "order.add_orderform",
+        "order.change_orderform",
+    ]
+    my_tags = ["Order Forms"]
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.save(
+            created_by=request.user,
+            chunk_size=settings.CHUNKED_UPLOAD_CHUNK_SIZE,
+        )
+        start_upload(upload)
+
+        return Response(
+            OrderFormUploadSerializer(upload, context=self.get_serializer_context()).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    @action(detail=True, methods=["put"], url_path=r"chunks/(?P<index>\d+)")
+    def chunk(self, request, index=None, *args, **kwargs):
+        upload = self.get_object()
+
+        # Read the raw body as a stream; request.data would buffer it whole.
+        stream = request.stream
+        if stream is None:
+            return Response(
+                {"detail": "Chunk body is empty."}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            upload = write_chunk(upload, int(index), stream)
+        except ChunkedUploadError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(OrderFormUploadSerializer(upload).data)
+
+    @action(detail=True, methods=["post"], url_path="complete")
+    def complete(self, request, *args, **kwargs):
+        upload = self.get_object()
+
+        try:
+            upload = complete_upload(upload)
+        except ChunkedUploadError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            OrderFormUploadSerializer(upload, context=self.get_serializer_context()).data
+        )
+
+    def perform_destroy(self, instance):
+        discard_upload(instance)
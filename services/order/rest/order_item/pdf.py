@@ -0,0 +1,860 @@
+from __future__ import annotations
+
+import io
+import logging
+import os
+from functools import lru_cache
+from xml.sax.saxutils import escape
+from typing import TYPE_CHECKING
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_LEFT
+
+# --- ReportLab Imports ---
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import (
+    Image,
+    PageBreak,
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+from core.common.images import pdf_derivative
+from core.common.pdf import cached_image, pdf_cache_key
+from core.media import media_to_path
+from services.order.models.order_item import OrderItem
+from services.order.rest.order_form.serializers import OrderFormSerializer
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "ORDER_FORM_PDF_NAMESPACE",
+    "ORDER_FORM_PDF_VERSION",
+    "ORDER_FORM_IMAGE_FIELDS",
+    "order_form_pdf_data",
+    "order_form_cache_key",
+    "order_form_styles",
+    "render_order_form_pdf",
+)
+
+# Cached order forms live under PDF_CACHE_ROOT/<namespace>/<order item subid>/
+ORDER_FORM_PDF_NAMESPACE = "order-form"
+
+# Bump whenever the layout (or what it reads) changes so cached PDFs are
+# re-rendered.
+ORDER_FORM_PDF_VERSION = 4
+
+
+# OrderForm file fields drawn on the form
+ORDER_FORM_IMAGE_FIELDS = (
+    "design_front",
+    "design_back",
+    "preview_print_front",
+    "preview_print_back",
+    "logo_chest_right",
+    "logo_center",
+    "logo_chest_left",
+    "logo_back",
+    "logo_pants",
+)
+
+
+def order_form_pdf_data(order_form) -> dict:
+    """
+    `OrderFormSerializer` data for `render_order_form_pdf`, with the images
+    as file paths taken from the file fields instead of (signed) URLs.
+    """
+    data = dict(OrderFormSerializer(order_form).data)
+    for name in ORDER_FORM_IMAGE_FIELDS:
+        field_file = getattr(order_form, name)
+        data[name] = field_file.path if field_file else None
+    return data
+
+
+def order_form_cache_key(order_form) -> str:
+    """
+    Cache key of an order form PDF, read from the rows it is drawn from
+    without serializing them: the form (`updated` and its file names), the
+    order item, the roster and the `updated` of every related row the
+    template names. Any change to them produces a new version.
+    """
+    item = (
+        OrderItem.objects.filter(pk=order_form.order_item_id)
+        .values(
+            "quantity",
+            "fabric_type__updated",
+            "variant_type__updated",
+            "product__printer__updated",
+            "order__customer__updated",
+            "deposit__updated",
+            "deposit__order__updated",
+        )
+        .first()
+    )
+    details = list(order_form.order_form_details.order_by("pk").values_list())
+    files = [getattr(order_form, name).name for name in ORDER_FORM_IMAGE_FIELDS]
+
+    return pdf_cache_key(ORDER_FORM_PDF_VERSION, order_form.pk, order_form.updated, files, item, details)
+
+
+@lru_cache(maxsize=None)
+def order_form_styles():
+    """
+    Stylesheet for the order form PDF, built once per process.
+    """
+    styles = getSampleStyleSheet()
+
+    # --- Define Custom Styles based on the screenshot ---
+
+    # Style for section titles (e.g., "PRINTER & BAHAN")
+    styles.add(
+        ParagraphStyle(
+            name="SectionTitle",
+            fontName="Helvetica-Bold",
+            fontSize=9,
+            textColor=colors.white,
+            backColor=colors.black,
+            alignment=TA_CENTER,
+            # spaceAfter=4,
+            spaceAfter=0,
+            leftIndent=-0.5,
+            rightIndent=1.5,
+            padding=(4, 4, 4, 4),
+        )
+    )
+
+    # Style for the body text inside tables
+    styles.add(
+        ParagraphStyle(
+            name="Body",
+            fontName="Helvetica",
+            fontSize=8,
+            alignment=TA_LEFT,
+        )
+    )
+
+    # Style for placeholder text (for images)
+    styles.add(
+        ParagraphStyle(
+            name="Placeholder",
+            fontName="Helvetica-Oblique",
+            fontSize=8,
+            textColor=colors.darkgrey,
+            alignment=TA_CENTER,
+        )
+    )
+
+    # Style for logo cell titles
+    styles.add(
+        ParagraphStyle(
+            name="LogoTitle",
+            fontName="Helvetica-Bold",
+            fontSize=7,
+            alignment=TA_CENTER,
+            spaceAfter=4,
+        )
+    )
+
+    # Page 2 - Header Row Styles
+    styles.add(
+        ParagraphStyle(
+            name="H_DarkBlue",
+            fontName="Helvetica-Bold",
+            fontSize=8,
+            textColor=colors.black,
+            backColor=colors.HexColor("#90D5FF"),
+            alignment=TA_CENTER,
+            padding=2,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="H_Black",
+            fontName="Helvetica-Bold",
+            fontSize=8,
+            textColor=colors.white,
+            backColor=colors.black,
+            alignment=TA_CENTER,
+            padding=2,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="H_Yellow",
+            fontName="Helvetica-Bold",
+            fontSize=8,
+            textColor=colors.black,
+            backColor=colors.yellow,
+            alignment=TA_CENTER,
+            padding=2,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="H_Green",
+            fontName="Helvetica-Bold",
+            fontSize=8,
+            textColor=colors.white,
+            backColor=colors.green,
+            alignment=TA_CENTER,
+            padding=2,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="H_Blue",
+            fontName="Helvetica-Bold",
+            fontSize=8,
+            textColor=colors.white,
+            backColor=colors.blue,
+            alignment=TA_CENTER,
+            padding=2,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="H_Orange",
+            fontName="Helvetica-Bold",
+            fontSize=8,
+            textColor=colors.black,
+            backColor=colors.orange,
+            alignment=TA_CENTER,
+            padding=2,
+        )
+    )
+
+    # Page 2 - Group Header Styles
+    styles.add(
+        ParagraphStyle(
+            name="HeaderGender",
+            fontName="Helvetica-Bold",
+            fontSize=9,
+            textColor=colors.black,
+            backColor=colors.HexColor("#90EE90"),  # Light Green
+            alignment=TA_CENTER,
+            leftIndent=4,
+            padding=3,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="HeaderSize",
+            fontName="Helvetica-Bold",
+            fontSize=8,
+            textColor=colors.black,
+            alignment=TA_CENTER,
+            leftIndent=4,
+            padding=3,
+        )
+    )
+
+    # Page 2 - Body Cell Styles
+    styles.add(
+        ParagraphStyle(
+            name="BodyCellCenter",
+            fontName="Helvetica",
+            fontSize=8,
+            alignment=TA_CENTER,
+            padding=2,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="BodyCellLeft",
+            fontName="Helvetica",
+            fontSize=8,
+            alignment=TA_LEFT,
+            leftIndent=4,
+            padding=2,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="TotalCell",
+            fontName="Helvetica-Bold",
+            fontSize=9,
+            alignment=TA_CENTER,
+            padding=2,
+        )
+    )
+
+    return styles
+
+
+# --- Page 2: roster table ---
+
+_GENDER_ORDER = ("PRIA", "WANITA", "ANAK")
+_SIZE_RANK = {
+    size: rank for rank, size in enumerate(["S", "M", "L", "XL", "XXL", "3XL", "4XL", "5XL"])
+}
+
+# Page width 21cm - 2cm margins = 19cm drawable
+_ROSTER_COL_WIDTHS = [
+    0.8 * cm,  # NO
+    3 * cm,  # NAMA PUNGGUNG
+    0.8 * cm,  # NO
+    2.05 * cm,  # SIZE BAJU
+    2.05 * cm,  # SIZE CELANA
+    1 * cm,  # JUMLAH
+    1.2 * cm,  # PRINT
+    1.2 * cm,  # PRESS
+    1.2 * cm,  # QC LINE
+    1.25 * cm,  # POTONG
+    1.2 * cm,  # JAHIT
+    1.2 * cm,  # QC
+    1.9 * cm,  # KET
+]
+
+_ROSTER_HEADER = [
+    ("NO", "H_DarkBlue"),
+    ("NAMA PUNGGUNG", "H_DarkBlue"),
+    ("NO", "H_DarkBlue"),
+    ("SIZE BAJU", "H_DarkBlue"),
+    ("SIZE CELANA", "H_DarkBlue"),
+    ("JML", "H_Black"),
+    ("PRINT", "H_Yellow"),
+    ("PRESS", "H_Yellow"),
+    ("QC LINE", "H_Yellow"),
+    ("POTONG", "H_Green"),
+    ("JAHIT", "H_Blue"),
+    ("QC", "H_Orange"),
+    ("KET", "H_Yellow"),
+]
+
+# Body cells are plain strings drawn with the metrics of the paragraph
+# styles they replace (8pt on a 12pt leading, 3pt top/bottom padding).
+# NAMA PUNGGUNG keeps the 4pt indent BodyCellLeft used to carry.
+_LEADING = 12
+_CELL_PADDING = 6
+_NAME_PADDING = _CELL_PADDING + 4
+_HEADER_HEIGHT = _LEADING + 2 * 3
+_GROUP_HEIGHT = _LEADING
+
+_ROSTER_STYLE = [
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    # Header row: the paragraphs carry their own background.
+    ("LEFTPADDING", (0, 0), (-1, 0), 0),
+    ("RIGHTPADDING", (0, 0), (-1, 0), 0),
+    ("TOPPADDING", (0, 0), (-1, 0), 3),
+    ("BOTTOMPADDING", (0, 0), (-1, 0), 3),
+    ("FONT", (0, 1), (-1, -1), "Helvetica", 8, _LEADING),
+    ("ALIGN", (0, 1), (-1, -1), "CENTER"),
+    ("ALIGN", (1, 1), (1, -1), "LEFT"),
+    ("LEFTPADDING", (1, 1), (1, -1), _NAME_PADDING),
+    ("FONT", (5, 1), (5, -1), "Helvetica-Bold", 9, _LEADING),
+]
+
+
+def _group_details(details) -> list[tuple[str, list[tuple[str, list]]]]:
+    """Groups roster rows by gender, then by size in _SIZE_RANK order."""
+    grouped = {gender: {} for gender in _GENDER_ORDER}
+
+    for item in details:
+        shirt_size = (item.get("shirt_size") or "UNKNOWN").upper()
+
+        gender = "PRIA"  # Default
+        if "WOMEN" in shirt_size:
+            gender = "WANITA"
+        elif "KIDS" in shirt_size:
+            gender = "ANAK"
+
+        size = (
+            shirt_size.replace("WOMEN", "").replace("KIDS", "").replace("MEN", "").strip()
+        )
+        grouped[gender].setdefault(f"SIZE {size}", []).append(item)
+
+    # Unknown sizes go last, in the order they first appear.
+    return [
+        (
+            gender,
+            sorted(
+                grouped[gender].items(),
+                key=lambda group: _SIZE_RANK.get(group[0].split(" ")[-1], len(_SIZE_RANK)),
+            ),
+        )
+        for gender in _GENDER_ORDER
+        if grouped[gender]
+    ]
+
+
+def _body_cell(value, col, style) -> tuple:
+    """
+    Returns (cell, height). Text that fits its column stays a plain string;
+    only text that needs wrapping pays for a Paragraph.
+    """
+    text = str(value if value is not None else "")
+    width = _ROSTER_COL_WIDTHS[col] - _CELL_PADDING - (
+        _NAME_PADDING if col == 1 else _CELL_PADDING
+    )
+    if stringWidth(text, "Helvetica", 8) <= width:
+        return text, _LEADING
+
+    paragraph = Paragraph(escape(text), style)
+    return paragraph, paragraph.wrap(width, A4[1])[1]
+
+
+def _roster_tables(details, styles, page_height) -> list[Table]:
+    """
+    Page 2 onwards of the order form: every player, grouped by gender and
+    size, as one table per page.
+
+    ReportLab re-measures the whole remainder of a table each time it splits
+    one across pages, which made large rosters quadratic; cutting the rows
+    into page-sized tables up front keeps layout linear. Style commands are
+    table-wide ranges plus a few per group header and JUMLAH span.
+    """
+    blank = [""] * (len(_ROSTER_COL_WIDTHS) - 1)
+    rows = []
+    heights = []
+    group_rows = []  # (index, is gender row)
+    spans = []  # (first, last) rows of each size group
+
+    counter = 1
+    for gender, size_groups in _group_details(details):
+        group_rows.append((len(rows), True))
+        rows.append([Paragraph(gender, styles["HeaderGender"]), *blank])
+        heights.append(_GROUP_HEIGHT)
+
+        for size_key, items in size_groups:
+            group_rows.append((len(rows), False))
+            rows.append([Paragraph(size_key, styles["HeaderSize"]), *blank])
+            heights.append(_GROUP_HEIGHT)
+
+            spans.append((len(rows), len(rows) + len(items) - 1))
+            for i, item in enumerate(items):
+                name, name_height = _body_cell(
+                    item.get("back_name", "TANPA NAMA"), 1, styles["BodyCellLeft"]
+                )
+                number, number_height = _body_cell(
+                    item.get("jersey_number", "00"), 2, styles["BodyCellCenter"]
+                )
+                shirt, shirt_height = _body_cell(
+                    item.get("shirt_size", ""), 3, styles["BodyCellCenter"]
+                )
+                pants, pants_height = _body_cell(
+                    item.get("pants_size", ""), 4, styles["BodyCellCenter"]
+                )
+                rows.append(
+                    [
+                        str(counter),
+                        name,
+                        number,
+                        shirt,
+                        pants,
+                        str(len(items)) if i == 0 else "",  # JUMLAH
+                        "",  # PRINT
+                        "",  # PRESS
+                        "",  # QC LINE
+                        "",  # POTONG
+                        "",  # JAHIT
+                        "",  # QC
+                        "",  # KET
+                    ]
+                )
+                heights.append(
+                    max(name_height, number_height, shirt_height, pants_height) + 2 * 3
+                )
+                counter += 1
+
+    # Cut the rows into pages by their measured height.
+    headers = {index for index, _ in group_rows}
+    pages = []
+    start = 0
+    used = 0
+    budget = page_height - _HEADER_HEIGHT
+    for index, height in enumerate(heights):
+        if used + height > budget and index > start:
+            # Keep group headers on the page of their first player.
+            cut = index
+            while cut - 1 > start and cut - 1 in headers:
+                cut -= 1
+            pages.append((start, cut))
+            start, used = cut, sum(heights[cut:index])
+        used += height
+    pages.append((start, len(rows)))
+
+    tables = []
+    for start, end in pages:
+        data = [[Paragraph(label, styles[style]) for label, style in _ROSTER_HEADER]]
+        commands = list(_ROSTER_STYLE)
+
+        for index, is_gender in group_rows:
+            if not start <= index < end:
+                continue
+            row = index - start + 1
+            commands.extend(
+                [
+                    ("SPAN", (0, row), (-1, row)),
+                    ("LEFTPADDING", (0, row), (-1, row), 0),
+                    ("RIGHTPADDING", (0, row), (-1, row), 0),
+                    ("TOPPADDING", (0, row), (-1, row), 0),
+                    ("BOTTOMPADDING", (0, row), (-1, row), 0),
+                ]
+            )
+            if is_gender:
+                commands.append(
+                    ("BACKGROUND", (0, row), (0, row), colors.HexColor("#90EE90"))
+                )
+
+        data.extend(rows[start:end])
+
+        # JUMLAH spans its size group, up to the end of the page.
+        for first, last in spans:
+            first, last = max(first, start), min(last, end - 1)
+            if last > first:
+                commands.append(("SPAN", (5, first - start + 1), (5, last - start + 1)))
+
+        tables.append(
+            Table(
+                data,
+                colWidths=_ROSTER_COL_WIDTHS,
+                repeatRows=1,  # Repeat the main header if a page still overflows
+                style=TableStyle(commands),
+            )
+        )
+
+    return tables
+
+
+def render_order_form_pdf(data) -> bytes:
+    """
+    Renders the order form PDF from `order_form_pdf_data()`.
+    """
+    # --- Create PDF in memory ---
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=1 * cm,
+        leftMargin=1 * cm,
+        topMargin=1 * cm,
+        bottomMargin=1 * cm,
+        # rightMargin=1.5 * cm,
+        # leftMargin=1.5 * cm,
+        # topMargin=1.5 * cm,
+        # bottomMargin=1.5 * cm,
+    )
+
+    story = []
+    styles = order_form_styles()
+
+    # We will build the layout in two main columns
+    left_story = []
+    right_story = []
+
+    # === LEFT COLUMN ===
+
+    # --- 1. PRINTER & BAHAN ---
+    left_story.append(Paragraph("PRINTER & BAHAN", styles["SectionTitle"]))
+    p_data = [
+        [
+            Paragraph("<b>BAHAN</b>", styles["Body"]),
+            Paragraph(data["order_item_display"]["fabric_type"], styles["Body"]),
+        ],
+        [
+            Paragraph("<b>PRINTER</b>", styles["Body"]),
+            Paragraph(data["printer"]["name"], styles["Body"]),
+        ],
+    ]
+    p_table = Table(p_data, colWidths=[4 * cm, 5.5 * cm])
+    p_table.setStyle(
+        TableStyle(
+            [
+                ("BOX", (0, 0), (-1, -1), 1, colors.black),
+                ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.grey),
+            ]
+        )
+    )
+    left_story.append(p_table)
+    # left_story.append(Spacer(1, 0.5 * cm))
+
+    # --- 2. IDENTITAS ---
+    left_story.append(Paragraph("IDENTITAS", styles["SectionTitle"]))
+    i_data = [
+        [
+            Paragraph(
+                f"<b>{data['deposit']['priority_status'].upper()}</b>",
+                styles["Body"],
+            ),
+            Paragraph(data["customer"]["name"], styles["Body"]),
+        ],
+        [
+            Paragraph("<b>ID NUMBER</b>", styles["Body"]),
+            Paragraph(data["deposit"]["order"]["identifier"], styles["Body"]),
+        ],
+        [
+            Paragraph("<b>NAMA TIM</b>", styles["Body"]),
+            Paragraph(data["team_name"], styles["Body"]),
+        ],
+    ]
+    i_table = Table(i_data, colWidths=[4 * cm, 5.5 * cm])
+    i_table.setStyle(
+        TableStyle(
+            [
+                ("BOX", (0, 0), (-1, -1), 1, colors.black),
+                ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.grey),
+                (
+                    "BACKGROUND",
+                    (0, 0),
+                    (0, 0),
+                    colors.red
+                    if data["deposit"]["priority_status"].upper() == "URGENT"
+                    else colors.yellow,
+                ),  # "URGENT" row
+                ("BACKGROUND", (0, 2), (0, 2), colors.orange),  # "NAMA TIM" row
+            ]
+        )
+    )
+    left_story.append(i_table)
+    # left_story.append(Spacer(1, 0.5 * cm))
+
+    def create_design_image(json_key):
+        val = data.get(json_key)
+
+        # Convert media URL to real filesystem path
+        real_path = media_to_path(val)
+
+        elements = []
+
+        if real_path and os.path.exists(real_path):
+            try:
+                # 🚀 Embed a small derivative, not the full-resolution upload
+                img = Image(
+                    pdf_derivative(real_path) or real_path,
+                    width=2.7 * cm,
+                    height=2.7 * cm,
+                )
+                elements.append(img)
+            except Exception as e:
+                elements.append(
+                    Paragraph(
+                        f"<i>(Failed to load image: {e})</i>", styles["Placeholder"]
+                    )
+                )
+        else:
+            placeholder_val = val if val else "N/A"
+            elements.append(
+                Paragraph(f"<i>({placeholder_val})</i>", styles["Placeholder"])
+            )
+
+        elements.append(Spacer(1, 0.1 * cm))
+        return elements
+
+    # --- 3. DESAIN PRODUK ---
+    left_story.append(Paragraph("DESAIN PRODUK", styles["SectionTitle"]))
+    # Placeholder cells for images
+    front_cell = [
+        Paragraph("<b>DEPAN</b>", styles["LogoTitle"]),
+        Spacer(1, 2 * cm),
+        create_design_image("design_front"),
+        Spacer(1, 2 * cm),
+    ]
+    back_cell = [
+        Paragraph("<b>BELAKANG</b>", styles["LogoTitle"]),
+        Spacer(1, 2 * cm),
+        create_design_image("design_back"),
+        Spacer(1, 2 * cm),
+    ]
+    d_table = Table([[front_cell, back_cell]], colWidths=[4.75 * cm, 4.75 * cm])
+    d_table.setStyle(
+        TableStyle(
+            [
+                ("BOX", (0, 0), (-1, -1), 1, colors.black),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ]
+        )
+    )
+    left_story.append(d_table)
+    # left_story.append(Spacer(1, 0.5 * cm))
+
+    # --- 4. SPESIFIKASI TEKNIS ---
+    left_story.append(Paragraph("SPESIFIKASI TEKNIS", styles["SectionTitle"]))
+    s_data = [
+        [
+            Paragraph(f"<b>{key}</b>", styles["Body"]),
+            Paragraph(str(val), styles["Body"]),
+        ]
+        for key, val in [
+            (
+                "JUMLAH TOTAL",
+                f"{data['total_qty']} {data['order_item_display']['unit']}",
+            ),
+            ("POLA JERSEY", data["jersey_pattern"]),
+            ("JENIS JERSEY", data["jersey_type"]),
+            ("CUTTING JERSEY", data["jersey_cutting"]),
+            ("KERAH", data["collar_type"]),
+            ("CUTTING CELANA", data["pants_cutting"]),
+            ("PROMO LOGO EZ", data.get("promo_logo_ez") or "N/A"),
+            ("TAG SIZE - BAWAH BAJU", data.get("tag_size_bottom") or "N/A"),
+            ("TAG SIZE - PUNDAK (DTF)", data.get("tag_size_shoulder") or "N/A"),
+        ]
+    ]
+    s_table = Table(s_data, colWidths=[5.5 * cm, 4 * cm])
+    s_table.setStyle(
+        TableStyle(
+            [
+                ("BOX", (0, 0), (-1, -1), 1, colors.black),
+                ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.grey),
+            ]
+        )
+    )
+    left_story.append(s_table)
+    left_story.append(Spacer(1, 0.5 * cm))
+
+    # --- 5. BOTTOM LEFT LOGO ---
+    img = cached_image(
+        media_to_path("/media/ez_full.png"), width=7.5 * cm, height=0.8 * cm
+    )
+    if img is not None:
+        left_story.append(img)
+
+    # === RIGHT COLUMN ===
+
+    # --- 1. PREVIEW CETAK ---
+    right_story.append(Paragraph("PREVIEW CETAK", styles["SectionTitle"]))
+    # More placeholder cells
+    pc_front_cell = [
+        Spacer(1, 3 * cm),
+        create_design_image("preview_print_front"),
+        Spacer(1, 3 * cm),
+    ]
+    pc_back_cell = [
+        Spacer(1, 3 * cm),
+        create_design_image("preview_print_back"),
+        Spacer(1, 3 * cm),
+    ]
+    pc_table = Table([[pc_front_cell, pc_back_cell]], colWidths=[5.5 * cm, 4 * cm])
+    pc_table.setStyle(
+        TableStyle(
+            [
+                ("BOX", (0, 0), (-1, -1), 1, colors.black),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ]
+        )
+    )
+    right_story.append(pc_table)
+    # right_story.append(Spacer(1, 0.5 * cm))
+
+    # --- 2. LOGO ---
+    right_story.append(Paragraph("LOGO", styles["SectionTitle"]))
+
+    def create_logo_cell(title, json_key):
+        val = data.get(json_key)
+
+        # Convert media URL to real filesystem path
+        real_path = media_to_path(val)
+
+        elements = [Paragraph(title, styles["LogoTitle"]), Spacer(1, 0 * cm)]
+
+        if real_path and os.path.exists(real_path):
+            try:
+                # 🚀 Embed a small derivative, not the full-resolution upload
+                img = Image(
+                    pdf_derivative(real_path) or real_path,
+                    width=2.7 * cm,
+                    height=2.7 * cm,
+                )
+                elements.append(img)
+            except Exception as e:
+                elements.append(
+                    Paragraph(
+                        f"<i>(Failed to load image: {e})</i>", styles["Placeholder"]
+                    )
+                )
+        else:
+            placeholder_val = val if val else "N/A"
+            elements.append(
+                Paragraph(f"<i>({placeholder_val})</i>", styles["Placeholder"])
+            )
+
+        elements.append(Spacer(1, 0.1 * cm))
+        return elements
+
+    l_cell_1 = create_logo_cell("DADA KANAN", "logo_chest_right")
+    l_cell_2 = create_logo_cell("TENGAH", "logo_center")
+    l_cell_3 = create_logo_cell("DADA KIRI", "logo_chest_left")
+    l_cell_4 = create_logo_cell("BELAKANG", "logo_back")
+    l_cell_5 = create_logo_cell("CELANA", "logo_pants")
+
+    l_data = [[l_cell_1, l_cell_2, l_cell_3], [l_cell_4, l_cell_5, ""]]
+    l_table = Table(
+        l_data, colWidths=[3.16 * cm, 3.16 * cm, 3.16 * cm]
+    )  # 8cm total
+    l_table.setStyle(
+        TableStyle(
+            [
+                ("BOX", (0, 0), (0, 0), 1, colors.black),
+                ("BOX", (1, 0), (1, 0), 1, colors.black),
+                ("BOX", (2, 0), (2, 0), 1, colors.black),
+                ("BOX", (0, 1), (0, 1), 1, colors.black),
+                ("BOX", (1, 1), (1, 1), 1, colors.black),
+                ("BOX", (2, 1), (2, 1), 1, colors.black),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ]
+        )
+    )
+    right_story.append(l_table)
+    # right_story.append(Spacer(1, 0.5 * cm))
+
+    # --- 3. QUALITY CONTROL ---
+    right_story.append(Paragraph("QUALITY CONTROL", styles["SectionTitle"]))
+    qc_data = [
+        [Paragraph("<b>Desain:</b>", styles["Body"]), "-"],
+        [Paragraph("<b>Print:</b>", styles["Body"]), "-"],
+        [Paragraph("<b>Press:</b>", styles["Body"]), "-"],
+        [Paragraph("<b>QC Line:</b>", styles["Body"]), "-"],
+        [Paragraph("<b>QC Finishing:</b>", styles["Body"]), "-"],
+    ]
+    qc_table = Table(qc_data, colWidths=[4.5 * cm, 5 * cm], rowHeights=0.8 * cm)
+    qc_table.setStyle(
+        TableStyle(
+            [
+                ("BOX", (0, 0), (-1, -1), 1, colors.black),
+                ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.grey),
+            ]
+        )
+    )
+    right_story.append(qc_table)
+    # right_story.append(Spacer(1, 0.5 * cm))
+
+    # --- Build Main Table (2 Columns) ---
+    # Total page width (A4) = 21cm. Margins = 1.5 + 1.5 = 3cm.
+    # Drawable width = 18cm.
+    main_layout_table = Table(
+        [[left_story, right_story]],
+        colWidths=[10 * cm, 10 * cm],  # 9.5 + 8.5 = 18cm
+    )
+    main_layout_table.setStyle(TableStyle([("VALIGN", (0, 0), (-1, -1), "TOP")]))
+
+    story.append(main_layout_table)
+
+    # ==================================================================
+    # === NEW: BUILD PAGE 2 ===
+    # ==================================================================
+
+    details_list = data.get("details", [])
+
+    if details_list:
+        # Frame padding is 6pt at the top and bottom.
+        for table in _roster_tables(details_list, styles, doc.height - 12):
+            story.append(PageBreak())
+            story.append(table)
+
+    # ---------- Build PDF ----------
+    doc.build(story)
+    # buffer.seek(0)
+    pdf = buffer.getvalue()
+    buffer.close()
+    return pdf
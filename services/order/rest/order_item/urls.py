@@ -32,4 +32,13 @@ urlpatterns = [
         ),
         name="order-item-detail-pdf",
     ),
+    path(
+        "order-items/<str:subid>/order-form/roster/",
+        OrderItemViewSet.as_view(
+            {
+                "post": "roster_import",
+            }
+        ),
+        name="order-form-roster",
+    ),
 ]
@@ -1,6 +1,7 @@
 from django.urls import include, path
 
 from .order import urls as order_urls
+from .order_form_upload import urls as order_form_upload_urls
 from .order_item import urls as order_item_urls
 
 app_name = "order"
@@ -8,4 +9,5 @@ app_name = "order"
 urlpatterns = [
     path("order/", include(order_urls)),
     path("order/", include(order_item_urls)),
+    path("order/", include(order_form_upload_urls)),
 ]
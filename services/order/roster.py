@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from django.db import transaction
+
+from core.common.response_cache import bump_tags
+from services.forecast.list_rows import refresh_rows_for
+from core.common.spreadsheets import cell_text, read_sheet
+from services.order.models.order_form_detail import OrderFormDetail
+
+if TYPE_CHECKING:
+    from services.order.models.order_form import OrderForm
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "ROSTER_FIELDS",
+    "RosterReport",
+    "normalize_size",
+    "read_roster",
+    "import_roster",
+    "replace_roster",
+)
+
+ROSTER_FIELDS = ("back_name", "jersey_number", "shirt_size", "pants_size")
+
+BATCH_SIZE = 500
+
+# Header labels seen in customer rosters, see normalize_header().
+_HEADER_ALIASES = {
+    "back name": "back_name",
+    "nama": "back_name",
+    "nama punggung": "back_name",
+    "name": "back_name",
+    "jersey number": "jersey_number",
+    "no": "jersey_number",
+    "no punggung": "jersey_number",
+    "nomor": "jersey_number",
+    "nomor punggung": "jersey_number",
+    "number": "jersey_number",
+    "shirt size": "shirt_size",
+    "size baju": "shirt_size",
+    "baju": "shirt_size",
+    "pants size": "pants_size",
+    "size celana": "pants_size",
+    "celana": "pants_size",
+}
+
+# The PDF groups rows on the WOMEN/KIDS markers and sorts on S..5XL, so
+# sizes are stored in that vocabulary.
+_SIZE_ALIASES = {
+    "XXXL": "3XL",
+    "XXXXL": "4XL",
+    "XXXXXL": "5XL",
+    "2XL": "XXL",
+    "WANITA": "WOMEN",
+    "CEWEK": "WOMEN",
+    "WOMAN": "WOMEN",
+    "ANAK": "KIDS",
+    "KID": "KIDS",
+    "PRIA": "MEN",
+    "COWOK": "MEN",
+}
+
+
+@dataclass
+class RosterReport:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    errors: list = field(default_factory=list)
+
+    def as_dict(self):
+        return {
+            "created": self.created,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "deleted": self.deleted,
+            "errors": self.errors,
+        }
+
+
+def normalize_size(value) -> str:
+    """
+    Upper-cases a size and maps common spellings, e.g. "wanita xxxl" -> "WOMEN 3XL".
+    """
+    tokens = re.split(r"[\s/_-]+", str(value or "").strip().upper())
+    return " ".join(_SIZE_ALIASES.get(token, token) for token in tokens if token)
+
+
+def _normalize_row(raw: dict) -> dict:
+    return {
+        "back_name": cell_text(raw.get("back_name")),
+        "jersey_number": cell_text(raw.get("jersey_number")),
+        "shirt_size": normalize_size(raw.get("shirt_size")),
+        "pants_size": normalize_size(raw.get("pants_size")),
+    }
+
+
+def read_roster(upload) -> Iterator[tuple[int, dict]]:
+    """
+    Streams (row number, normalized row) pairs out of a CSV or XLSX upload.
+    """
+    for line, raw in read_sheet(upload, _HEADER_ALIASES, ROSTER_FIELDS):
+        yield line, _normalize_row(raw)
+
+
+def _batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _validate(rows, report: RosterReport) -> list:
+    """
+    Validates rows batch by batch through OrderFormDetailSerializer and
+    returns the valid ones in file order.
+    """
+    from services.order.rest.order_form.serializers import OrderFormDetailSerializer
+
+    valid = []
+    seen_lines = {}
+
+    for batch in _batched(rows, BATCH_SIZE):
+        serializer = OrderFormDetailSerializer(
+            data=[row for _, row in batch], many=True
+        )
+        # ListSerializer leaves validated_data empty when any row fails and
+        # errors empty when none do.
+        if serializer.is_valid():
+            results = [(data, None) for data in serializer.validated_data]
+        else:
+            results = [(row, errors) for (_, row), errors in zip(batch, serializer.errors)]
+
+        for (line, _), (data, errors) in zip(batch, results):
+            if errors:
+                report.errors.append({"row": line, "errors": errors})
+                continue
+
+            key = data["jersey_number"]
+            if key in seen_lines:
+                report.errors.append(
+                    {
+                        "row": line,
+                        "errors": {
+                            "jersey_number": [
+                                f"Duplicate jersey number, already used on row {seen_lines[key]}."
+                            ]
+                        },
+                    }
+                )
+                continue
+
+            seen_lines[key] = line
+            valid.append(data)
+
+    return valid
+
+
+def _upsert(order_form: OrderForm, rows: list, replace: bool, report: RosterReport):
+    # Lists per jersey number so rosters that already hold duplicates are
+    # matched pairwise instead of collapsing.
+    existing = {}
+    for detail in order_form.order_form_details.order_by("pk"):
+        existing.setdefault(detail.jersey_number, []).append(detail)
+
+    to_create = []
+    to_update = []
+    for data in rows:
+        matches = existing.get(data["jersey_number"])
+        detail = matches.pop(0) if matches else None
+        if detail is None:
+            to_create.append(OrderFormDetail(order_form=order_form, **data))
+            continue
+
+        changed = False
+        for name in ROSTER_FIELDS:
+            if getattr(detail, name) != data[name]:
+                setattr(detail, name, data[name])
+                changed = True
+
+        if changed:
+            to_update.append(detail)
+        else:
+            report.unchanged += 1
+
+    stale = [detail.pk for detail in to_update]
+    if replace:
+        stale.extend(detail.pk for matches in existing.values() for detail in matches)
+        report.deleted = len(stale) - len(to_update)
+
+    # Changed players are re-inserted under their old id/subid: a DELETE plus
+    # one multi-row INSERT is far cheaper than bulk_update's CASE per column,
+    # and nothing references OrderFormDetail rows.
+    if stale:
+        OrderFormDetail.objects.filter(pk__in=stale).delete()
+    OrderFormDetail.objects.bulk_create(to_update + to_create, batch_size=BATCH_SIZE)
+    # bulk_create sends no post_save
+    bump_tags(OrderFormDetail)
+    refresh_rows_for(order_form)
+
+    report.created = len(to_create)
+    report.updated = len(to_update)
+
+
+def import_roster(
+    order_form: OrderForm,
+    rows: Iterable[tuple[int, dict]],
+    *,
+    replace: bool = False,
+    dry_run: bool = False,
+) -> RosterReport:
+    """
+    Upserts roster rows into `order_form`, matching players on jersey number.
+
+    Nothing is written when any row fails validation; the report lists every
+    failing row instead. With `replace`, players missing from the file are
+    removed.
+    """
+    report = RosterReport()
+    valid = _validate(rows, report)
+
+    if report.errors or dry_run:
+        report.created = report.updated = report.unchanged = 0
+        return report
+
+    with transaction.atomic():
+        _upsert(order_form, valid, replace, report)
+
+    return report
+
+
+def replace_roster(order_form: OrderForm, details: Iterable[dict]) -> RosterReport:
+    """
+    Makes `order_form`'s roster match already-validated `details`, touching
+    only the rows that actually changed.
+    """
+    report = RosterReport()
+    with transaction.atomic():
+        _upsert(order_form, [dict(detail) for detail in details], True, report)
+
+    return report
@@ -0,0 +1,17 @@
+from services.order.models.order import Order
+from services.search.registry import register
+
+register(
+    "order",
+    Order,
+    [
+        "identifier",
+        "order_number",
+        "customer__name",
+        "invoice__invoice_no",
+        "user_name",
+        "convection_name",
+        "customer__phone",
+        "customer__address",
+    ],
+)
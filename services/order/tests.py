@@ -1,3 +1,152 @@
-from django.test import TestCase
+import io
+import shutil
+import tempfile
+import time
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from core.common.storage import content_addressed_storage
+from services.account.models.user import User
+from core.media import media_to_path
+from services.customer.models.customer import Customer
+from services.deposit.models.deposit import Deposit
+from services.order.models.order import Order
+from services.order.models.order_form import OrderForm
+from services.order.models.order_form_detail import OrderFormDetail
+from services.order.models.order_item import OrderItem
+from services.order.rest.order_item.pdf import (
+    order_form_cache_key,
+    order_form_pdf_data,
+    render_order_form_pdf,
+)
+from services.printer.models.printer import Printer
+from services.product.models.fabric_type import FabricType
+from services.product.models.product import Product
+from services.product.models.variant_type import ProductVariantType
+from services.store.models.store import Store
+
+MEDIA_ROOT = tempfile.mkdtemp(prefix="order-tests-")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, MEDIA_URL="/media/", MEDIA_URL_MAX_AGE=3600)
+class SignedMediaTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.name = content_addressed_storage.save("designs/front.png", ContentFile(b"design"))
+        self.other = content_addressed_storage.save("designs/back.png", ContentFile(b"other"))
+
+    def test_signed_url_serves_without_a_token(self):
+        response = self.client.get(content_addressed_storage.url(self.name))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"design")
+
+    def test_unsigned_url_needs_a_token(self):
+        response = self.client.get(f"/media/{self.name}")
+        self.assertEqual(response.status_code, 401)
+
+    def test_signature_is_bound_to_the_file(self):
+        signature = content_addressed_storage.url(self.other).split("?", 1)[1]
+        response = self.client.get(f"/media/{self.name}?{signature}")
+        self.assertEqual(response.status_code, 401)
+
+    def test_signature_expires(self):
+        url = content_addressed_storage.url(self.name)
+        with mock.patch("core.common.storage.time.time", return_value=time.time() + 3 * 3600):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 401)
+
+    def test_url_is_stable_within_a_period(self):
+        self.assertEqual(content_addressed_storage.url(self.name), content_addressed_storage.url(self.name))
+
+    def test_signed_url_maps_to_the_file(self):
+        path = media_to_path(content_addressed_storage.url(self.name))
+        self.assertEqual(path, content_addressed_storage.path(self.name))
+
+
+def png_bytes():
+    buffer = io.BytesIO()
+    Image.new("RGB", (40, 40), "red").save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def make_order_form():
+    printer = Printer.objects.create(name="Printer")
+    product = Product.objects.create(
+        name="Jersey", sku="J-1", printer=printer, store=Store.objects.create(name="Toko")
+    )
+    customer = Customer.objects.create(name="Budi", phone="0812", address="-", source="konveksi")
+    order = Order.objects.create(customer=customer, convection_name="Konveksi", order_type="konveksi")
+    item = OrderItem.objects.create(
+        order=order,
+        deposit=Deposit.objects.create(order=order, lead_time=7),
+        product=product,
+        fabric_type=FabricType.objects.create(name="Dryfit"),
+        variant_type=ProductVariantType.objects.create(code="S", name="Setelan", unit="pcs"),
+        price=Decimal(1),
+        quantity=3,
+    )
+    return OrderForm.objects.create(
+        order_item=item,
+        form_type="konveksi",
+        printer=printer,
+        team_name="Garuda FC",
+        jersey_pattern="Polos",
+        jersey_type="Setelan",
+        jersey_cutting="Reguler",
+        collar_type="V-neck",
+        pants_cutting="Reguler",
+    )
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, MEDIA_URL="/media/", PDF_CACHE_ROOT=MEDIA_ROOT)
+class OrderFormPdfTests(TestCase):
+    def setUp(self):
+        self.order_form = make_order_form()
+
+    def render(self):
+        return render_order_form_pdf(order_form_pdf_data(self.order_form))
+
+    def test_uploaded_images_are_embedded(self):
+        self.assertNotIn(b"/Subtype /Image", self.render())
+
+        self.order_form.design_front.save("front.png", ContentFile(png_bytes()))
+        self.order_form.logo_center.save("logo.png", ContentFile(png_bytes()))
+        self.assertEqual(self.render().count(b"/Subtype /Image"), 2)
+
+    def test_cache_key_follows_the_rows_not_the_signed_urls(self):
+        self.order_form.design_front.save("front.png", ContentFile(png_bytes()))
+        key = order_form_cache_key(self.order_form)
+
+        with mock.patch("core.common.storage.time.time", return_value=time.time() + 3 * 3600):
+            self.assertEqual(order_form_cache_key(self.order_form), key)
+
+        OrderFormDetail.objects.create(
+            order_form=self.order_form, back_name="Budi", jersey_number="7", shirt_size="L", pants_size="L"
+        )
+        self.assertNotEqual(order_form_cache_key(self.order_form), key)
+
+
+class RosterImportTests(TestCase):
+    def setUp(self):
+        self.order_form = make_order_form()
+        self.url = f"/api/order/order-items/{self.order_form.order_item.subid}/order-form/roster/"
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_superuser(username="admin", email="admin@example.com", password="x")
+        )
+
+    def test_corrupt_xlsx_is_a_bad_request(self):
+        upload = SimpleUploadedFile("roster.xlsx", b"back_name,jersey_number\nBudi,7\n")
+        response = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("detail", response.data)
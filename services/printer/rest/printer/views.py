@@ -38,3 +38,4 @@ class PrinterViewSet(BaseViewSet):
     serializer_map = {
         "autocomplete": PrinterSerializer,
     }
+    cache_tags = ("printer.printer",)
@@ -0,0 +1,99 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
+
+from services.product.models.fabric_price import FabricPrice
+from services.product.models.price_tier import ProductPriceTier
+from services.product.pricing import PriceLine, price_index
+
+
+def _legacy_price(product, fabric_type, variant_type, qty):
+    """Two queries per line, as get_dynamic_item_price used to do."""
+    tier_qs = product.price_tiers.all()
+    if variant_type:
+        tier_qs = tier_qs.filter(variant_type=variant_type)
+    else:
+        tier_qs = tier_qs.filter(variant_type__isnull=True)
+
+    tier = (
+        tier_qs.filter(min_qty__lte=qty)
+        .filter(Q(max_qty__gte=qty) | Q(max_qty__isnull=True))
+        .first()
+    )
+    if not tier:
+        return None
+
+    fabric_price = 0
+    if tier.variant_type:
+        fabric_price_obj = tier.variant_type.fabric_prices.filter(
+            fabric_type=fabric_type
+        ).first()
+        if fabric_price_obj:
+            fabric_price = fabric_price_obj.price or 0
+
+    final_price = tier.base_price + fabric_price
+    return final_price, final_price * qty
+
+
+class Command(BaseCommand):
+    help = "Benchmark order item pricing: per-line queries vs the price tier index."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lines", type=int, default=1000)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def _run(self, func):
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            result = func()
+            elapsed = (time.perf_counter() - start) * 1000
+        return result, elapsed, len(ctx.captured_queries)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+
+        tiers = list(
+            ProductPriceTier.objects.select_related("product", "variant_type")
+        )
+        if not tiers:
+            raise CommandError("No ProductPriceTier rows to benchmark against.")
+
+        fabric_by_variant = {}
+        for fabric_price in FabricPrice.objects.select_related("fabric_type"):
+            fabric_by_variant.setdefault(fabric_price.variant_type_id, []).append(
+                fabric_price.fabric_type
+            )
+
+        lines = []
+        for _ in range(options["lines"]):
+            tier = rng.choice(tiers)
+            fabric_types = fabric_by_variant.get(tier.variant_type_id) or [None]
+            qty = rng.randint(tier.min_qty, tier.max_qty or tier.min_qty + 100)
+            lines.append(
+                PriceLine(tier.product, rng.choice(fabric_types), tier.variant_type, qty)
+            )
+
+        legacy, legacy_ms, legacy_queries = self._run(
+            lambda: [
+                _legacy_price(l.product, l.fabric_type, l.variant_type, l.quantity)
+                for l in lines
+            ]
+        )
+
+        price_index.clear()
+        _, cold_ms, cold_queries = self._run(lambda: price_index.quote_many(lines))
+        indexed, warm_ms, warm_queries = self._run(lambda: price_index.quote_many(lines))
+
+        self.stdout.write(f"lines: {len(lines)}")
+        self.stdout.write(f"legacy      {legacy_ms:>9.2f} ms  {legacy_queries:>6} queries")
+        self.stdout.write(f"index cold  {cold_ms:>9.2f} ms  {cold_queries:>6} queries")
+        self.stdout.write(f"index warm  {warm_ms:>9.2f} ms  {warm_queries:>6} queries")
+
+        if legacy != indexed:
+            self.stdout.write(self.style.WARNING("Prices differ from the legacy lookup."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Done! Prices match."))
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-17 23:52
+
+import core.common.storage
+import services.product.rest.product.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0018_alter_productvarianttype_options'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to=services.product.rest.product.utils.product_image_upload_path, verbose_name='image'),
+        ),
+    ]
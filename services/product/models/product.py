@@ -7,6 +7,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from core.common.models import get_subid_model
+from core.common.storage import content_addressed_storage
 from services.product.rest.product.utils import product_image_upload_path
 
 if TYPE_CHECKING:
@@ -52,7 +53,11 @@ class Product(get_subid_model()):
     )
     sku = models.CharField(_("SKU"), max_length=64, unique=True)
     image = models.ImageField(
-        _("image"), upload_to=product_image_upload_path, blank=True, null=True
+        _("image"),
+        upload_to=product_image_upload_path,
+        storage=content_addressed_storage,
+        blank=True,
+        null=True,
     )
     created = models.DateTimeField(_("created"), auto_now_add=True)
     updated = models.DateTimeField(_("updated"), auto_now=True)
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Iterable
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+
+from services.product.models.fabric_price import FabricPrice
+from services.product.models.price_tier import ProductPriceTier
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "PriceLine",
+    "PriceIndex",
+    "price_index_version",
+    "bump_price_index_version",
+    "price_index",
+)
+
+# Shared by every worker: bumped on tier/fabric price changes, and each
+# process drops its whole index when it moves.
+VERSION_KEY = "product:price-index-version"
+
+# Backstop for a cache that is not shared between workers (LocMemCache),
+# where other processes never see the bumps.
+INDEX_TTL_SECONDS = 60
+
+
+def _fresh_version() -> int:
+    # Not 1: after a restart or an eviction the version must not come back
+    # at a value a worker already holds an index for.
+    return time.time_ns()
+
+
+def price_index_version() -> int:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, _fresh_version(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_price_index_version():
+    """
+    Invalidates the price index of every worker, see services.product.signals.
+    """
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, _fresh_version(), timeout=None)
+
+
+@dataclass(frozen=True)
+class PriceLine:
+    product: object
+    fabric_type: object
+    variant_type: object
+    quantity: int
+
+
+class _ProductTiers:
+    """
+    Tiers of one product grouped by variant type, sorted by min_qty so a
+    quantity is resolved with a single bisect.
+    """
+
+    def __init__(self, tiers: Iterable[ProductPriceTier]):
+        grouped: dict = {}
+        for tier in tiers:
+            grouped.setdefault(tier.variant_type_id, []).append(
+                (tier.min_qty, tier.max_qty, tier.base_price or Decimal(0))
+            )
+
+        self.by_variant = {}
+        for variant_type_id, rows in grouped.items():
+            rows.sort(key=lambda row: row[0])
+            self.by_variant[variant_type_id] = ([row[0] for row in rows], rows)
+
+        self.loaded_at = time.monotonic()
+
+    def find(self, variant_type_id, qty):
+        """Returns the base price of the tier holding `qty`, or None."""
+        entry = self.by_variant.get(variant_type_id)
+        if not entry:
+            return None
+
+        mins, rows = entry
+        end = bisect_right(mins, qty)
+
+        # Tiers should not overlap; if they do, the lowest min_qty wins, as
+        # the min_qty ordering of the tier query did.
+        for min_qty, max_qty, base_price in rows[:end]:
+            if max_qty is None or max_qty >= qty:
+                return base_price
+
+        return None
+
+
+class PriceIndex:
+    """
+    Per-process index of ProductPriceTier rows and the FabricPrice matrix.
+
+    Products are loaded lazily, all at once per batch, and dropped when their
+    tiers change (see services.product.signals). Changes made by other
+    workers are picked up through `price_index_version()`, read once per
+    quote.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._products: dict[int, _ProductTiers] = {}
+        self._fabric_prices: dict[tuple[int, int], Decimal] | None = None
+        self._fabric_loaded_at = 0.0
+        # Bumped on every invalidation so a load that raced with a save is
+        # used once but not stored.
+        self._generation = 0
+        self._version = None
+
+    # --- invalidation ---
+
+    def invalidate_product(self, product_id):
+        with self._lock:
+            self._products.pop(product_id, None)
+            self._generation += 1
+
+    def invalidate_fabric_prices(self):
+        with self._lock:
+            self._fabric_prices = None
+            self._generation += 1
+
+    def clear(self):
+        with self._lock:
+            self._products.clear()
+            self._fabric_prices = None
+            self._generation += 1
+
+    def _sync_version(self):
+        version = price_index_version()
+        if version == self._version:
+            return
+        with self._lock:
+            self._products.clear()
+            self._fabric_prices = None
+            self._generation += 1
+            self._version = version
+
+    # --- loading ---
+
+    def _is_fresh(self, loaded_at):
+        return time.monotonic() - loaded_at < INDEX_TTL_SECONDS
+
+    def _load_products(self, product_ids) -> dict[int, _ProductTiers]:
+        loaded = {}
+        missing = set()
+        for pk in product_ids:
+            entry = self._products.get(pk)
+            if entry is not None and self._is_fresh(entry.loaded_at):
+                loaded[pk] = entry
+            else:
+                missing.add(pk)
+
+        if not missing:
+            return loaded
+
+        generation = self._generation
+        grouped = {pk: [] for pk in missing}
+        for tier in ProductPriceTier.objects.filter(product_id__in=missing).only(
+            "product_id", "variant_type_id", "min_qty", "max_qty", "base_price"
+        ):
+            grouped[tier.product_id].append(tier)
+
+        with self._lock:
+            for pk, tiers in grouped.items():
+                loaded[pk] = _ProductTiers(tiers)
+                if generation == self._generation:
+                    self._products[pk] = loaded[pk]
+
+        return loaded
+
+    def _load_fabric_prices(self):
+        if self._fabric_prices is not None and self._is_fresh(self._fabric_loaded_at):
+            return self._fabric_prices
+
+        generation = self._generation
+        fabric_prices = {
+            (variant_type_id, fabric_type_id): price or Decimal(0)
+            for variant_type_id, fabric_type_id, price in FabricPrice.objects.values_list(
+                "variant_type_id", "fabric_type_id", "price"
+            )
+        }
+
+        with self._lock:
+            if generation == self._generation:
+                self._fabric_prices = fabric_prices
+                self._fabric_loaded_at = time.monotonic()
+
+        return fabric_prices
+
+    # --- pricing ---
+
+    def quote_many(self, lines: list[PriceLine]) -> list[tuple[Decimal, Decimal]]:
+        """
+        Prices every line with at most two queries for the whole batch.
+
+        Returns a list of (final_price, subtotal) in input order and raises
+        ValidationError on the first line without a matching tier.
+        """
+        if not lines:
+            return []
+
+        self._sync_version()
+        products = self._load_products({line.product.pk for line in lines})
+        fabric_prices = self._load_fabric_prices()
+
+        results = []
+        for line in lines:
+            product = line.product
+            variant_type_id = line.variant_type.pk if line.variant_type else None
+
+            base_price = products[product.pk].find(variant_type_id, line.quantity)
+            if base_price is None:
+                raise ValidationError(
+                    f"No valid price tier found for quantity {line.quantity} on product {product.name}."
+                )
+
+            # Fabric price only applies to tiers bound to a variant type
+            fabric_price = Decimal(0)
+            if variant_type_id and line.fabric_type:
+                fabric_price = fabric_prices.get(
+                    (variant_type_id, line.fabric_type.pk), Decimal(0)
+                )
+
+            final_price = base_price + fabric_price
+            results.append((final_price, final_price * line.quantity))
+
+        return results
+
+    def quote(self, product, fabric_type, variant_type, qty):
+        return self.quote_many([PriceLine(product, fabric_type, variant_type, qty)])[0]
+
+
+price_index = PriceIndex()
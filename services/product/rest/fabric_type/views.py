@@ -45,3 +45,8 @@ class FabricTypeViewSet(BaseViewSet):
         "partial_update": FabricTypeCreateSerializer,
         "update": FabricTypeCreateSerializer,
     }
+    cache_tags = (
+        "product.fabrictype",
+        "product.fabricprice",
+        "product.productvarianttype",
+    )
@@ -4,7 +4,7 @@ from rest_framework import serializers
 from typing import TYPE_CHECKING
 from django.utils.translation import gettext_lazy as _
 import logging
-from core.common.serializers import BaseModelSerializer
+from core.common.serializers import BaseModelSerializer, ThumbnailField
 from services.printer.models.printer import Printer
 from services.printer.rest.printer.serializers import PrinterSerializer
 from services.product.models.fabric_price import FabricPrice
@@ -114,12 +114,15 @@ class ProductSerializer(BaseModelSerializer):
 
     price_tiers = ProductPriceTierNestedSerializer(many=True, required=False)
 
+    image_thumb = ThumbnailField(source="image")
+
     class Meta:
         model = Product
         fields = [
             "pk",
             "name",
             "image",
+            "image_thumb",
             "printer",
             "printer_display",
             "store",
@@ -50,3 +50,14 @@ class ProductViewSet(BaseViewSet):
         "autocomplete": ProductSerializerSimple,
     }
     filterset_class = ProductFilterSet
+    autocomplete_fields = ("name", "sku")
+    autocomplete_label_fields = ("sku", "name")
+    cache_tags = (
+        "product.product",
+        "product.productpricetier",
+        "product.productvarianttype",
+        "product.fabricprice",
+        "product.fabrictype",
+        "store.store",
+        "printer.printer",
+    )
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework import serializers
+
+from services.order.rest.order.serializers import _format_decimal_as_int_or_float
+from services.product.models.fabric_type import FabricType
+from services.product.models.product import Product
+from services.product.models.variant_type import ProductVariantType
+from services.product.pricing import PriceLine, price_index
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = ("QuoteItemSerializer", "QuoteSerializer")
+
+
+class QuoteItemSerializer(serializers.Serializer):
+    # Plain subids, resolved in bulk by QuoteSerializer.validate
+    product = serializers.CharField()
+    fabric_type = serializers.CharField()
+    variant_type = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+    quantity = serializers.IntegerField(min_value=1)
+
+
+class QuoteSerializer(serializers.Serializer):
+    """
+    Prices a whole cart in one call.
+
+    Example input:
+        {"items": [{"product": "<subid>", "fabric_type": "<subid>",
+                    "variant_type": "<subid>", "quantity": 12}]}
+    """
+
+    items = QuoteItemSerializer(many=True, allow_empty=False)
+
+    def _resolve(self, model, subids, field_name):
+        found = {obj.subid: obj for obj in model.objects.filter(subid__in=subids)}
+        missing = sorted(set(subids) - set(found))
+        if missing:
+            raise serializers.ValidationError(
+                {field_name: f"Object with subid={missing[0]} does not exist."}
+            )
+        return found
+
+    def validate(self, attrs):
+        items = attrs["items"]
+
+        products = self._resolve(
+            Product, {item["product"] for item in items}, "product"
+        )
+        fabric_types = self._resolve(
+            FabricType, {item["fabric_type"] for item in items}, "fabric_type"
+        )
+        variant_types = self._resolve(
+            ProductVariantType,
+            {item["variant_type"] for item in items if item.get("variant_type")},
+            "variant_type",
+        )
+
+        lines = [
+            PriceLine(
+                product=products[item["product"]],
+                fabric_type=fabric_types[item["fabric_type"]],
+                variant_type=variant_types.get(item.get("variant_type")),
+                quantity=item["quantity"],
+            )
+            for item in items
+        ]
+
+        try:
+            attrs["prices"] = price_index.quote_many(lines)
+        except DjangoValidationError as e:
+            raise serializers.ValidationError({"items": e.messages})
+
+        return attrs
+
+    def to_representation(self, instance):
+        items = []
+        total = 0
+
+        for item, (price, subtotal) in zip(instance["items"], instance["prices"]):
+            items.append(
+                {
+                    "product": item["product"],
+                    "fabric_type": item["fabric_type"],
+                    "variant_type": item.get("variant_type") or None,
+                    "quantity": item["quantity"],
+                    "price": _format_decimal_as_int_or_float(price),
+                    "subtotal": _format_decimal_as_int_or_float(subtotal),
+                }
+            )
+            total += subtotal
+
+        return {
+            "items": items,
+            "total": _format_decimal_as_int_or_float(total),
+        }
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import QuoteAPIView
+
+urlpatterns = [
+    path("quote/", QuoteAPIView.as_view(), name="quote"),
+]
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from services.product.rest.quote.serializers import QuoteSerializer
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = ("QuoteAPIView",)
+
+
+class QuoteAPIView(APIView):
+    """
+    POST /api/product/quote/
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Products"],
+        operation_description="Price a list of order items using the product price tiers and fabric prices.",
+        request_body=QuoteSerializer,
+    )
+    def post(self, request):
+        serializer = QuoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
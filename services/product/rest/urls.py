@@ -2,6 +2,7 @@ from django.urls import path, include
 from .product import urls as product_urls
 from .variant_type import urls as product_variant_type_urls
 from .fabric_type import urls as fabric_type_urls
+from .quote import urls as quote_urls
 
 app_name = "product"
 
@@ -9,4 +10,5 @@ urlpatterns = [
     path('product/', include(product_urls)),
     path('product/', include(product_variant_type_urls)),
     path('product/', include(fabric_type_urls)),
+    path('product/', include(quote_urls)),
 ]
\ No newline at end of file
@@ -39,6 +39,12 @@ class ProductVariantTypeViewSet(BaseViewSet):
     serializer_map = {
         "autocomplete": ProductVariantTypeSerializerSimple,
     }
+    cache_tags = (
+        "product.productvarianttype",
+        # ?product= filters through price tiers
+        "product.productpricetier",
+        "product.product",
+    )
 
     def get_queryset(self):
         queryset = super().get_queryset()
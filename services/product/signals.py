@@ -0,0 +1,19 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from services.product.models.fabric_price import FabricPrice
+from services.product.models.price_tier import ProductPriceTier
+from services.product.pricing import bump_price_index_version, price_index
+
+
+@receiver([post_save, post_delete], sender=ProductPriceTier)
+def invalidate_product_price_tiers(sender, instance, **kwargs):
+    price_index.invalidate_product(instance.product_id)
+    transaction.on_commit(bump_price_index_version)
+
+
+@receiver([post_save, post_delete], sender=FabricPrice)
+def invalidate_fabric_prices(sender, instance, **kwargs):
+    price_index.invalidate_fabric_prices()
+    transaction.on_commit(bump_price_index_version)
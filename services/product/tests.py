@@ -1,3 +1,73 @@
+from decimal import Decimal
+
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from services.account.models.user import User
+from services.printer.models.printer import Printer
+from services.product.models.price_tier import ProductPriceTier
+from services.product.models.product import Product
+from services.product.pricing import PriceLine, PriceIndex
+from services.store.models.store import Store
+
+
+class ProductAutocompleteTests(TestCase):
+    url = "/api/product/products/autocomplete/"
+
+    @classmethod
+    def setUpTestData(cls):
+        printer = Printer.objects.create(name="Printer")
+        cls.store = Store.objects.create(name="Toko Satu")
+        other = Store.objects.create(name="Toko Dua")
+        cls.kaos = Product.objects.create(name="Kaos Polo", sku="KP-1", printer=printer, store=cls.store)
+        Product.objects.create(name="Kaos Oblong", sku="KO-1", printer=printer, store=other)
+        Product.objects.create(name="Kemeja", sku="KAOS-9", printer=printer, store=cls.store)
+        cls.user = User.objects.create_superuser(username="admin", email="admin@example.com", password="x")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_prefix_matches_each_field(self):
+        response = self.client.get(self.url, {"search": "kaos"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [row["label"] for row in response.data["results"]],
+            ["KO-1 - Kaos Oblong", "KP-1 - Kaos Polo", "KAOS-9 - Kemeja"],
+        )
+
+    def test_picker_filters_apply(self):
+        response = self.client.get(self.url, {"search": "kaos", "store": self.store.subid})
+        self.assertEqual(
+            [row["subid"] for row in response.data["results"]],
+            [self.kaos.subid, Product.objects.get(sku="KAOS-9").subid],
+        )
+
+
+class PriceIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.product = Product.objects.create(
+            name="Kaos", sku="K-1", printer=Printer.objects.create(name="Printer"), store=Store.objects.create(name="Toko")
+        )
+        for min_qty, max_qty, price in ((1, 11, "50000"), (10, None, "45000"), (5, 8, "48000")):
+            ProductPriceTier.objects.create(product=cls.product, min_qty=min_qty, max_qty=max_qty, base_price=price)
+
+    def quote(self, quantity, index=None):
+        line = PriceLine(product=self.product, fabric_type=None, variant_type=None, quantity=quantity)
+        return (index or PriceIndex()).quote_many([line])[0][0]
+
+    def test_overlapping_tiers_pick_the_lowest_min_qty(self):
+        self.assertEqual(self.quote(6), Decimal("50000"))
+        self.assertEqual(self.quote(10), Decimal("50000"))
+        self.assertEqual(self.quote(12), Decimal("45000"))
+
+    def test_other_workers_drop_their_index_on_a_change(self):
+        worker = PriceIndex()
+        self.assertEqual(self.quote(12, worker), Decimal("45000"))
 
-# Create your tests here.
+        tier = ProductPriceTier.objects.get(min_qty=10)
+        tier.base_price = Decimal("40000")
+        with self.captureOnCommitCallbacks(execute=True):
+            tier.save()
+        self.assertEqual(self.quote(12, worker), Decimal("40000"))
@@ -112,6 +112,35 @@ class QueueEntry(get_subid_model()):
             if not QueueEntry.objects.filter(ticket_number=ticket).exists():
                 return ticket
 
+    @staticmethod
+    def generate_ticket_numbers(count: int) -> list[str]:
+        """
+        Same as `generate_ticket_number`, for `count` tickets at once.
+
+        Collisions are checked with one IN query per round instead of one
+        query per ticket.
+        """
+        tickets = set()
+        while len(tickets) < count:
+            candidates = set()
+            while len(candidates) < count - len(tickets):
+                ticket = (
+                    "Q-"
+                    + "".join(secrets.choice(string.ascii_uppercase) for _ in range(3))
+                    + "".join(secrets.choice(string.digits) for _ in range(5))
+                )
+                if ticket not in tickets:
+                    candidates.add(ticket)
+
+            taken = set(
+                QueueEntry.objects.filter(ticket_number__in=candidates).values_list(
+                    "ticket_number", flat=True
+                )
+            )
+            tickets |= candidates - taken
+
+        return list(tickets)
+
     def save(self, *args, **kwargs):
         if not self.ticket_number:
             self.ticket_number = self.generate_ticket_number()
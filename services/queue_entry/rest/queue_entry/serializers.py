@@ -4,14 +4,15 @@ import logging
 from typing import TYPE_CHECKING
 from rest_framework import serializers
 
-from core.common.serializers import BaseModelSerializer
+from core.common.serializers import (
+    BaseModelSerializer,
+    DueDateListSerializer,
+    DueDateMixin,
+)
 from services.account.rest.user.serializers import UserSerializerSimple
 from services.deposit.rest.deposit.serializers import DepositDetailSerializer, DepositListSerializer
 from services.queue_entry.models import QueueEntry
 
-import datetime
-import holidays
-
 if TYPE_CHECKING:
     pass
 
@@ -20,7 +21,7 @@ logger = logging.getLogger(__name__)
 __all__ = ("QueueEntrySerializer",)
 
 
-class QueueEntrySerializer(BaseModelSerializer):
+class QueueEntrySerializer(DueDateMixin, BaseModelSerializer):
     """
     Serializer for QueueEntry management.
     """
@@ -53,6 +54,7 @@ class QueueEntrySerializer(BaseModelSerializer):
             "updated",
             "type",
         ]
+        list_serializer_class = DueDateListSerializer
         
     def to_representation(self, instance):
         data = super().to_representation(instance)
@@ -83,36 +85,21 @@ class QueueEntrySerializer(BaseModelSerializer):
 
         return ps.upper() if ps else None
 
-    def get_estimate_sent(self, obj):
+    def get_due_date_source(self, obj):
         if obj.order_item and obj.order_item.deposit:
             deposit = obj.order_item.deposit
-            accepted_at = getattr(deposit, "accepted_at", None)
-            lead_time = getattr(deposit, "lead_time", 0)
-
-            if accepted_at and lead_time:
-                # Use Indonesian public holidays
-                id_holidays = holidays.country_holidays("ID", years=accepted_at.year)
-
-                current_date = accepted_at
-                days_added = 0
-
-                while days_added < lead_time:
-                    current_date += datetime.timedelta(days=1)
+            if not deposit.estimate_sent:
+                return deposit.get_estimate_sent_source()
+        return None, 0
 
-                    # Skip weekends (Saturday=5, Sunday=6)
-                    if current_date.weekday() >= 5:
-                        continue
-
-                    # Skip Indonesian holidays
-                    if current_date in id_holidays:
-                        continue
-
-                    days_added += 1
+    def get_estimate_sent(self, obj):
+        deposit = obj.order_item.deposit if obj.order_item else None
+        due_date = (deposit and deposit.estimate_sent) or self.resolve_due_date(obj)
+        if due_date:
+            return due_date.strftime("%Y-%m-%d")
 
-                return current_date.strftime("%Y-%m-%d")
-        
         # Fallback to the order's estimated date
         if obj.order:
             return obj.order.estimated_shipping_date
             
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "services.search"
+
+    def ready(self):
+        from django.utils.module_loading import autodiscover_modules
+
+        # Every app declares its indexes in a `search` module.
+        autodiscover_modules("search")
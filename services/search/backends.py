@@ -0,0 +1,104 @@
+"""
+Full-text backends: each narrows SearchDocument rows down to those matching
+every search term, through the index the migration created for the
+database in use. SEARCH_BACKEND (a dotted path) overrides the choice.
+"""
+
+from __future__ import annotations
+
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+__all__ = (
+    "tokenize",
+    "SearchBackend",
+    "MySQLFullTextBackend",
+    "SQLiteFTS5Backend",
+    "get_backend",
+)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(terms) -> list[str]:
+    """Words of the search terms; punctuation separates them, as in the index."""
+    return [token for term in terms for token in _TOKEN_RE.findall(term.lower())]
+
+
+class SearchBackend:
+    """
+    Substring match on the document body, for databases without a
+    full-text index here. Still one table, not the joins SearchFilter walks.
+    """
+
+    # Shorter tokens are not in the full-text index and fall back to LIKE.
+    min_token_length = 1
+
+    def filter(self, documents, terms):
+        indexed = []
+        for token in tokenize(terms):
+            if len(token) < self.min_token_length:
+                documents = documents.filter(body__icontains=token)
+            else:
+                indexed.append(token)
+
+        if indexed:
+            documents = self.match(documents, indexed)
+        return documents
+
+    def match(self, documents, tokens):
+        for token in tokens:
+            documents = documents.filter(body__icontains=token)
+        return documents
+
+
+class MySQLFullTextBackend(SearchBackend):
+    """
+    FULLTEXT ... WITH PARSER ngram: any substring of at least
+    ngram_token_size (2 by default) characters matches, like icontains.
+    The index is built with no stopword list (migration 0002), which would
+    otherwise drop every n-gram containing "a", "in", "to" and the like.
+    """
+
+    min_token_length = 2
+
+    def match(self, documents, tokens):
+        query = " ".join(f'+"{token}"' for token in tokens)
+        return documents.filter(
+            RawSQL("MATCH (body) AGAINST (%s IN BOOLEAN MODE)", [query], output_field=BooleanField())
+        )
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    """FTS5 trigram table: substrings of three characters or more."""
+
+    min_token_length = 3
+
+    def match(self, documents, tokens):
+        query = " AND ".join(f'"{token}"' for token in tokens)
+        return documents.filter(
+            RawSQL(
+                "id IN (SELECT rowid FROM search_searchdocument_fts "
+                "WHERE search_searchdocument_fts MATCH %s)",
+                [query],
+                output_field=BooleanField(),
+            )
+        )
+
+
+_VENDOR_BACKENDS = {
+    "mysql": MySQLFullTextBackend,
+    "sqlite": SQLiteFTS5Backend,
+}
+
+
+def get_backend() -> SearchBackend:
+    path = getattr(settings, "SEARCH_BACKEND", None)
+    if path:
+        return import_string(path)()
+    return _VENDOR_BACKENDS.get(connection.vendor, SearchBackend)()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from rest_framework import filters
+
+from services.search.registry import get_index
+
+__all__ = ("IndexedSearchFilter",)
+
+
+class IndexedSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter that answers `?search=` from the view's `search_index`
+    (see services.search.registry) when it has one: a full-text lookup on
+    one table, joined back on ids, instead of icontains over every
+    `search_fields` join and annotation.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        index_name = getattr(view, "search_index", None)
+        terms = self.get_search_terms(request)
+        if not index_name or not terms:
+            return super().filter_queryset(request, queryset, view)
+
+        return get_index(index_name).filter(queryset, terms)
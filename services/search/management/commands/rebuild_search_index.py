@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from services.search import registry
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the search documents of the given indexes (all when none are "
+        "named). Run after deploying an index or changing its fields."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("indexes", nargs="*")
+        parser.add_argument("--batch-size", type=int, default=registry.BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        indexes = registry.indexes()
+        names = options["indexes"] or sorted(indexes)
+        unknown = set(names) - indexes.keys()
+        if unknown:
+            raise CommandError(f"Unknown search index: {', '.join(sorted(unknown))}")
+
+        batch_size = options["batch_size"]
+        for name in names:
+            index = indexes[name]
+            ids = list(index.model._base_manager.order_by("pk").values_list("pk", flat=True))
+
+            with transaction.atomic():
+                # Documents of objects deleted behind the signals' back
+                stale = index.documents().exclude(object_id__in=index.model._base_manager.values("pk"))
+                removed, _ = stale.delete()
+
+            refreshed = 0
+            for start in range(0, len(ids), batch_size):
+                with transaction.atomic():
+                    refreshed += index.refresh(ids[start : start + batch_size])
+
+            self.stdout.write(self.style.SUCCESS(f"{name}: {refreshed} documents, {removed} stale removed."))
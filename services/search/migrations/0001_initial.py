@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index_name', models.CharField(max_length=50)),
+                ('object_id', models.BigIntegerField()),
+                ('body', models.TextField(blank=True, default='')),
+                ('updated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'default_permissions': (),
+                'constraints': [models.UniqueConstraint(fields=('index_name', 'object_id'), name='search_document_unique_object')],
+            },
+        ),
+    ]
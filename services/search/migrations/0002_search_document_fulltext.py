@@ -0,0 +1,69 @@
+from django.db import migrations
+
+# Django cannot declare full-text indexes, see services.search.backends.
+# InnoDB ties a stopword list to a FULLTEXT index when it is created, and the
+# ngram parser drops every n-gram containing a stopword ("a", "in", "to"...),
+# so names like "Santoso" or "Jalan" would not match their substrings. Built
+# with the list off, the index matches like icontains.
+MYSQL_FORWARD = [
+    "SET SESSION innodb_ft_enable_stopword = OFF",
+    "ALTER TABLE search_searchdocument "
+    "ADD FULLTEXT INDEX search_document_body_ft (body) WITH PARSER ngram",
+    "SET SESSION innodb_ft_enable_stopword = DEFAULT",
+]
+MYSQL_REVERSE = [
+    "ALTER TABLE search_searchdocument DROP INDEX search_document_body_ft",
+]
+
+# External-content FTS5 table kept in step with the documents by triggers.
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE search_searchdocument_fts USING fts5("
+    "body, content='search_searchdocument', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER search_searchdocument_ai AFTER INSERT ON search_searchdocument BEGIN "
+    "INSERT INTO search_searchdocument_fts(rowid, body) VALUES (new.id, new.body); END",
+    "CREATE TRIGGER search_searchdocument_ad AFTER DELETE ON search_searchdocument BEGIN "
+    "INSERT INTO search_searchdocument_fts(search_searchdocument_fts, rowid, body) "
+    "VALUES ('delete', old.id, old.body); END",
+    "CREATE TRIGGER search_searchdocument_au AFTER UPDATE ON search_searchdocument BEGIN "
+    "INSERT INTO search_searchdocument_fts(search_searchdocument_fts, rowid, body) "
+    "VALUES ('delete', old.id, old.body); "
+    "INSERT INTO search_searchdocument_fts(rowid, body) VALUES (new.id, new.body); END",
+]
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS search_searchdocument_au",
+    "DROP TRIGGER IF EXISTS search_searchdocument_ad",
+    "DROP TRIGGER IF EXISTS search_searchdocument_ai",
+    "DROP TABLE IF EXISTS search_searchdocument_fts",
+]
+
+STATEMENTS = {
+    "mysql": (MYSQL_FORWARD, MYSQL_REVERSE),
+    "sqlite": (SQLITE_FORWARD, SQLITE_REVERSE),
+}
+
+
+def _run(schema_editor, forward):
+    statements = STATEMENTS.get(schema_editor.connection.vendor)
+    if statements is None:
+        return
+    for sql in statements[0 if forward else 1]:
+        schema_editor.execute(sql)
+
+
+def create_fulltext_index(apps, schema_editor):
+    _run(schema_editor, forward=True)
+
+
+def drop_fulltext_index(apps, schema_editor):
+    _run(schema_editor, forward=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
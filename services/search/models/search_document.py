@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.db import models
+
+if TYPE_CHECKING:
+    pass
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "SearchDocumentQuerySet",
+    "SearchDocumentManager",
+    "SearchDocument",
+)
+
+
+class SearchDocumentQuerySet(models.QuerySet):
+    pass
+
+
+_SearchDocumentManagerBase = models.Manager.from_queryset(SearchDocumentQuerySet)  # type: type[SearchDocumentQuerySet]
+
+
+class SearchDocumentManager(_SearchDocumentManagerBase):
+    pass
+
+
+class SearchDocument(models.Model):
+    """
+    The searchable text of one object of a search index, see
+    services.search.registry. `body` carries a full-text index (MySQL
+    FULLTEXT with the ngram parser, an FTS5 trigram table on SQLite) created
+    by the migration, since Django cannot declare one.
+    """
+
+    index_name = models.CharField(max_length=50)
+    object_id = models.BigIntegerField()
+    body = models.TextField(blank=True, default="")
+    updated = models.DateTimeField(auto_now=True)
+
+    objects = SearchDocumentManager()
+
+    class Meta:
+        default_permissions = ()
+        verbose_name = "Search Document"
+        verbose_name_plural = "Search Documents"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["index_name", "object_id"], name="search_document_unique_object"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.index_name}:{self.object_id}"
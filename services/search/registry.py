@@ -0,0 +1,183 @@
+"""
+Search indexes: one SearchDocument per object of a model, holding the text
+of the fields a list endpoint searches, including fields of related rows.
+
+An app declares its indexes in a `search` module (autodiscovered by
+SearchConfig) and a view opts in with `search_index = "<name>"`; `?search=`
+then filters on the matching ids instead of OR-ing icontains over joins.
+
+Documents follow the indexed model and every model its field paths cross,
+through model signals, in the writing transaction. Writes that send no
+signals call related_changed(); rebuild_search_index regenerates an index.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+
+from django.db.models.signals import post_delete, post_save, pre_delete
+
+from core.common.models import upsert_conflict_fields
+from services.search.backends import get_backend
+from services.search.models.search_document import SearchDocument
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "SearchIndex",
+    "register",
+    "get_index",
+    "indexes",
+    "related_changed",
+)
+
+BATCH_SIZE = 500
+
+_indexes: dict[str, SearchIndex] = {}
+# model -> [(index, lookup from the index's model to it)], "" for the model itself
+_dependents: dict[type, list[tuple[SearchIndex, str]]] = defaultdict(list)
+
+# Set on instances being deleted, read back once the delete went through
+_AFFECTED_ATTR = "_search_documents"
+
+
+class SearchIndex:
+    def __init__(self, name: str, model, fields):
+        self.name = name
+        self.model = model
+        self.fields = tuple(fields)
+
+    def __repr__(self):
+        return f"<SearchIndex {self.name}>"
+
+    def dependencies(self) -> dict[type, set[str]]:
+        """Every model a field path crosses, with the lookup that reaches it."""
+        found = defaultdict(set)
+        for path in self.fields:
+            model, prefix = self.model, []
+            for name in path.split("__"):
+                field = model._meta.get_field(name)
+                if field.related_model is None:
+                    break
+                prefix.append(name)
+                model = field.related_model
+                found[model].add("__".join(prefix))
+        return found
+
+    def documents(self):
+        return SearchDocument.objects.filter(index_name=self.name)
+
+    def build(self, ids) -> dict[int, str]:
+        bodies = {pk: {} for pk in ids}
+        rows = self.model._base_manager.filter(pk__in=ids).values_list("pk", *self.fields)
+        for pk, *values in rows:
+            # Reverse relations yield a row per related object
+            for value in values:
+                if value not in (None, ""):
+                    bodies[pk][str(value)] = None
+        return {pk: "\n".join(values) for pk, values in bodies.items()}
+
+    def refresh(self, ids) -> int:
+        """Rebuilds the documents of `ids`, dropping those of deleted objects."""
+        ids = sorted({pk for pk in ids if pk is not None})
+        refreshed = 0
+        for start in range(0, len(ids), BATCH_SIZE):
+            batch = ids[start : start + BATCH_SIZE]
+            existing = set(self.model._base_manager.filter(pk__in=batch).values_list("pk", flat=True))
+            bodies = self.build(existing) if existing else {}
+
+            SearchDocument.objects.bulk_create(
+                [
+                    SearchDocument(index_name=self.name, object_id=pk, body=body)
+                    for pk, body in bodies.items()
+                ],
+                update_conflicts=True,
+                unique_fields=upsert_conflict_fields("index_name", "object_id"),
+                update_fields=["body", "updated"],
+            )
+            gone = set(batch) - existing
+            if gone:
+                self.documents().filter(object_id__in=gone).delete()
+            refreshed += len(bodies)
+        return refreshed
+
+    def affected_ids(self, model, pks, lookups) -> list[int]:
+        if not pks:
+            return []
+        if "" in lookups:
+            return list(pks)
+        ids = set()
+        for lookup in lookups:
+            ids.update(
+                self.model._base_manager.filter(**{f"{lookup}__in": pks}).values_list("pk", flat=True)
+            )
+        return list(ids)
+
+    def filter(self, queryset, terms):
+        documents = get_backend().filter(self.documents(), terms)
+        return queryset.filter(pk__in=documents.values("object_id"))
+
+
+def indexes() -> dict[str, SearchIndex]:
+    return dict(_indexes)
+
+
+def get_index(name: str) -> SearchIndex:
+    return _indexes[name]
+
+
+def _lookups_by_index(model):
+    found = defaultdict(set)
+    for index, lookup in _dependents.get(model, ()):
+        found[index].add(lookup)
+    return found
+
+
+def related_changed(model, pks):
+    """
+    Refreshes the documents built from rows `pks` of `model`. For writes
+    that send no model signals (bulk_create, bulk_update, QuerySet.update()).
+    """
+    for index, lookups in _lookups_by_index(model).items():
+        index.refresh(index.affected_ids(model, list(pks), lookups))
+
+
+def _refresh_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    related_changed(sender, [instance.pk])
+
+
+def _collect_deleted(sender, instance, **kwargs):
+    # Relations may be gone (or set to NULL) after the delete.
+    setattr(
+        instance,
+        _AFFECTED_ATTR,
+        [
+            (index, index.affected_ids(sender, [instance.pk], lookups))
+            for index, lookups in _lookups_by_index(sender).items()
+        ],
+    )
+
+
+def _refresh_deleted(sender, instance, **kwargs):
+    for index, ids in getattr(instance, _AFFECTED_ATTR, ()):
+        index.refresh(ids)
+
+
+def register(name: str, model, fields) -> SearchIndex:
+    index = SearchIndex(name, model, fields)
+    _indexes[name] = index
+
+    _dependents[model].append((index, ""))
+    for related, lookups in index.dependencies().items():
+        for lookup in lookups:
+            _dependents[related].append((index, lookup))
+
+    for dependency in {model, *index.dependencies()}:
+        uid = f"search_index:{dependency._meta.label_lower}"
+        post_save.connect(_refresh_saved, sender=dependency, dispatch_uid=uid)
+        pre_delete.connect(_collect_deleted, sender=dependency, dispatch_uid=uid)
+        post_delete.connect(_refresh_deleted, sender=dependency, dispatch_uid=uid)
+    return index
@@ -0,0 +1,36 @@
+from django.test import TransactionTestCase
+
+from services.search.backends import get_backend
+from services.search.models.search_document import SearchDocument
+
+BODIES = [
+    "FC-0001\nBudi Santoso\nJalan Merdeka 10",
+    "FC-0002\nKonveksi Ani Jaya\nKaos Polo",
+    "FC-0003\nToko Indah\nKemeja Batik",
+    "FC-0004\nIs Ta An In\nA-10",
+]
+
+TERMS = ["santoso", "jalan", "an", "in", "is", "to", "ta", "ani jaya", "batik", "fc-000", "a", "polo kaos", "xyz"]
+
+
+# Not TestCase: InnoDB full-text indexes only see committed rows.
+class BackendParityTests(TransactionTestCase):
+    def setUp(self):
+        SearchDocument.objects.bulk_create(
+            SearchDocument(index_name="test", object_id=pk, body=body)
+            for pk, body in enumerate(BODIES, start=1)
+        )
+        self.documents = SearchDocument.objects.filter(index_name="test")
+
+    def test_matches_like_icontains(self):
+        backend = get_backend()
+        for term in TERMS:
+            with self.subTest(backend=type(backend).__name__, term=term):
+                expected = self.documents
+                for word in term.split():
+                    expected = expected.filter(body__icontains=word)
+                found = backend.filter(self.documents, [term])
+                self.assertEqual(
+                    set(found.values_list("object_id", flat=True)),
+                    set(expected.values_list("object_id", flat=True)),
+                )
@@ -13,9 +13,7 @@ from core.common.filter_date import apply_forecast_date_filter, apply_sewer_dist
 
 from core.common.viewsets import BaseViewSet
 from services.forecast.models.forecast import Forecast
-from services.forecast.models.stock_item import StockItem
 from services.forecast.rest.forecast.filtersets import ForecastFilterSet
-from services.order.models.order_form import OrderForm
 from services.sewer.models.sewer_distribution import SewerDistribution
 from services.sewer.rest.sewer_distribution.filtersets import SewerDistributionFilterSet
 from services.sewer.rest.sewer_distribution.serializers import (
@@ -23,16 +21,7 @@ from services.sewer.rest.sewer_distribution.serializers import (
     SewerDistributionSerializer,
 )
 
-from django.db.models import (
-    Case,
-    When,
-    F,
-    Value,
-    CharField,
-    OuterRef,
-    Subquery,
-)
-from django.db.models.functions import Concat
+from django.db.models import F
 
 if TYPE_CHECKING:
     pass
@@ -49,14 +38,6 @@ class SewerDistributionViewSet(BaseViewSet):
     """
 
     required_module_code = "pembagian-penjahit"
-    
-    stock_product = StockItem.objects.filter(
-        forecast=OuterRef("pk")
-    ).values("product__name")[:1]
-
-    order_form = OrderForm.objects.filter(
-        order=OuterRef("order")
-    )
 
     my_tags = ["Sewer Distribution"]
     queryset = (
@@ -64,31 +45,10 @@ class SewerDistributionViewSet(BaseViewSet):
             "sewer_distributions", "qc_finishings", "qc_finishing_defects"
         )
         .filter(sewer_distributions__isnull=False)
+        # 🚀 Searched on the flattened ForecastListRow columns
         .annotate(
-            convection_name=Case(
-                When(is_stock=True, then=Value("STOK JB")),
-                default=F("order_item__order__convection_name"),
-                output_field=CharField(),
-            ),
-            product_name=Case(
-                When(
-                    is_stock=True,
-                    then=Subquery(stock_product),
-                ),
-                When(
-                    order_item__isnull=False,
-                    then=F("order_item__product__name"),
-                ),
-                default=Concat(
-                    Subquery(order_form.values("marketplace")[:1]),
-                    Value(" "),
-                    # email_send_date formatting here is the problem
-                    Value("Sesi "),
-                    Subquery(order_form.values("session")[:1]),
-                    output_field=CharField(),
-                ),
-                output_field=CharField(),
-            ),
+            convection_name=F("list_row__convection_name"),
+            product_name=F("list_row__product_name"),
         )
         .distinct()
     )
@@ -105,6 +65,8 @@ class SewerDistributionViewSet(BaseViewSet):
         "convection_name",
         "product_name",
     ]
+    # 🚀 Indexed in services/sewer/search.py, no joins through distributions
+    search_index = "sewer_distribution"
 
     permission_map = {
         "list": ["sewer.view_sewer_distribution"],
@@ -124,27 +86,8 @@ class SewerDistributionViewSet(BaseViewSet):
         queryset = apply_forecast_date_filter(queryset, "date_forecast", self.request)
         queryset = apply_sewer_distribution_date_filter(queryset, "sewer_distributions__created", self.request)
 
-        # 🚀 PREVENT N+1: Fetch all related foreign keys in one go
-        queryset = queryset.select_related(
-            "order",
-            "order__customer",
-            "order_item",
-            "order_item__order",
-            "order_item__order__customer",
-            "order_item__product",
-            "order_item__product__printer",
-            "order_item__fabric_type",
-            "order_item__deposit",
-        )
-
-        # 🚀 PREVENT N+1: Fetch reverse relations (like StockItem and OrderForm)
-        # Note: Change "stock_items" and "order_forms" if you defined custom related_names on those models.
-        queryset = queryset.prefetch_related(
-            "stock_items__product__printer",
-            "stock_items__fabric_type",
-            "order__order_forms", 
-            "order__order_forms__printer", # <-- ADD THIS LINE
-        )
+        # 🚀 PREVENT N+1: Fetch every relation the serializer reads in one go
+        queryset = queryset.with_list_relations()
 
         return queryset
 
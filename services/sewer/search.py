@@ -0,0 +1,18 @@
+from services.forecast.models.forecast import Forecast
+from services.search.registry import register
+
+# SewerDistributionViewSet lists forecasts
+register(
+    "sewer_distribution",
+    Forecast,
+    [
+        "forecast_number",
+        "order__subid",
+        "order_item__subid",
+        "sewer_distributions__distributed_by__first_name",
+        "sewer_distributions__sewer__name",
+        "sewer_distributions__tracking_code",
+        "list_row__convection_name",
+        "list_row__product_name",
+    ],
+)
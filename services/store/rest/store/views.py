@@ -40,3 +40,4 @@ class StoreViewSet(BaseViewSet):
     serializer_map = {
         "autocomplete": StoreSerializer,
     }
+    cache_tags = ("store.store",)
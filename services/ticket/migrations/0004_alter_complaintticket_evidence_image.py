@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-17 23:52
+
+import core.common.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticket', '0003_complaintticket_order_type'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='complaintticket',
+            name='evidence_image',
+            field=models.ImageField(blank=True, null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='complaints/'),
+        ),
+    ]
@@ -9,6 +9,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from core.common.models import get_subid_model
+from core.common.storage import content_addressed_storage
 
 if TYPE_CHECKING:
     pass
@@ -92,6 +93,7 @@ class ComplaintTicket(get_subid_model()):
 
     evidence_image = models.ImageField(
         upload_to="complaints/",
+        storage=content_addressed_storage,
         null=True,
         blank=True,
     )
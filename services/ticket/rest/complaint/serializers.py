@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
-from core.common.serializers import BaseModelSerializer
+from core.common.serializers import BaseModelSerializer, ThumbnailField
 from services.account.rest.user.serializers import UserSerializerSimple
 from services.customer.models.customer import Customer
 from services.order.models.order import Order
@@ -66,6 +66,7 @@ class ComplaintTicketSerializer(BaseModelSerializer):
         required=True,
     )
     last_action = serializers.SerializerMethodField()
+    evidence_image_thumb = ThumbnailField(source="evidence_image")
 
     class Meta:
         model = ComplaintTicket
@@ -80,6 +81,7 @@ class ComplaintTicketSerializer(BaseModelSerializer):
             "customer_request",
             "status",
             "evidence_image",
+            "evidence_image_thumb",
             "last_action",
             "created",
             "updated",
@@ -7,6 +7,7 @@ from django.db.models import Q
 from rest_framework import serializers
 
 from services.forecast.models import Forecast
+from services.forecast.models.forecast import STAGE_STEPS
 from services.order.models import Order, OrderItem
 
 if TYPE_CHECKING:
@@ -77,6 +78,8 @@ class TrackingSerializer(serializers.Serializer):
                 Q(order_item__order=order)
             )
             .distinct()
+            # Every step in the same query
+            .select_related(*(relation for _, relation in STAGE_STEPS))
         )
 
         return {
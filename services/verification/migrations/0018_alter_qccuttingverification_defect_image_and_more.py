@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-17 23:52
+
+import core.common.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('verification', '0017_qcpressverification'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='qccuttingverification',
+            name='defect_image',
+            field=models.ImageField(blank=True, help_text='Upload foto bukti reject', null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='qc_cutting_defects/'),
+        ),
+        migrations.AlterField(
+            model_name='qclineverification',
+            name='defect_image',
+            field=models.ImageField(blank=True, help_text='Upload foto bukti reject', null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='qc_defects/'),
+        ),
+        migrations.AlterField(
+            model_name='qcpressverification',
+            name='defect_image',
+            field=models.ImageField(blank=True, help_text='Upload foto bukti reject', null=True, storage=core.common.storage.ContentAddressedStorage(), upload_to='qc_defects/'),
+        ),
+    ]
@@ -7,6 +7,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from core.common.models import get_subid_model
+from core.common.storage import content_addressed_storage
 from services.forecast.models.forecast import Forecast
 
 if TYPE_CHECKING:
@@ -96,6 +97,7 @@ class QCLineVerification(get_subid_model()):
     # "Opsi upload foto hasil yang reject"
     defect_image = models.ImageField(
         upload_to="qc_defects/",
+        storage=content_addressed_storage,
         blank=True,
         null=True,
         help_text="Upload foto bukti reject",
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from django.db import transaction
 from rest_framework import serializers
 
 from core.common.serializers import BaseModelSerializer
@@ -50,6 +51,7 @@ class BasePrintVerificationSerializer(BaseModelSerializer):
         data["verified_by"] = UserSerializerSimple(instance.verified_by).data
         return data
 
+    @transaction.atomic
     def create(self, validated_data):
         forecast = validated_data.pop("forecast")
 
@@ -65,8 +67,11 @@ class BasePrintVerificationSerializer(BaseModelSerializer):
             user=self.context["request"].user,
         )
 
+        forecast.refresh_stage()
+
         return verification
     
+    @transaction.atomic
     def update(self, instance, validated_data):
         instance = super().update(instance, validated_data)
 
@@ -77,6 +82,8 @@ class BasePrintVerificationSerializer(BaseModelSerializer):
             user=self.context["request"].user,
         )
 
+        instance.forecast.refresh_stage()
+
         return instance
 
 
@@ -3,9 +3,10 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from django.db import transaction
 from rest_framework import serializers
 
-from core.common.serializers import BaseModelSerializer
+from core.common.serializers import BaseModelSerializer, ThumbnailField
 from services.account.rest.user.serializers import UserSerializerSimple
 from services.defect.rest.reject.utils import sync_reject
 from services.forecast.models.forecast import Forecast
@@ -32,6 +33,7 @@ class BaseQCCuttingVerificationSerializer(BaseModelSerializer):
     )
 
     defect_area = serializers.ListField(child=serializers.CharField(), required=False)
+    defect_image_thumb = ThumbnailField(source="defect_image")
 
     class Meta:
         model = QCCuttingVerification
@@ -45,6 +47,7 @@ class BaseQCCuttingVerificationSerializer(BaseModelSerializer):
             "defect_area",
             "defect_note",
             "defect_image",
+            "defect_image_thumb",
             "error_from",
             "created",
             "updated",
@@ -70,6 +73,7 @@ class BaseQCCuttingVerificationSerializer(BaseModelSerializer):
 
         return data
 
+    @transaction.atomic
     def create(self, validated_data):
         forecast = validated_data.pop("forecast")
 
@@ -85,8 +89,11 @@ class BaseQCCuttingVerificationSerializer(BaseModelSerializer):
             user=self.context["request"].user,
         )
 
+        forecast.refresh_stage()
+
         return verification
     
+    @transaction.atomic
     def update(self, instance, validated_data):
         instance = super().update(instance, validated_data)
 
@@ -97,6 +104,8 @@ class BaseQCCuttingVerificationSerializer(BaseModelSerializer):
             user=self.context["request"].user,
         )
 
+        instance.forecast.refresh_stage()
+
         return instance
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from django.db import transaction
 from rest_framework import serializers
 
 from core.common.serializers import BaseModelSerializer
@@ -61,9 +62,12 @@ class BaseQCFinishingSerializer(BaseModelSerializer):
 
         return data
 
+    @transaction.atomic
     def create(self, validated_data):
         forecast = validated_data.pop("forecast")
-        return QCFinishing.objects.create(forecast=forecast, **validated_data)
+        qc_finishing = QCFinishing.objects.create(forecast=forecast, **validated_data)
+        forecast.refresh_stage()
+        return qc_finishing
 
 
 class QCFinishingSerializer(ForecastSerializer):
@@ -65,27 +65,8 @@ class QCFinishingViewSet(BaseViewSet):
         queryset = apply_forecast_date_filter(queryset, "date_forecast", self.request)
         queryset = apply_estimate_sent_date_filter(queryset, "estimate_sent", self.request)
 
-        # 🚀 PREVENT N+1: Fetch all related foreign keys in one go
-        queryset = queryset.select_related(
-            "order",
-            "order__customer",
-            "order_item",
-            "order_item__order",
-            "order_item__order__customer",
-            "order_item__product",
-            "order_item__product__printer",
-            "order_item__fabric_type",
-            "order_item__deposit",
-        )
-
-        # 🚀 PREVENT N+1: Fetch reverse relations (like StockItem and OrderForm)
-        # Note: Change "stock_items" and "order_forms" if you defined custom related_names on those models.
-        queryset = queryset.prefetch_related(
-            "stock_items__product__printer",
-            "stock_items__fabric_type",
-            "order__order_forms", 
-            "order__order_forms__printer", # <-- ADD THIS LINE
-        )
+        # 🚀 PREVENT N+1: Fetch every relation the serializer reads in one go
+        queryset = queryset.with_list_relations()
 
         return queryset
 
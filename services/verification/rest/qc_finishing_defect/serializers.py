@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from django.db import transaction
 from rest_framework import serializers
 
 from core.common.serializers import BaseModelSerializer
@@ -64,6 +65,7 @@ class BaseQCFinishingDefectSerializer(BaseModelSerializer):
 
         return data
 
+    @transaction.atomic
     def create(self, validated_data):
         forecast = validated_data.pop("forecast")
         verification = QCFinishingDefect.objects.create(
@@ -78,8 +80,11 @@ class BaseQCFinishingDefectSerializer(BaseModelSerializer):
             user=self.context["request"].user,
         )
 
+        forecast.refresh_stage()
+
         return verification
     
+    @transaction.atomic
     def update(self, instance, validated_data):
         instance = super().update(instance, validated_data)
 
@@ -90,6 +95,8 @@ class BaseQCFinishingDefectSerializer(BaseModelSerializer):
             user=self.context["request"].user,
         )
 
+        instance.forecast.refresh_stage()
+
         return instance
 
 
@@ -3,9 +3,10 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from django.db import transaction
 from rest_framework import serializers
 
-from core.common.serializers import BaseModelSerializer
+from core.common.serializers import BaseModelSerializer, ThumbnailField
 from services.account.rest.user.serializers import UserSerializerSimple
 from services.defect.rest.reject.utils import sync_reject
 from services.forecast.models.forecast import Forecast
@@ -30,6 +31,7 @@ class BaseQCLineVerificationSerializer(BaseModelSerializer):
     )
 
     defect_area = serializers.ListField(child=serializers.CharField(), required=False)
+    defect_image_thumb = ThumbnailField(source="defect_image")
 
     class Meta:
         model = QCLineVerification
@@ -43,6 +45,7 @@ class BaseQCLineVerificationSerializer(BaseModelSerializer):
             "defect_area",
             "defect_note",
             "defect_image",
+            "defect_image_thumb",
             "error_from",
             "created",
             "updated",
@@ -68,6 +71,7 @@ class BaseQCLineVerificationSerializer(BaseModelSerializer):
 
         return data
 
+    @transaction.atomic
     def create(self, validated_data):
         forecast = validated_data.pop("forecast")
 
@@ -83,8 +87,11 @@ class BaseQCLineVerificationSerializer(BaseModelSerializer):
             user=self.context["request"].user,
         )
 
+        forecast.refresh_stage()
+
         return verification
         
+    @transaction.atomic
     def update(self, instance, validated_data):
         instance = super().update(instance, validated_data)
 
@@ -95,6 +102,8 @@ class BaseQCLineVerificationSerializer(BaseModelSerializer):
             user=self.context["request"].user,
         )
 
+        instance.forecast.refresh_stage()
+
         return instance
 
 
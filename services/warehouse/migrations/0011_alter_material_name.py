@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('warehouse', '0010_warehousedelivery_production_code'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='material',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
@@ -51,7 +51,7 @@ class Material(get_subid_model()):
         PLASTIK = "PLASTIK", "Plastik"
 
     code = models.CharField(max_length=50, unique=True)  # Internal code
-    name = models.CharField(max_length=255)  # e.g., "Kain Cotton 30s"
+    name = models.CharField(max_length=255, db_index=True)  # e.g., "Kain Cotton 30s"
     category = models.CharField(max_length=50, choices=CategoryChoices.choices)
     description = models.TextField(
         blank=True, help_text="Specific details (e.g., jenis kain)"
@@ -9,5 +9,10 @@ router.register(r"materials", MaterialViewSet, basename="material")
 # --- End Router ---
 
 urlpatterns = [
+    path(
+        "materials/autocomplete/",
+        MaterialViewSet.as_view({"get": "autocomplete"}),
+        name="material-autocomplete",
+    ),
     path("", include(router.urls)),
 ]
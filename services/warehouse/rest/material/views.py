@@ -46,9 +46,10 @@ class MaterialViewSet(BaseViewSet):
         "warehouse.view_material",
     ]
     my_tags = ["Materials"]
-    serializer_map = {
-        "autocomplete": MaterialSerializer,
-    }
+    autocomplete_fields = ("code", "name")
+    # Only the code/name projection is cached; stock figures stay live.
+    cache_tags = ("warehouse.material",)
+    cache_actions = ("autocomplete",)
 
     @action(detail=True, methods=["get"], url_path="stock-card")
     def stock_card(self, request: Request, subid: str | None = None) -> Response:
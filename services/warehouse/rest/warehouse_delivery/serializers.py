@@ -4,6 +4,7 @@ from datetime import date
 import logging
 from typing import TYPE_CHECKING
 
+from django.db import transaction
 from rest_framework import serializers
 
 from core.common.serializers import BaseModelSerializer
@@ -70,16 +71,19 @@ class BaseWarehouseDeliverySerializer(BaseModelSerializer):
         receipt = WarehouseReceipt.objects.filter(forecast=obj.forecast).first()
         return receipt.note if receipt else None
 
+    @transaction.atomic
     def create(self, validated_data):
         forecast = validated_data.pop("forecast")
 
         production_date = validated_data.get("production_date", date.today())
         validated_data["production_code"] = generate_production_code(production_date)
 
-        return WarehouseDelivery.objects.create(
+        delivery = WarehouseDelivery.objects.create(
             forecast=forecast,
             **validated_data,
         )
+        forecast.refresh_stage()
+        return delivery
 
 
 class WarehouseDeliverySerializer(ForecastSerializer):
@@ -41,6 +41,8 @@ class WarehouseDeliveryViewSet(BaseViewSet):
         "warehouse_deliveries__delivered_by",
         "order",
         "printer",
+        # 🚀 Shared forecast fields, flattened
+        "list_row",
     ).prefetch_related(
         "order_item",
     )
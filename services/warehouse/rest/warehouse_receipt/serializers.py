@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from django.db import transaction
 from rest_framework import serializers
 
 from core.common.serializers import BaseModelSerializer
@@ -67,12 +68,15 @@ class BaseWarehouseReceiptSerializer(BaseModelSerializer):
         )
         return data
 
+    @transaction.atomic
     def create(self, validated_data):
         forecast = validated_data.pop("forecast")
-        return WarehouseReceipt.objects.create(
+        receipt = WarehouseReceipt.objects.create(
             forecast=forecast,
             **validated_data,
         )
+        forecast.refresh_stage()
+        return receipt
 
     def get_count_receive(self, obj):
         """
@@ -41,6 +41,8 @@ class WarehouseReceiptViewSet(BaseViewSet):
             "warehouse_receipts__received_by",
             "order",
             "printer",
+            # 🚀 Shared forecast fields, flattened
+            "list_row",
         )
         .prefetch_related(
             "order_item",